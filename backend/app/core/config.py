@@ -0,0 +1,90 @@
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# 외부 페이지 요청용 HTTP 클라이언트 설정
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "6"))
+
+# Selenium 헤드리스 브라우저 풀 설정
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_PAGES = int(os.getenv("BROWSER_MAX_PAGES", "50"))
+BROWSER_MAX_MEMORY_MB = int(os.getenv("BROWSER_MAX_MEMORY_MB", "1024"))
+BROWSER_CHECKOUT_TIMEOUT = float(os.getenv("BROWSER_CHECKOUT_TIMEOUT", "60"))
+BROWSER_PAGE_LOAD_TIMEOUT = float(os.getenv("BROWSER_PAGE_LOAD_TIMEOUT", "30"))
+
+# 페이지 다운로드 제한 (최대 본문 크기, 허용 Content-Type)
+FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(10 * 1024 * 1024)))
+FETCH_ALLOWED_CONTENT_TYPES = frozenset(
+    t.strip().lower() for t in os.getenv("FETCH_ALLOWED_CONTENT_TYPES", "text/html,application/xhtml+xml").split(",") if t.strip()
+)
+
+# HTML 파서 백엔드 (html.parser: BeautifulSoup 기본 파서, lxml: 네이티브 lxml 트리)
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "html.parser")
+
+# 도메인별 추출 규칙 파일 (JSON)
+EXTRACTION_RULES_PATH = os.getenv(
+    "EXTRACTION_RULES_PATH", os.path.join(os.path.dirname(__file__), "extraction_rules.json")
+)
+
+# HTTP → 브라우저 적응형 추출 단계 설정
+# (본문을 찾지 못하거나 본문이 FETCH_ESCALATION_MIN_TEXT_CHARS자 미만이면 브라우저로 재시도하고,
+#  도메인별 기록은 FETCH_TIER_HALF_LIFE초마다 절반으로 감쇠)
+# 브라우저(Chrome)를 띄울 수 있는 서버에서만 켜세요.
+ADAPTIVE_FETCH_ENABLED = os.getenv("ADAPTIVE_FETCH_ENABLED", "false").lower() == "true"
+FETCH_ESCALATION_MIN_TEXT_CHARS = int(os.getenv("FETCH_ESCALATION_MIN_TEXT_CHARS", "200"))
+FETCH_TIER_HALF_LIFE = float(os.getenv("FETCH_TIER_HALF_LIFE", str(6 * 60 * 60)))
+FETCH_TIER_MAX_DOMAINS = int(os.getenv("FETCH_TIER_MAX_DOMAINS", "10000"))
+# 브라우저 시작에 실패하면 이 시간(초) 동안 브라우저 단계를 건너뜀
+BROWSER_START_RETRY_INTERVAL = float(os.getenv("BROWSER_START_RETRY_INTERVAL", "600"))
+
+# URL 추출 결과 캐시 설정
+EXTRACTION_CACHE_TTL = float(os.getenv("EXTRACTION_CACHE_TTL", "600"))
+EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "512"))
+
+# LLM 변환 결과 캐시 설정
+CONVERSION_CACHE_ENABLED = os.getenv("CONVERSION_CACHE_ENABLED", "true").lower() == "true"
+CONVERSION_CACHE_PATH = os.getenv("CONVERSION_CACHE_PATH", "./conversion_cache.db")
+CONVERSION_CACHE_MAX_ENTRIES = int(os.getenv("CONVERSION_CACHE_MAX_ENTRIES", "20000"))
+CONVERSION_CACHE_MAX_AGE_DAYS = float(os.getenv("CONVERSION_CACHE_MAX_AGE_DAYS", "30"))
+
+# 기사 변환 모드 (split: 마크다운/키워드 2회 호출, combined: 1회 호출)
+CONVERSION_MODE = os.getenv("CONVERSION_MODE", "split")
+
+# 변환 CLI 디렉토리 처리 동시 실행 수
+CONVERTER_WORKERS = int(os.getenv("CONVERTER_WORKERS", "4"))
+
+# 변환 CLI 배치 모드 (Message Batches API) 설정
+MESSAGE_BATCH_MAX_REQUESTS = int(os.getenv("MESSAGE_BATCH_MAX_REQUESTS", "10000"))
+MESSAGE_BATCH_POLL_INTERVAL = float(os.getenv("MESSAGE_BATCH_POLL_INTERVAL", "30"))
+MESSAGE_BATCH_MAX_POLL_INTERVAL = float(os.getenv("MESSAGE_BATCH_MAX_POLL_INTERVAL", "600"))
+
+# 공유 기사 본문(article_blobs) zstd 압축 레벨 (1-22, 저장 시 한 번만 압축)
+ARTICLE_BLOB_COMPRESSION_LEVEL = int(os.getenv("ARTICLE_BLOB_COMPRESSION_LEVEL", "9"))
+
+# 콘텐츠 목록 페이지 크기 (기본값, 최대값)
+CONTENT_PAGE_SIZE = int(os.getenv("CONTENT_PAGE_SIZE", "20"))
+CONTENT_PAGE_MAX_SIZE = int(os.getenv("CONTENT_PAGE_MAX_SIZE", "100"))
+# 검색은 일치하는 최신 CONTENT_SEARCH_MAX_RESULTS개 안에서 관련도 순으로 정렬
+CONTENT_SEARCH_MAX_RESULTS = int(os.getenv("CONTENT_SEARCH_MAX_RESULTS", "500"))
+
+# 백그라운드 추출 작업 큐 설정
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "120"))
+JOB_RETRY_BACKOFF_SECONDS = int(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "30"))
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "4"))
+WORKER_POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", "1"))
+WORKER_STATS_INTERVAL = float(os.getenv("WORKER_STATS_INTERVAL", "60"))
+
+# 일괄 추출 설정
+BATCH_MAX_URLS = int(os.getenv("BATCH_MAX_URLS", "100"))
+BATCH_FETCH_CONCURRENCY = int(os.getenv("BATCH_FETCH_CONCURRENCY", "8"))
+BATCH_CONVERT_CONCURRENCY = int(os.getenv("BATCH_CONVERT_CONCURRENCY", "2"))
+# 성공한 결과를 모아 한 번에 저장하는 최대 행 수 (기본값은 한 요청의 결과를 한 번에 저장)
+BATCH_SAVE_SIZE = int(os.getenv("BATCH_SAVE_SIZE", "100"))
@@ -0,0 +1,190 @@
+"""
+스키마 마이그레이션
+
+Base.metadata.create_all은 없는 테이블만 만들고 기존 테이블에 인덱스나 컬럼을 추가하지
+못합니다. 기존 데이터베이스의 스키마 변경은 여기에 순서대로 등록하며, 적용된 이름은
+schema_migrations 테이블에 기록되어 한 번만 실행됩니다.
+
+새 데이터베이스는 create_all이 모델 정의대로 만들므로 각 마이그레이션은 이미 적용된
+상태에서도 안전해야 합니다 (IF NOT EXISTS 등).
+
+    python -m app.core.migrations           # 대기 중인 마이그레이션 적용
+    python -m app.core.migrations --list    # 적용 상태 확인
+"""
+from datetime import datetime
+from typing import Callable, List, Tuple
+import argparse
+import logging
+import time
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+logger = logging.getLogger(__name__)
+
+# 다른 프로세스의 마이그레이션이 끝나기를 기다리는 최대 시간 (초)
+MIGRATION_LOCK_TIMEOUT = 600
+
+# PostgreSQL advisory lock 키 (마이그레이션 전용)
+POSTGRES_LOCK_KEY = 0x6e6f6e67
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations", _metadata,
+    Column("name", String, primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _contents_user_created_index(conn: Connection) -> None:
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_contents_user_id_created_at ON contents (user_id, created_at)"
+    ))
+
+
+def _backfill_daily_activity(conn: Connection) -> None:
+    # 테이블은 create_all이 만들고, 기존 contents 집계만 채움
+    from ..services.activity import rebuild_daily_activity
+    rebuild_daily_activity(conn)
+
+
+def _contents_hashtags_column(conn: Connection) -> None:
+    if "hashtags" not in {column["name"] for column in inspect(conn).get_columns("contents")}:
+        conn.execute(text("ALTER TABLE contents ADD COLUMN hashtags VARCHAR"))
+
+
+def _backfill_content_metadata(conn: Connection, batch_size: int = 1000) -> None:
+    # 이전 버전은 title/description/word_count를 채우지 않았음
+    from ..models.models import Content
+    from ..services.pipeline import content_metadata
+
+    table = Content.__table__
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.original_content, table.c.converted_content)
+            .where(table.c.id > last_id, table.c.word_count.is_(None))
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        for row in rows:
+            values = content_metadata(row.original_content or {}, row.converted_content)
+            conn.execute(table.update().where(table.c.id == row.id).values(**values))
+        last_id = rows[-1].id
+
+
+def _contents_search_index(conn: Connection) -> None:
+    from ..services.content_search import create_search_index
+    create_search_index(conn)
+
+
+def _contents_article_blobs(conn: Connection) -> None:
+    # article_blobs 테이블은 create_all이 만들고, contents에 참조 컬럼을 추가한 뒤 본문을 옮김
+    from ..services.article_blobs import migrate_contents
+
+    if "blob_id" not in {column["name"] for column in inspect(conn).get_columns("contents")}:
+        conn.execute(text("ALTER TABLE contents ADD COLUMN blob_id INTEGER REFERENCES article_blobs (id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_contents_blob_id ON contents (blob_id)"))
+    migrate_contents(conn)
+
+
+# (이름, 적용 함수) - 이름은 한 번 배포되면 바꾸지 않고, 새 항목은 항상 끝에 추가
+MIGRATIONS: List[Tuple[str, Callable[[Connection], None]]] = [
+    ("0001_contents_user_id_created_at_index", _contents_user_created_index),
+    ("0002_backfill_user_daily_activity", _backfill_daily_activity),
+    ("0003_contents_hashtags_column", _contents_hashtags_column),
+    ("0004_backfill_content_metadata", _backfill_content_metadata),
+    ("0005_contents_search_index", _contents_search_index),
+    ("0006_contents_article_blobs", _contents_article_blobs),
+]
+
+
+def applied_migrations(engine: Engine) -> List[str]:
+    _metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        return [row.name for row in conn.execute(schema_migrations.select())]
+
+
+def _lock(conn: Connection) -> None:
+    """트랜잭션이 끝날 때까지 다른 프로세스가 마이그레이션을 적용하지 못하도록 잠금"""
+    if conn.dialect.name == 'postgresql':
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': POSTGRES_LOCK_KEY})
+    elif conn.dialect.name == 'sqlite':
+        # 첫 쓰기까지 미루지 않고 바로 쓰기 잠금을 잡음 (이미 잠겨 있으면 busy timeout 뒤 OperationalError)
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _apply(engine: Engine, name: str, migrate: Callable[[Connection], None]) -> bool:
+    """
+    잠금을 잡은 트랜잭션에서 아직 기록되지 않은 마이그레이션 하나를 적용
+
+    Returns:
+        이번에 적용했으면 True, 다른 프로세스가 먼저 적용했으면 False
+    """
+    deadline = time.monotonic() + MIGRATION_LOCK_TIMEOUT
+    while True:
+        try:
+            with engine.begin() as conn:
+                _lock(conn)
+                if conn.execute(select(schema_migrations.c.name).where(schema_migrations.c.name == name)).first():
+                    return False
+                conn.execute(schema_migrations.insert().values(name=name, applied_at=datetime.utcnow()))
+                migrate(conn)
+            return True
+        except IntegrityError:
+            # 잠금이 없는 데이터베이스에서 다른 프로세스가 먼저 적용함
+            return False
+        except OperationalError as e:
+            # SQLite: 다른 프로세스가 마이그레이션 중이면 잠금이 풀릴 때까지 대기
+            if 'database is locked' not in str(e.orig) or time.monotonic() >= deadline:
+                raise
+            logger.info(f"다른 프로세스의 마이그레이션을 기다리는 중: {name}")
+            time.sleep(1)
+
+
+def run_migrations(engine: Engine) -> List[str]:
+    """
+    대기 중인 마이그레이션을 순서대로 적용
+
+    마이그레이션마다 잠금을 잡은 트랜잭션에서 적용 여부를 다시 확인한 뒤 기록 행과 함께
+    실행하므로, 여러 프로세스가 동시에 시작해도 한 프로세스만 적용하고 나머지는 기다렸다가
+    건너뜁니다 (SQLite는 BEGIN IMMEDIATE, PostgreSQL은 advisory lock).
+
+    Returns:
+        이번에 적용한 마이그레이션 이름 목록
+    """
+    done = set(applied_migrations(engine))
+    applied = []
+    for name, migrate in MIGRATIONS:
+        if name in done or not _apply(engine, name, migrate):
+            continue
+        logger.info(f"마이그레이션 적용됨: {name}")
+        applied.append(name)
+    return applied
+
+
+def main() -> None:
+    from .database import engine
+    from ..models.models import Base
+
+    parser = argparse.ArgumentParser(description="NONGBUX schema migrations")
+    parser.add_argument("--list", action="store_true", help="적용 상태만 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.list:
+        done = set(applied_migrations(engine))
+        for name, _ in MIGRATIONS:
+            print(f"{'applied' if name in done else 'pending':<8} {name}")
+        return
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    print(f"{len(applied)} migration(s) applied")
+
+
+if __name__ == "__main__":
+    main()
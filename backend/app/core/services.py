@@ -0,0 +1,41 @@
+from typing import Optional
+
+from ..services.browser_pool import close_browser_pool
+from ..services.extractor import WebExtractor
+from ..services.http_client import close_http_client
+from ..services.converter import NewsConverter
+
+# 앱 시작 시 한 번 생성되어 모든 요청이 공유하는 서비스 인스턴스
+_extractor: Optional[WebExtractor] = None
+_converter: Optional[NewsConverter] = None
+
+def init_services() -> None:
+    """Create process-lifetime service instances."""
+    global _extractor, _converter
+    if _extractor is None:
+        _extractor = WebExtractor(save_to_file=False)
+    if _converter is None:
+        _converter = NewsConverter()
+
+async def shutdown_services() -> None:
+    """Release resources held by service instances."""
+    global _extractor, _converter
+    if _extractor is not None:
+        _extractor.close()
+        _extractor = None
+    if _converter is not None:
+        await _converter.aclose()
+        _converter = None
+    close_browser_pool()
+    await close_http_client()
+
+# Dependencies
+def get_extractor() -> WebExtractor:
+    if _extractor is None:
+        init_services()
+    return _extractor
+
+def get_converter() -> NewsConverter:
+    if _converter is None:
+        init_services()
+    return _converter
@@ -4,14 +4,17 @@ from dotenv import load_dotenv
 import os
 
 from .core.database import engine
+from .core.migrations import run_migrations
 from .models.models import Base
+from .core.services import init_services, shutdown_services
 from .routers import auth, content, settings, users
 
 # Load environment variables
 load_dotenv()
 
-# Create database tables
+# Create database tables and apply schema migrations to existing ones
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 
 app = FastAPI(
     title="NONGBUX API",
@@ -34,6 +37,14 @@ app.include_router(content.router, prefix="/api/content", tags=["content"])
 app.include_router(settings.router, prefix="/api/settings", tags=["settings"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 
+@app.on_event("startup")
+async def startup_event():
+    init_services()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await shutdown_services()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to NONGBUX API"}
@@ -1,8 +1,14 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime, JSON, Text
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import (
+    Boolean, Column, Date, ForeignKey, Index, Integer, LargeBinary, String, DateTime, JSON, Text, event, select
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, relationship, deferred
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
 
 from ..core.database import Base
+from ..services.article_blobs import ArticleBody, decompress_text, join_extracted_data, split_extracted_data
 
 class User(Base):
     __tablename__ = "users"
@@ -40,19 +46,173 @@ class User(Base):
     
     contents = relationship("Content", back_populates="owner")
 
+class ArticleBlob(Base):
+    __tablename__ = "article_blobs"
+
+    # 여러 Content가 공유하는 추출 본문 (services/article_blobs 참고)
+    id = Column(Integer, primary_key=True)
+    body_hash = Column(String(64), unique=True, nullable=False)
+    text_zstd = Column(LargeBinary, nullable=False)  # zstd 압축한 UTF-8 본문
+    paragraph_spans = Column(JSON, nullable=False)  # 문단별 본문 내 [시작, 끝) 문자 위치
+    text_size = Column(Integer, nullable=False)  # 압축 전 바이트 수
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    @property
+    def body(self) -> ArticleBody:
+        return ArticleBody(decompress_text(self.text_zstd), self.paragraph_spans)
+
 class Content(Base):
     __tablename__ = "contents"
 
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String)
-    original_content = Column(JSON)
-    converted_content = Column(String)
+    # 큰 컬럼은 접근하거나 undefer()로 요청할 때만 로드 (목록 조회에서는 읽지 않음)
+    # original_content는 본문을 뺀 추출 결과이며 본문은 blob에 있음 (extracted_data로 합쳐서 읽음)
+    original_content = deferred(Column(JSON), group="body")
+    converted_content = deferred(Column(String), group="body")
     created_at = Column(DateTime, default=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"))
+    blob_id = Column(Integer, ForeignKey("article_blobs.id"), nullable=True, index=True)
     
     # 콘텐츠 메타데이터
     title = Column(String, nullable=True)
     description = Column(String, nullable=True)
     word_count = Column(Integer, nullable=True)
+    hashtags = Column(String, nullable=True)  # 변환 결과의 해시태그 (공백 구분)
     
     owner = relationship("User", back_populates="contents")
+    blob = relationship("ArticleBlob")
+    
+    # 사용자별 목록/통계 조회용 (기존 DB에는 migrations 0001로 추가)
+    __table_args__ = (
+        Index("ix_contents_user_id_created_at", "user_id", "created_at"),
+    )
+    
+    # 플러시 전까지 article_blobs에 저장할 본문 (매핑되지 않는 속성)
+    _article_body = None
+    
+    def set_extracted_data(self, extracted_data: Dict[str, Any]) -> None:
+        """추출 결과 저장 - 본문은 플러시할 때 article_blobs에 넣고 blob_id로 참조"""
+        self.original_content, self._article_body = split_extracted_data(extracted_data)
+    
+    @property
+    def extracted_data(self) -> Optional[Dict[str, Any]]:
+        """original_content와 공유 본문을 합친 원래 추출 결과 (본문을 옮기기 전 행은 그대로)"""
+        body = self._article_body
+        if body is None and self.blob_id is not None:
+            body = self.blob.body
+        if body is None:
+            return self.original_content
+        return join_extracted_data(self.original_content, body)
+
+class UserDailyActivity(Base):
+    __tablename__ = "user_daily_activity"
+
+    # 사용자별 일(UTC)별 콘텐츠 추출 수 (Content 추가/삭제와 같은 트랜잭션에서 갱신)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    extractions = Column(Integer, nullable=False, default=0)
+
+def add_daily_activity(connection, deltas: Dict[Tuple[int, date], int]) -> None:
+    """(user_id, day)별 증감을 user_daily_activity에 반영 (없는 행은 생성)"""
+    table = UserDailyActivity.__table__
+    rows = [{"user_id": user_id, "day": day, "extractions": delta}
+            for (user_id, day), delta in deltas.items() if delta]
+    if not rows:
+        return
+    
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        connection.execute(insert.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.day],
+            set_={"extractions": table.c.extractions + insert.excluded.extractions}
+        ), rows)
+        return
+    
+    for row in rows:
+        updated = connection.execute(
+            table.update()
+            .where(table.c.user_id == row["user_id"], table.c.day == row["day"])
+            .values(extractions=table.c.extractions + row["extractions"])
+        )
+        if not updated.rowcount:
+            connection.execute(table.insert().values(**row))
+
+def store_article_blobs(connection, bodies: Dict[str, ArticleBody]) -> Dict[str, int]:
+    """본문 해시별 article_blobs 행 id (없는 본문만 압축해서 추가)"""
+    table = ArticleBlob.__table__
+    
+    def existing(hashes):
+        return dict(connection.execute(
+            select(table.c.body_hash, table.c.id).where(table.c.body_hash.in_(hashes))
+        ).all())
+    
+    ids = existing(list(bodies)) if bodies else {}
+    missing = [body_hash for body_hash in bodies if body_hash not in ids]
+    if not missing:
+        return ids
+    
+    rows = [{"body_hash": body_hash, "text_zstd": bodies[body_hash].compress(),
+             "paragraph_spans": bodies[body_hash].paragraph_spans,
+             "text_size": len(bodies[body_hash].text.encode("utf-8"))}
+            for body_hash in missing]
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        # 다른 트랜잭션이 같은 본문을 먼저 넣었으면 그 행을 사용
+        insert = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        connection.execute(insert.on_conflict_do_nothing(index_elements=[table.c.body_hash]), rows)
+    else:
+        connection.execute(table.insert(), rows)
+    ids.update(existing(missing))
+    return ids
+
+@event.listens_for(Session, "before_flush")
+def _store_article_bodies(session, flush_context, instances) -> None:
+    """새 Content의 본문을 article_blobs에 저장하고 blob_id 설정 (같은 트랜잭션)"""
+    pending = [obj for obj in session.new
+               if isinstance(obj, Content) and obj._article_body is not None and obj.blob_id is None]
+    if not pending:
+        return
+    ids = store_article_blobs(session.connection(), {obj._article_body.body_hash: obj._article_body for obj in pending})
+    for obj in pending:
+        obj.blob_id = ids[obj._article_body.body_hash]
+
+@event.listens_for(Session, "before_flush")
+def _track_daily_activity(session, flush_context, instances) -> None:
+    """플러시될 Content 추가/삭제를 일별 집계에 반영 (같은 트랜잭션)"""
+    deltas: Dict[Tuple[int, date], int] = defaultdict(int)
+    for obj in session.new:
+        if isinstance(obj, Content) and obj.user_id is not None:
+            if obj.created_at is None:
+                obj.created_at = datetime.utcnow()
+            deltas[(obj.user_id, obj.created_at.date())] += 1
+    for obj in session.deleted:
+        if isinstance(obj, Content) and obj.user_id is not None and obj.created_at is not None:
+            deltas[(obj.user_id, obj.created_at.date())] -= 1
+    if deltas:
+        add_daily_activity(session.connection(), deltas)
+
+class ExtractionJob(Base):
+    __tablename__ = "extraction_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    url = Column(String)
+    mode = Column(String, nullable=True)
+    
+    # 작업 상태: queued, running, succeeded, failed
+    status = Column(String, default="queued", index=True)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    run_after = Column(DateTime, default=datetime.utcnow)  # 재시도 대기
+    
+    # 워커 임대 (만료되면 다른 워커가 다시 가져감)
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    
+    error = Column(Text, nullable=True)
+    content_id = Column(Integer, ForeignKey("contents.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -7,7 +7,7 @@ import hashlib
 
 from ..core.database import get_db
 from ..core.auth import authenticate_user, create_access_token, get_password_hash, get_user_by_email, get_current_active_user, verify_password
-from ..models.models import User
+from ..models.models import User, UserDailyActivity
 from ..schemas.schemas import (
     Token, UserCreate, User as UserSchema, UserProfile, UserUpdate,
     PasswordChange, PasswordResetRequest, PasswordReset,
@@ -279,6 +279,7 @@ async def delete_account(
 ):
     """Delete user account."""
     # 사용자의 모든 콘텐츠도 함께 삭제
+    db.query(UserDailyActivity).filter(UserDailyActivity.user_id == current_user.id).delete()
     db.query(User).filter(User.id == current_user.id).delete()
     db.commit()
     
@@ -1,56 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload, load_only, undefer_group
+from typing import Any, Dict, List, Optional, Union
+import asyncio
+import json
 
-from ..core.database import get_db
+from ..core.config import (
+    BATCH_FETCH_CONCURRENCY, BATCH_CONVERT_CONCURRENCY, BATCH_SAVE_SIZE, CONTENT_PAGE_SIZE, CONTENT_PAGE_MAX_SIZE,
+    CONTENT_SEARCH_MAX_RESULTS
+)
+from ..core.database import get_db, SessionLocal
 from ..core.auth import get_current_active_user
-from ..core.security import decrypt_api_key
-from ..models.models import User, Content
-from ..schemas.schemas import ExtractRequest, ExtractResponse, Content as ContentSchema
+from ..core.services import get_extractor, get_converter
+from ..models.models import User, Content, ExtractionJob
+from ..schemas.schemas import (
+    ExtractRequest, ExtractResponse, BatchExtractRequest, ExtractJob, JobQueueStats,
+    ExtractionRuleRegistryStats, ContentPage, ContentSummary, ContentSearchPage, ContentSearchHit,
+    Content as ContentSchema
+)
 from ..services.extractor import WebExtractor
+from ..services.content_search import query_terms, search_contents
 from ..services.converter import NewsConverter
+from ..services.jobs import enqueue_job, queue_stats
+from ..services.pagination import before_cursor, encode_cursor
+from ..services.pipeline import resolve_api_key, conversion_input, build_content, save_content
 
 router = APIRouter()
 
-@router.post("/extract", response_model=ExtractResponse)
+def get_user_api_key(user: User) -> str:
+    """Return the user's decrypted Claude API key or raise 400."""
+    try:
+        return resolve_api_key(user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/extract", response_model=Union[ExtractResponse, ExtractJob])
 async def extract_content(
     request: ExtractRequest,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    extractor: WebExtractor = Depends(get_extractor),
+    converter: NewsConverter = Depends(get_converter)
 ):
-    """Extract and convert content from URL."""
+    """Extract and convert content from URL.
+
+    With background=true the request is queued for `python -m app.worker`
+    and the job is returned immediately (202); poll GET /jobs/{id}.
+    """
     try:
-        # 사용자의 API 키 확인
-        if not current_user.anthropic_api_key or not current_user.api_key_active:
-            raise HTTPException(
-                status_code=400, 
-                detail="Claude API 키가 설정되지 않았거나 비활성화되어 있습니다. 설정 페이지에서 API 키를 등록해주세요."
-            )
+        user_api_key = get_user_api_key(current_user)
         
-        # API 키 복호화
-        try:
-            user_api_key = decrypt_api_key(current_user.anthropic_api_key)
-        except Exception:
-            raise HTTPException(
-                status_code=400,
-                detail="API 키 복호화에 실패했습니다. 설정 페이지에서 API 키를 다시 등록해주세요."
-            )
+        if request.background:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return ExtractJob.model_validate(enqueue_job(db, current_user.id, request.url, request.mode))
         
         # Extract content using WebExtractor
-        extractor = WebExtractor(use_selenium=False, save_to_file=False)
-        extracted_data = extractor.extract_data(request.url)
+        extracted_data = await extractor.extract_data_async(request.url)
         
         if not extracted_data['success']:
             raise HTTPException(status_code=400, detail=extracted_data['error'])
         
         # Convert content using NewsConverter with user's API key
         try:
-            converter = NewsConverter(api_key=user_api_key)
-            converted_content = converter.convert_to_markdown({
-                'title': extracted_data['title'],
-                'description': extracted_data.get('metadata', {}).get('description', ''),
-                'content': extracted_data['content']['text']
-            })
+            converted_content = await converter.convert_to_markdown_async(
+                conversion_input(extracted_data), api_key=user_api_key, mode=request.mode
+            )
         except ValueError as e:
             raise HTTPException(
                 status_code=400,
@@ -63,15 +78,7 @@ async def extract_content(
             )
         
         # Save to database
-        db_content = Content(
-            url=request.url,
-            original_content=extracted_data,
-            converted_content=converted_content,
-            user_id=current_user.id
-        )
-        db.add(db_content)
-        db.commit()
-        db.refresh(db_content)
+        db_content = save_content(db, request.url, extracted_data, converted_content, current_user.id)
         
         return ExtractResponse(
             success=True,
@@ -85,14 +92,286 @@ async def extract_content(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=List[ContentSchema])
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@router.post("/extract/stream")
+async def extract_content_stream(
+    request: ExtractRequest,
+    current_user: User = Depends(get_current_active_user),
+    extractor: WebExtractor = Depends(get_extractor),
+    converter: NewsConverter = Depends(get_converter)
+):
+    """Extract and convert content from URL, streaming progress as Server-Sent Events.
+
+    Events: extracted -> markdown (token deltas) -> keywords -> done, or error.
+    If the client disconnects, the upstream Claude stream is cancelled.
+    background=true is rejected; queue jobs with POST /extract instead.
+    """
+    if request.background:
+        raise HTTPException(
+            status_code=400,
+            detail="스트리밍 추출은 백그라운드 작업을 지원하지 않습니다. POST /api/content/extract를 사용해주세요."
+        )
+    user_api_key = get_user_api_key(current_user)
+    user_id = current_user.id
+
+    async def event_stream():
+        extracted_data = await extractor.extract_data_async(request.url)
+        if not extracted_data['success']:
+            yield sse_event('error', {'detail': extracted_data['error']})
+            return
+        
+        yield sse_event('extracted', {
+            'url': extracted_data['url'],
+            'title': extracted_data['title'],
+            'metadata': extracted_data['metadata'],
+            'author': extracted_data['author'],
+            'publish_date': extracted_data['publish_date']
+        })
+        
+        converted_content = None
+        conversion = converter.convert_stream_async(
+            conversion_input(extracted_data), api_key=user_api_key, mode=request.mode
+        )
+        try:
+            async for event, text in conversion:
+                if event == 'markdown_delta':
+                    yield sse_event('markdown', {'delta': text})
+                elif event == 'keywords':
+                    yield sse_event('keywords', {'keywords': text})
+                elif event == 'converted':
+                    converted_content = text
+        except ValueError as e:
+            yield sse_event('error', {'detail': f"API 키 오류: {str(e)}"})
+            return
+        except Exception as e:
+            yield sse_event('error', {'detail': f"콘텐츠 변환 중 오류가 발생했습니다: {str(e)}"})
+            return
+        finally:
+            await conversion.aclose()
+        
+        # 요청 스코프의 세션은 스트리밍 전에 닫히므로 별도 세션 사용
+        db = SessionLocal()
+        try:
+            db_content = save_content(db, request.url, extracted_data, converted_content, user_id)
+            content_id = db_content.id
+        except Exception as e:
+            yield sse_event('error', {'detail': str(e)})
+            return
+        finally:
+            db.close()
+        
+        yield sse_event('done', {'content_id': content_id, 'converted_content': converted_content})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/extract-batch")
+async def extract_batch(
+    request: BatchExtractRequest,
+    current_user: User = Depends(get_current_active_user),
+    extractor: WebExtractor = Depends(get_extractor),
+    converter: NewsConverter = Depends(get_converter)
+):
+    """Extract and convert many URLs, streaming per-URL results as NDJSON.
+
+    Fetch/parse runs up to BATCH_FETCH_CONCURRENCY URLs at once and Claude
+    conversions up to BATCH_CONVERT_CONCURRENCY. One line is emitted per URL
+    as it finishes. Successful rows are buffered and written with one bulk
+    insert per BATCH_SAVE_SIZE rows (by default one for the whole request);
+    the buffer is also written if the client disconnects, so finished
+    conversions are not lost. A final "done" line maps URL indexes to the
+    saved content ids.
+    """
+    user_api_key = get_user_api_key(current_user)
+    user_id = current_user.id
+    fetch_slots = asyncio.Semaphore(BATCH_FETCH_CONCURRENCY)
+    convert_slots = asyncio.Semaphore(BATCH_CONVERT_CONCURRENCY)
+
+    def save_rows(results: List[Dict[str, Any]]) -> Dict[int, int]:
+        rows = [
+            build_content(r['url'], r['extracted_data'], r['converted_content'], user_id)
+            for r in results
+        ]
+        db = SessionLocal()
+        try:
+            db.add_all(rows)
+            db.flush()
+            content_ids = {r['index']: row.id for r, row in zip(results, rows)}
+            db.commit()
+            return content_ids
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def process(index: int, url: str) -> Dict[str, Any]:
+        async with fetch_slots:
+            extracted_data = await extractor.extract_data_async(url)
+        if not extracted_data['success']:
+            return {'index': index, 'url': url, 'error': extracted_data['error']}
+        
+        try:
+            async with convert_slots:
+                converted_content = await converter.convert_to_markdown_async(
+                    conversion_input(extracted_data), api_key=user_api_key, mode=request.mode
+                )
+        except ValueError as e:
+            return {'index': index, 'url': url, 'error': f"API 키 오류: {str(e)}"}
+        except Exception as e:
+            return {'index': index, 'url': url, 'error': f"콘텐츠 변환 중 오류가 발생했습니다: {str(e)}"}
+        return {'index': index, 'url': url, 'extracted_data': extracted_data, 'converted_content': converted_content}
+
+    async def result_stream():
+        tasks = [asyncio.create_task(process(i, url)) for i, url in enumerate(request.urls)]
+        pending = []
+        seen = set()
+        content_ids = {}
+        save_errors = []
+        failed = 0
+
+        async def flush():
+            batch = pending[:]
+            pending.clear()
+            try:
+                # 연결이 끊겨 스트림이 취소되어도 저장은 끝까지 실행
+                content_ids.update(await asyncio.shield(asyncio.to_thread(save_rows, batch)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                save_errors.append(({r['index'] for r in batch}, f"저장 중 오류가 발생했습니다: {str(e)}"))
+
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                seen.add(result['index'])
+                if 'error' in result:
+                    failed += 1
+                    line = {'type': 'error', **result}
+                else:
+                    pending.append(result)
+                    line = {
+                        'type': 'result',
+                        'index': result['index'],
+                        'url': result['url'],
+                        'title': result['extracted_data']['title'],
+                        'converted_content': result['converted_content']
+                    }
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+                if len(pending) >= BATCH_SAVE_SIZE:
+                    await flush()
+        finally:
+            # 클라이언트가 연결을 끊으면 이미 끝난 변환까지 저장하고 남은 작업 취소
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    result = task.result()
+                    if result['index'] not in seen and 'error' not in result:
+                        pending.append(result)
+            if pending:
+                await flush()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for indexes, message in save_errors:
+            failed += len(indexes)
+            yield json.dumps({'type': 'error', 'indexes': sorted(indexes), 'error': message}, ensure_ascii=False) + "\n"
+        yield json.dumps({
+            'type': 'done',
+            'succeeded': len(content_ids),
+            'failed': failed,
+            'content_ids': content_ids
+        }, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
+
+@router.get("/extraction-rules/stats", response_model=ExtractionRuleRegistryStats)
+async def get_extraction_rule_stats(
+    current_user: User = Depends(get_current_active_user),
+    extractor: WebExtractor = Depends(get_extractor)
+):
+    """Get per-domain extraction rule hit rates for this process."""
+    return extractor.rules.stats()
+
+@router.get("/jobs/stats", response_model=JobQueueStats)
+async def get_job_queue_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get queue depth and latency statistics for the current user's extraction jobs."""
+    return queue_stats(db, user_id=current_user.id)
+
+@router.get("/jobs/{job_id}", response_model=ExtractJob)
+async def get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get status of a background extraction job."""
+    job = db.query(ExtractionJob).filter(
+        ExtractionJob.id == job_id,
+        ExtractionJob.user_id == current_user.id
+    ).first()
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return job
+
+@router.get("/", response_model=ContentPage)
 async def get_user_contents(
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    limit: int = Query(CONTENT_PAGE_SIZE, ge=1, le=CONTENT_PAGE_MAX_SIZE),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get all contents for current user."""
-    contents = db.query(Content).filter(Content.user_id == current_user.id).all()
-    return contents
+    """List the current user's contents, newest first.
+
+    Returns summaries only; fetch the full extracted and converted
+    content with GET /{content_id}. Pass next_cursor back as cursor to
+    get the following page.
+    """
+    query = db.query(Content).options(
+        load_only(Content.id, Content.url, Content.title, Content.created_at, Content.word_count)
+    ).filter(Content.user_id == current_user.id)
+    if cursor:
+        try:
+            query = query.filter(before_cursor(Content.created_at, Content.id, cursor))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    rows = query.order_by(Content.created_at.desc(), Content.id.desc()).limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if len(rows) > limit else None
+    return ContentPage(items=[ContentSummary.model_validate(row) for row in items], next_cursor=next_cursor)
+
+@router.get("/search", response_model=ContentSearchPage)
+async def search_user_contents(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백으로 구분한 단어 모두 포함)"),
+    limit: int = Query(CONTENT_PAGE_SIZE, ge=1, le=CONTENT_PAGE_MAX_SIZE),
+    offset: int = Query(0, ge=0, lt=CONTENT_SEARCH_MAX_RESULTS),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Full-text search over the current user's contents, best match first.
+
+    Matches every word of q as a prefix against the title, converted
+    markdown and hashtags, and ranks the newest CONTENT_SEARCH_MAX_RESULTS
+    matches. Pass next_offset back as offset to get the following page.
+    """
+    if not query_terms(q):
+        raise HTTPException(status_code=400, detail="검색어를 입력해주세요.")
+    
+    rows = search_contents(db, current_user.id, q, limit + 1, offset)
+    items = rows[:limit]
+    next_offset = offset + limit if len(rows) > limit else None
+    return ContentSearchPage(items=[ContentSearchHit.model_validate(row) for row in items], next_offset=next_offset)
 
 @router.get("/{content_id}", response_model=ContentSchema)
 async def get_content(
@@ -101,7 +380,7 @@ async def get_content(
     current_user: User = Depends(get_current_active_user)
 ):
     """Get specific content by ID."""
-    content = db.query(Content).filter(
+    content = db.query(Content).options(undefer_group("body"), joinedload(Content.blob)).filter(
         Content.id == content_id,
         Content.user_id == current_user.id
     ).first()
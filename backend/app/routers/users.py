@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session, load_only
 from typing import List, Optional
 from datetime import datetime, timedelta
 
 from ..core.database import get_db
 from ..core.auth import get_current_active_user
-from ..models.models import User, Content
+from ..models.models import User, Content, UserDailyActivity
 from ..schemas.schemas import UserProfile, UserStats
 
 router = APIRouter()
@@ -23,31 +24,23 @@ async def get_user_stats(
     db: Session = Depends(get_db)
 ):
     """Get user's usage statistics."""
-    # 최근 30일 콘텐츠 추출 횟수
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    recent_extractions = db.query(Content).filter(
-        Content.user_id == current_user.id,
-        Content.created_at >= thirty_days_ago
-    ).count()
-    
-    # 총 콘텐츠 수
-    total_contents = db.query(Content).filter(
-        Content.user_id == current_user.id
-    ).count()
-    
-    # 이번 주 추출 횟수
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    week_extractions = db.query(Content).filter(
-        Content.user_id == current_user.id,
-        Content.created_at >= week_ago
-    ).count()
+    now = datetime.utcnow()
+    thirty_days_ago = now - timedelta(days=30)
+    week_ago = now - timedelta(days=7)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     
-    # 오늘 추출 횟수
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    today_extractions = db.query(Content).filter(
+    # 한 번의 쿼리로 집계: 30일/7일/오늘은 (user_id, created_at) 인덱스의 최근 30일 범위에서
+    # 조건부 집계로, 총 개수는 같은 인덱스의 스칼라 서브쿼리로 계산
+    total = select(func.count()).where(Content.user_id == current_user.id).correlate(None).scalar_subquery()
+    total_contents, recent_extractions, week_extractions, today_extractions = db.query(
+        total,
+        func.count(),
+        func.count(case((Content.created_at >= week_ago, 1))),
+        func.count(case((Content.created_at >= today, 1)))
+    ).filter(
         Content.user_id == current_user.id,
-        Content.created_at >= today
-    ).count()
+        Content.created_at >= thirty_days_ago
+    ).one()
     
     return {
         "user_id": current_user.id,
@@ -70,24 +63,27 @@ async def get_user_activity(
     db: Session = Depends(get_db)
 ):
     """Get user's activity history."""
-    start_date = datetime.utcnow() - timedelta(days=days)
+    # 기간은 일(UTC) 단위: days일 전 자정부터
+    start_date = (datetime.utcnow() - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
     
-    contents = db.query(Content).filter(
+    # 일별 집계 테이블에서 최대 days+1개 행만 읽음
+    activity = db.query(UserDailyActivity.day, UserDailyActivity.extractions).filter(
+        UserDailyActivity.user_id == current_user.id,
+        UserDailyActivity.day >= start_date.date(),
+        UserDailyActivity.extractions > 0
+    ).order_by(UserDailyActivity.day.desc()).all()
+    daily_activity = {day.isoformat(): extractions for day, extractions in activity}
+    
+    recent_contents = db.query(Content).options(
+        load_only(Content.id, Content.url, Content.title, Content.created_at, Content.word_count)
+    ).filter(
         Content.user_id == current_user.id,
         Content.created_at >= start_date
-    ).order_by(Content.created_at.desc()).all()
-    
-    # 일별 활동 집계
-    daily_activity = {}
-    for content in contents:
-        date_key = content.created_at.date().isoformat()
-        if date_key not in daily_activity:
-            daily_activity[date_key] = 0
-        daily_activity[date_key] += 1
+    ).order_by(Content.created_at.desc(), Content.id.desc()).limit(10).all()
     
     return {
         "period_days": days,
-        "total_extractions": len(contents),
+        "total_extractions": sum(daily_activity.values()),
         "daily_activity": daily_activity,
         "recent_contents": [
             {
@@ -97,6 +93,6 @@ async def get_user_activity(
                 "created_at": content.created_at,
                 "word_count": content.word_count
             }
-            for content in contents[:10]  # 최근 10개만
+            for content in recent_contents
         ]
     }
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, EmailStr, validator
-from typing import Optional, List, Dict, Any
+from pydantic import AliasChoices, BaseModel, EmailStr, Field, validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 import re
 
+from ..core.config import BATCH_MAX_URLS
+
 # User schemas
 class UserBase(BaseModel):
     email: EmailStr
@@ -126,17 +128,43 @@ class ContentCreate(ContentBase):
 
 class Content(ContentBase):
     id: int
-    original_content: Optional[Dict[str, Any]] = None
+    # ORM 객체에서는 공유 본문을 합친 Content.extracted_data를 읽음
+    original_content: Optional[Dict[str, Any]] = Field(
+        None, validation_alias=AliasChoices('extracted_data', 'original_content')
+    )
     converted_content: Optional[str] = None
     created_at: datetime
     user_id: int
     title: Optional[str] = None
     description: Optional[str] = None
     word_count: Optional[int] = None
+    hashtags: Optional[str] = None
     
     class Config:
         from_attributes = True
 
+class ContentSummary(BaseModel):
+    id: int
+    url: str
+    title: Optional[str] = None
+    created_at: datetime
+    word_count: Optional[int] = None
+    
+    class Config:
+        from_attributes = True
+
+class ContentPage(BaseModel):
+    items: List[ContentSummary]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 None)
+
+class ContentSearchHit(ContentSummary):
+    rank: float  # 클수록 관련도 높음
+    snippet: Optional[str] = None  # 일치 부분을 <mark>로 감싼 본문 발췌
+
+class ContentSearchPage(BaseModel):
+    items: List[ContentSearchHit]
+    next_offset: Optional[int] = None  # 다음 페이지 요청 시 offset으로 전달 (마지막 페이지면 None)
+
 # Auth schemas
 class Token(BaseModel):
     access_token: str
@@ -149,6 +177,20 @@ class TokenData(BaseModel):
 # Content processing schemas
 class ExtractRequest(BaseModel):
     url: str
+    mode: Optional[Literal['split', 'combined']] = None  # 미지정 시 서버 기본 변환 모드
+    background: bool = False  # True면 작업 큐에 등록하고 바로 job id 반환
+
+class BatchExtractRequest(BaseModel):
+    urls: List[str]
+    mode: Optional[Literal['split', 'combined']] = None
+    
+    @validator('urls')
+    def validate_urls(cls, v):
+        if not v:
+            raise ValueError('URL을 하나 이상 입력해주세요.')
+        if len(v) > BATCH_MAX_URLS:
+            raise ValueError(f'한 번에 최대 {BATCH_MAX_URLS}개의 URL만 처리할 수 있습니다.')
+        return v
 
 class ExtractResponse(BaseModel):
     success: bool
@@ -156,6 +198,40 @@ class ExtractResponse(BaseModel):
     converted_content: str
     content_id: int
 
+# Background job schemas
+class ExtractJob(BaseModel):
+    id: int
+    url: str
+    status: str
+    attempts: int
+    max_attempts: int
+    content_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class JobQueueStats(BaseModel):
+    queued: int
+    running: int
+    succeeded: int
+    failed: int
+    oldest_queued_age_seconds: Optional[float] = None
+    avg_wait_seconds: Optional[float] = None
+    avg_run_seconds: Optional[float] = None
+
+class ExtractionRuleStats(BaseModel):
+    name: str
+    pages: int
+    hit_rates: Dict[str, Optional[float]]
+
+class ExtractionRuleRegistryStats(BaseModel):
+    rules: List[ExtractionRuleStats]
+    unmatched_pages: int
+
 # System stats
 class UserStats(BaseModel):
     total_users: int
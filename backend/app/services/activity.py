@@ -0,0 +1,67 @@
+"""
+사용자 일별 활동 집계 (user_daily_activity)
+
+ORM으로 추가/삭제되는 Content는 models의 before_flush 리스너가 같은 트랜잭션에서
+집계에 반영합니다. 이 모듈은 기존 데이터나 ORM을 거치지 않은 대량 입력(Core insert,
+수동 SQL 등)을 위해 contents 테이블에서 집계를 다시 계산합니다.
+
+    python -m app.services.activity               # 전체 재계산
+    python -m app.services.activity --user-id 42  # 한 사용자만 재계산
+"""
+from typing import Optional
+import argparse
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+
+from ..models.models import Content, UserDailyActivity
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_daily_activity(conn: Connection, user_id: Optional[int] = None) -> int:
+    """
+    contents에서 일별 집계를 다시 계산 (호출한 트랜잭션 안에서 삭제 후 재삽입)
+
+    Args:
+        conn: 트랜잭션이 열린 연결
+        user_id: 지정하면 해당 사용자만 재계산
+
+    Returns:
+        생성된 집계 행 수
+    """
+    table = UserDailyActivity.__table__
+    day = func.date(Content.created_at)
+    source = (
+        select(Content.user_id, day, func.count())
+        .where(Content.user_id.is_not(None), Content.created_at.is_not(None))
+        .group_by(Content.user_id, day)
+    )
+    delete = table.delete()
+    if user_id is not None:
+        source = source.where(Content.user_id == user_id)
+        delete = delete.where(table.c.user_id == user_id)
+
+    conn.execute(delete)
+    result = conn.execute(table.insert().from_select(["user_id", "day", "extractions"], source))
+    return result.rowcount
+
+
+def main() -> None:
+    from ..core.database import engine
+    from ..models.models import Base
+
+    parser = argparse.ArgumentParser(description="Rebuild the user_daily_activity rollup from contents")
+    parser.add_argument("--user-id", type=int, help="이 사용자만 재계산")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        rows = rebuild_daily_activity(conn, args.user_id)
+    print(f"{rows} daily activity row(s) rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+기사 본문 공유 저장소 (article_blobs)
+
+추출 결과의 본문(content.text)은 여러 사용자가 같은 기사를 저장해도 한 번만 저장합니다.
+본문 해시로 article_blobs 행을 찾고, 본문은 zstd로 압축하며, 문단(content.paragraphs)은
+본문 안의 [시작, 끝) 문자 위치로만 보관합니다. Content.original_content에는 본문을 뺀
+나머지(제목, 메타데이터 등)만 남고, Content.extracted_data가 둘을 합쳐 원래 형태로 돌려줍니다.
+
+    python -m app.services.article_blobs --migrate   # 기존 행의 본문을 article_blobs로 이동
+    python -m app.services.article_blobs --prune     # 참조되지 않는 본문 삭제
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import copy
+import hashlib
+import json
+import logging
+
+import zstandard
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+
+from ..core.config import ARTICLE_BLOB_COMPRESSION_LEVEL
+
+logger = logging.getLogger(__name__)
+
+# 기존 행 이동 시 한 번에 읽는 행 수
+MIGRATE_BATCH_SIZE = 500
+
+
+@dataclass
+class ArticleBody:
+    text: str
+    paragraph_spans: List[List[int]]
+
+    @property
+    def body_hash(self) -> str:
+        """본문과 문단 구분을 함께 담은 SHA-256 (같은 본문이라도 문단 구분이 다르면 다른 행)"""
+        digest = hashlib.sha256(self.text.encode('utf-8'))
+        digest.update(b'\0' + json.dumps(self.paragraph_spans, separators=(',', ':')).encode('ascii'))
+        return digest.hexdigest()
+
+    def compress(self) -> bytes:
+        return zstandard.compress(self.text.encode('utf-8'), ARTICLE_BLOB_COMPRESSION_LEVEL)
+
+    @property
+    def paragraphs(self) -> List[str]:
+        return [self.text[start:end] for start, end in self.paragraph_spans]
+
+
+def decompress_text(data: bytes) -> str:
+    return zstandard.decompress(data).decode('utf-8')
+
+
+def paragraph_spans(text: str, paragraphs: List[str]) -> Optional[List[List[int]]]:
+    """문단들의 본문 내 위치 (순서대로 찾을 수 없는 문단이 있으면 None)"""
+    spans = []
+    position = 0
+    for paragraph in paragraphs:
+        start = text.find(paragraph, position)
+        if start < 0:
+            return None
+        position = start + len(paragraph)
+        spans.append([start, position])
+    return spans
+
+
+def split_extracted_data(extracted_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[ArticleBody]]:
+    """
+    추출 결과를 본문을 뺀 나머지와 공유 저장할 본문으로 분리
+
+    Returns:
+        (original_content에 저장할 dict, ArticleBody) - 본문이 없거나 문단을 위치로
+        나타낼 수 없으면 (원본 그대로, None)
+    """
+    content = extracted_data.get('content')
+    if not isinstance(content, dict) or not content.get('text') or not isinstance(content.get('paragraphs'), list):
+        return extracted_data, None
+    text = content['text']
+    spans = paragraph_spans(text, content['paragraphs'])
+    if spans is None:
+        return extracted_data, None
+
+    stub = {key: value for key, value in extracted_data.items() if key != 'content'}
+    stub['content'] = {key: value for key, value in content.items() if key not in ('text', 'paragraphs')}
+    return stub, ArticleBody(text, spans)
+
+
+def join_extracted_data(stub: Optional[Dict[str, Any]], body: ArticleBody) -> Dict[str, Any]:
+    """split_extracted_data의 역변환"""
+    extracted_data = copy.deepcopy(stub or {})
+    rest = extracted_data.get('content') or {}
+    extracted_data['content'] = {'text': body.text, 'paragraphs': body.paragraphs, **rest}
+    return extracted_data
+
+
+def migrate_contents(conn: Connection, batch_size: int = MIGRATE_BATCH_SIZE) -> int:
+    """
+    original_content에 본문을 그대로 가진 기존 행을 article_blobs 참조로 변환
+
+    Returns:
+        변환한 행 수
+    """
+    from ..models.models import Content, store_article_blobs
+
+    table = Content.__table__
+    moved = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.original_content)
+            .where(table.c.id > last_id, table.c.blob_id.is_(None), table.c.original_content.is_not(None))
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return moved
+        last_id = rows[-1].id
+
+        updates = []
+        bodies = {}
+        for row in rows:
+            stub, body = split_extracted_data(row.original_content)
+            if body is not None:
+                bodies[body.body_hash] = body
+                updates.append((row.id, stub, body.body_hash))
+        blob_ids = store_article_blobs(conn, bodies)
+        for content_id, stub, body_hash in updates:
+            conn.execute(table.update().where(table.c.id == content_id).values(
+                original_content=stub, blob_id=blob_ids[body_hash]
+            ))
+        moved += len(updates)
+
+
+def prune_article_blobs(conn: Connection) -> int:
+    """어떤 Content도 참조하지 않는 article_blobs 행 삭제
+
+    Returns:
+        삭제한 행 수
+    """
+    from ..models.models import ArticleBlob, Content
+
+    referenced = select(Content.blob_id).where(Content.blob_id.is_not(None))
+    result = conn.execute(ArticleBlob.__table__.delete().where(ArticleBlob.id.not_in(referenced)))
+    return result.rowcount
+
+
+def main() -> None:
+    from ..core.database import engine
+    from ..models.models import Base
+
+    parser = argparse.ArgumentParser(description="Maintain the shared article_blobs store")
+    parser.add_argument("--migrate", action="store_true", help="기존 행의 본문을 article_blobs로 이동")
+    parser.add_argument("--prune", action="store_true", help="참조되지 않는 본문 삭제")
+    args = parser.parse_args()
+    if not (args.migrate or args.prune):
+        parser.error("--migrate 또는 --prune을 지정해주세요.")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    Base.metadata.create_all(bind=engine)
+    if args.migrate:
+        with engine.begin() as conn:
+            print(f"{migrate_contents(conn)} content row(s) moved to article_blobs")
+    if args.prune:
+        with engine.begin() as conn:
+            print(f"{prune_article_blobs(conn)} unreferenced article blob(s) deleted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+from pathlib import Path
+from typing import Dict, List, Tuple
+import logging
+import time
+
+from ..core.config import (
+    MESSAGE_BATCH_MAX_REQUESTS, MESSAGE_BATCH_POLL_INTERVAL, MESSAGE_BATCH_MAX_POLL_INTERVAL
+)
+from .conversion_manifest import ConversionManifest, file_digest
+
+logger = logging.getLogger(__name__)
+
+# custom_id에 사용할 입력 해시 길이 (custom_id는 최대 64자)
+CUSTOM_ID_HASH_CHARS = 32
+
+
+class BatchConverter:
+    def __init__(
+        self,
+        converter,
+        max_requests: int = MESSAGE_BATCH_MAX_REQUESTS,
+        poll_interval: float = MESSAGE_BATCH_POLL_INTERVAL,
+        max_poll_interval: float = MESSAGE_BATCH_MAX_POLL_INTERVAL
+    ):
+        """
+        Message Batches API를 이용한 디렉토리 일괄 변환기 (CLI 전용)
+
+        1) 아직 변환되지 않은 파일의 마크다운/키워드 요청을 배치로 제출하고
+        2) 배치가 끝날 때까지 점점 간격을 늘리며 상태를 확인한 뒤
+        3) 결과가 도착하면 .md 파일을 작성합니다.
+
+        제출한 배치는 출력 디렉토리의 매니페스트에 기록되므로, 중단 후 다시 실행하면
+        새로 제출하지 않고 기존 배치의 결과를 이어서 수집합니다.
+
+        Args:
+            converter: 프롬프트/후처리/캐시를 제공하는 NewsConverter
+            max_requests: 배치 하나에 담을 최대 요청 수
+            poll_interval: 첫 상태 확인 간격 (초)
+            max_poll_interval: 상태 확인 간격 상한 (초)
+        """
+        self.converter = converter
+        self.max_requests = max_requests
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        # 캐시를 사용하지 않을 때 배치 결과를 보관 (cache key → 후처리된 출력)
+        self._outputs: Dict[str, str] = {}
+
+    def run(self, directory_path, resume=True, mode=None):
+        """
+        Submit, poll and write outputs for all TXT files in a directory.
+
+        Returns:
+            {'converted': n, 'skipped': n, 'failed': n, 'submitted': n}
+        """
+        manifest = ConversionManifest.for_output_dir(self.converter.output_dir)
+        summary = {'converted': 0, 'skipped': 0, 'failed': 0, 'submitted': 0}
+        try:
+            requests = self._pending_requests(manifest, Path(directory_path), resume, mode, summary)
+            for start in range(0, len(requests), self.max_requests):
+                self.submit(manifest, requests[start:start + self.max_requests])
+            summary['submitted'] = len({request[1] for request in requests})
+
+            for batch_id in manifest.open_batches():
+                self.wait(batch_id)
+                converted, failed = self.collect(manifest, batch_id)
+                summary['converted'] += converted
+                summary['failed'] += failed
+        finally:
+            manifest.close()
+
+        print(
+            f"Done: {summary['converted']} converted, {summary['skipped']} skipped, "
+            f"{summary['failed']} failed ({summary['submitted']} file(s) submitted in this run)"
+        )
+        return summary
+
+    def _pending_requests(self, manifest, directory, resume, mode, summary) -> List[Tuple[str, str, Path, str, dict]]:
+        """변환이 필요한 파일의 (custom_id, input_hash, path, kind, params) 목록"""
+        in_flight = manifest.in_open_batches()
+        seen = set()
+        requests = []
+        for txt_file in sorted(directory.glob('*.txt')):
+            input_hash = file_digest(txt_file)
+            if input_hash in seen or input_hash in in_flight:
+                continue
+            seen.add(input_hash)
+            if resume and manifest.completed_output(input_hash):
+                summary['skipped'] += 1
+                continue
+
+            data = self.converter.read_txt_file(txt_file)
+            missing = [
+                (kind, params) for kind, key, params in self.converter.batch_requests(data, mode)
+                if self._output(key) is None
+            ]
+            if not missing:
+                # 모든 결과가 이미 캐시에 있으면 제출하지 않고 바로 작성
+                self._write(manifest, txt_file, input_hash, data, mode)
+                summary['converted'] += 1
+                continue
+
+            custom_id_hash = input_hash[:CUSTOM_ID_HASH_CHARS]
+            requests.extend(
+                (f"{kind}_{custom_id_hash}", input_hash, txt_file, kind, params)
+                for kind, params in missing
+            )
+        return requests
+
+    def submit(self, manifest, requests) -> str:
+        """요청 목록을 배치 하나로 제출하고 매니페스트에 기록"""
+        batch = self.converter.get_client().messages.batches.create(requests=[
+            {'custom_id': custom_id, 'params': params}
+            for custom_id, _, _, _, params in requests
+        ])
+        manifest.record_batch(batch.id, [
+            (custom_id, input_hash, txt_file, kind)
+            for custom_id, input_hash, txt_file, kind, _ in requests
+        ])
+        print(f"Submitted batch {batch.id} with {len(requests)} request(s)")
+        return batch.id
+
+    def wait(self, batch_id):
+        """배치가 끝날 때까지 상태 확인 (간격은 두 배씩 늘어나며 max_poll_interval에서 멈춤)"""
+        client = self.converter.get_client()
+        interval = self.poll_interval
+        while True:
+            batch = client.messages.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            total = counts.processing + counts.succeeded + counts.errored + counts.canceled + counts.expired
+            print(
+                f"Batch {batch_id}: {batch.processing_status}, "
+                f"{total - counts.processing}/{total} processed ({counts.errored} errored)"
+            )
+            if batch.processing_status == 'ended':
+                return batch
+            time.sleep(interval)
+            interval = min(interval * 2, self.max_poll_interval)
+
+    def collect(self, manifest, batch_id) -> Tuple[int, int]:
+        """끝난 배치의 결과를 받아 .md 파일을 작성하고 (변환 수, 실패 수)를 반환"""
+        requests = {row[0]: row[1:] for row in manifest.batch_requests(batch_id)}
+        files: Dict[str, Tuple[str, str]] = {}
+        for input_hash, input_path, kind in requests.values():
+            files.setdefault(input_hash, (input_path, 'combined' if kind == 'combined' else 'split'))
+
+        articles = {}
+        errors: Dict[str, str] = {}
+        for entry in self.converter.get_client().messages.batches.results(batch_id):
+            if entry.custom_id not in requests:
+                continue
+            input_hash, input_path, kind = requests[entry.custom_id]
+            if entry.result.type != 'succeeded':
+                errors[input_hash] = self._describe_error(entry.result)
+                continue
+            try:
+                if input_hash not in articles:
+                    articles[input_hash] = self.converter.read_txt_file(input_path)
+                data = articles[input_hash]
+                key = next(key for k, key, _ in self.converter.batch_requests(data, files[input_hash][1]) if k == kind)
+                self._store(key, kind, self.converter.batch_output(kind, entry.result.message, data))
+            except Exception as e:
+                errors[input_hash] = str(e)
+
+        converted = failed = 0
+        for input_hash, (input_path, mode) in files.items():
+            try:
+                if input_hash in errors:
+                    raise RuntimeError(errors[input_hash])
+                data = articles.get(input_hash) or self.converter.read_txt_file(input_path)
+                self._write(manifest, input_path, input_hash, data, mode)
+                converted += 1
+            except Exception as e:
+                logger.error(f"배치 결과 처리 실패 ({input_path}): {str(e)}")
+                manifest.mark_failed(input_hash, input_path, str(e))
+                failed += 1
+
+        # 모든 파일을 기록한 뒤에 닫아야 중단 시 결과를 다시 받아올 수 있음
+        manifest.close_batch(batch_id)
+        return converted, failed
+
+    def _describe_error(self, result) -> str:
+        if result.type == 'errored':
+            return f"batch request errored: {result.error.error.message}"
+        return f"batch request {result.type}"
+
+    def _output(self, key):
+        output = self._outputs.get(key)
+        if output is None and self.converter.cache:
+            output = self.converter.cache.get(key)
+        return output
+
+    def _store(self, key, kind, output):
+        if self.converter.cache:
+            self.converter.cache.put(key, kind, output)
+        else:
+            self._outputs[key] = output
+
+    def _write(self, manifest, txt_file, input_hash, data, mode):
+        outputs = {}
+        for kind, key, _ in self.converter.batch_requests(data, mode):
+            output = self._output(key)
+            if output is None:
+                raise RuntimeError(f"missing {kind} result")
+            outputs[kind] = output
+
+        if 'combined' in outputs:
+            markdown_content = outputs['combined']
+        else:
+            markdown_content = f"{outputs['markdown']}\n\n{outputs['keywords']}"
+
+        output_path = self.converter.output_path_for(txt_file)
+        self.converter.write_output(output_path, markdown_content)
+        manifest.mark_done(input_hash, txt_file, output_path)
@@ -0,0 +1,219 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+import logging
+import threading
+import time
+
+import psutil
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
+
+from ..core.config import (
+    BROWSER_POOL_SIZE, BROWSER_MAX_PAGES, BROWSER_MAX_MEMORY_MB,
+    BROWSER_CHECKOUT_TIMEOUT, BROWSER_PAGE_LOAD_TIMEOUT, BROWSER_START_RETRY_INTERVAL
+)
+
+logger = logging.getLogger(__name__)
+
+# chromedriver 바이너리 경로는 프로세스당 한 번만 확인
+# (실패하면 BROWSER_START_RETRY_INTERVAL초 동안 다시 설치를 시도하지 않음)
+_driver_path: Optional[str] = None
+_driver_path_error: Optional[Tuple[float, str]] = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """ChromeDriverManager로 드라이버 바이너리를 한 번만 설치/확인합니다."""
+    global _driver_path, _driver_path_error
+    with _driver_path_lock:
+        if _driver_path is not None:
+            return _driver_path
+        if _driver_path_error is not None:
+            failed_at, message = _driver_path_error
+            if time.monotonic() - failed_at < BROWSER_START_RETRY_INTERVAL:
+                raise RuntimeError(f"chromedriver를 사용할 수 없습니다: {message}")
+        try:
+            _driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            _driver_path_error = (time.monotonic(), str(e))
+            raise
+        _driver_path_error = None
+        return _driver_path
+
+
+class PooledDriver:
+    """풀에서 관리되는 웹드라이버와 사용 통계"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.monotonic()
+
+    def memory_mb(self) -> float:
+        """chromedriver와 하위 Chrome 프로세스의 RSS 합계 (MB)"""
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except (psutil.Error, AttributeError):
+            return 0.0
+
+    def is_alive(self) -> bool:
+        """브라우저가 명령에 응답하는지 확인"""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"웹드라이버 종료 중 오류: {str(e)}")
+
+
+class ChromeDriverPool:
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_pages: int = BROWSER_MAX_PAGES,
+        max_memory_mb: int = BROWSER_MAX_MEMORY_MB,
+        checkout_timeout: float = BROWSER_CHECKOUT_TIMEOUT,
+        user_agent: Optional[Callable[[], str]] = None
+    ):
+        """
+        헤드리스 Chrome 드라이버 풀
+        
+        Args:
+            size: 동시에 유지할 최대 드라이버 수
+            max_pages: 드라이버를 교체하기 전까지 처리할 최대 페이지 수
+            max_memory_mb: 드라이버 교체 기준 메모리 사용량 (0이면 검사하지 않음)
+            checkout_timeout: 드라이버 대여 대기 시간 (초)
+            user_agent: 새 드라이버에 적용할 User-Agent 생성 함수
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.checkout_timeout = checkout_timeout
+        self.user_agent = user_agent
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[PooledDriver] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _create_driver(self) -> PooledDriver:
+        """새 헤드리스 드라이버 생성"""
+        options = Options()
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        if self.user_agent:
+            options.add_argument(f'user-agent={self.user_agent()}')
+        
+        service = Service(resolve_driver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(BROWSER_PAGE_LOAD_TIMEOUT)
+        return PooledDriver(driver)
+
+    def warm(self, count: int = 1) -> None:
+        """드라이버를 미리 띄워 둡니다."""
+        count = min(count, self.size)
+        with self._lock:
+            missing = count - len(self._idle)
+        for _ in range(max(missing, 0)):
+            # 대여 중인 드라이버와 합쳐 size를 넘지 않도록 슬롯을 잡고 생성
+            if not self._slots.acquire(blocking=False):
+                break
+            try:
+                pooled = self._create_driver()
+                with self._lock:
+                    self._idle.append(pooled)
+            finally:
+                self._slots.release()
+
+    def checkout(self) -> PooledDriver:
+        """유휴 드라이버를 대여합니다. 없으면 새로 생성합니다."""
+        if self._closed:
+            raise RuntimeError("브라우저 풀이 종료되었습니다")
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise RuntimeError("브라우저 풀 대기 시간 초과")
+        
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    return self._create_driver()
+                if pooled.is_alive():
+                    return pooled
+                # 비정상 종료된 드라이버는 교체
+                logger.warning("응답하지 않는 웹드라이버를 교체합니다")
+                pooled.quit()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def checkin(self, pooled: PooledDriver, discard: bool = False) -> None:
+        """드라이버를 반납합니다. 교체 조건에 해당하면 종료합니다."""
+        try:
+            pooled.pages += 1
+            if not discard and pooled.pages >= self.max_pages:
+                discard = True
+            if not discard and self.max_memory_mb and pooled.memory_mb() > self.max_memory_mb:
+                logger.info("메모리 사용량 초과로 웹드라이버를 교체합니다")
+                discard = True
+            
+            if discard or self._closed:
+                pooled.quit()
+            else:
+                with self._lock:
+                    self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """with 문으로 드라이버를 대여/반납합니다."""
+        pooled = self.checkout()
+        discard = False
+        try:
+            yield pooled.driver
+        except Exception:
+            discard = not pooled.is_alive()
+            raise
+        finally:
+            self.checkin(pooled, discard=discard)
+
+    def close(self) -> None:
+        """모든 유휴 드라이버를 종료합니다. 대여 중인 드라이버는 반납 시 종료됩니다."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            pooled.quit()
+
+
+_pool: Optional[ChromeDriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool(user_agent: Optional[Callable[[], str]] = None) -> ChromeDriverPool:
+    """프로세스 전역 브라우저 풀을 반환합니다."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = ChromeDriverPool(user_agent=user_agent)
+        return _pool
+
+
+def close_browser_pool() -> None:
+    """프로세스 전역 브라우저 풀을 종료합니다."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
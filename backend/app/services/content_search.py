@@ -0,0 +1,192 @@
+"""
+저장된 콘텐츠 전문 검색
+
+제목, 변환된 마크다운, 해시태그를 색인합니다.
+
+- SQLite: FTS5 외부 콘텐츠 테이블(contents_fts)을 contents 트리거로 동기화합니다.
+  작성자는 owner 열의 토큰('u<user_id>')으로 색인해 검색어와 같은 인덱스에서 교집합을
+  구합니다.
+- PostgreSQL: contents.search_vector(tsvector 생성 컬럼)와 GIN 인덱스를 사용하며,
+  작성자 토큰도 같은 벡터에 넣습니다.
+
+관련도는 문서마다 제목/해시태그/본문의 일치 횟수로 계산합니다 (제목 > 해시태그 > 본문).
+FTS5 bm25()는 검색어마다 전체 색인의 문서 빈도를 세므로 흔한 단어일수록 사용자와 무관하게
+느려지고, 한 사용자의 보관함 안에서는 전체 문서 빈도가 순위에 큰 의미가 없기 때문입니다.
+일치하는 최신 문서 CONTENT_SEARCH_MAX_RESULTS개만 순위를 매겨, 일치 문서가 많은
+사용자도 비용이 일정합니다.
+
+두 방식 모두 형태소 분석 없이 토큰을 나누므로 각 검색어를 접두어로 검색합니다
+('테슬라' → '테슬라가', '테슬라의'와 일치).
+"""
+from typing import Any, Dict, List, Optional
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..core.config import CONTENT_SEARCH_MAX_RESULTS
+
+# 검색어 토큰 최대 개수
+MAX_QUERY_TERMS = 8
+
+# 발췌 길이 (단어 수)와 일치 부분 표시
+SNIPPET_WORDS = 24
+SNIPPET_START = '<mark>'
+SNIPPET_END = '</mark>'
+
+# unicode61 토크나이저와 같이 문자/숫자가 아닌 문자는 모두 구분자로 취급
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+SQLITE_SCHEMA = [
+    """CREATE VIEW IF NOT EXISTS contents_search_source AS
+       SELECT id, title, converted_content AS body, hashtags, 'u' || user_id AS owner FROM contents""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS contents_fts USING fts5(
+       title, body, hashtags, owner,
+       content='contents_search_source', content_rowid='id',
+       tokenize='unicode61 remove_diacritics 2', prefix='2 3')""",
+    """CREATE TRIGGER IF NOT EXISTS contents_fts_insert AFTER INSERT ON contents BEGIN
+       INSERT INTO contents_fts(rowid, title, body, hashtags, owner)
+       VALUES (new.id, new.title, new.converted_content, new.hashtags, 'u' || new.user_id);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS contents_fts_delete AFTER DELETE ON contents BEGIN
+       INSERT INTO contents_fts(contents_fts, rowid, title, body, hashtags, owner)
+       VALUES ('delete', old.id, old.title, old.converted_content, old.hashtags, 'u' || old.user_id);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS contents_fts_update
+       AFTER UPDATE OF title, converted_content, hashtags, user_id ON contents BEGIN
+       INSERT INTO contents_fts(contents_fts, rowid, title, body, hashtags, owner)
+       VALUES ('delete', old.id, old.title, old.converted_content, old.hashtags, 'u' || old.user_id);
+       INSERT INTO contents_fts(rowid, title, body, hashtags, owner)
+       VALUES (new.id, new.title, new.converted_content, new.hashtags, 'u' || new.user_id);
+       END""",
+    "INSERT INTO contents_fts(contents_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_SCHEMA = [
+    """ALTER TABLE contents ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+       setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+       setweight(to_tsvector('simple', coalesce(hashtags, '')), 'B') ||
+       setweight(to_tsvector('simple', coalesce(converted_content, '')), 'C') ||
+       setweight(to_tsvector('simple', 'u' || coalesce(user_id::text, '')), 'D')
+       ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_contents_search_vector ON contents USING GIN (search_vector)",
+]
+
+# 일치 횟수 t(제목), h(해시태그), b(본문)로 계산한 관련도 - 본문은 반복될수록 증가폭이 줄어듦
+SQLITE_RANK = "10.0 * t + 5.0 * h + 3.0 * b / (b + 2.0)"
+
+# ts_rank_cd 가중치 {D(작성자), C(본문), B(해시태그), A(제목)}
+POSTGRES_WEIGHTS = '{0, 0.2, 0.5, 1.0}'
+
+
+def create_search_index(conn: Connection) -> None:
+    """현재 데이터베이스 종류에 맞는 검색 색인 생성 (기존 행 포함)"""
+    statements = POSTGRES_SCHEMA if conn.dialect.name == 'postgresql' else SQLITE_SCHEMA
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+def query_terms(q: str) -> List[str]:
+    """검색어를 색인 토큰과 같은 기준으로 나눈 소문자 단어 목록 (연산자 문자 제거)"""
+    terms = WORD_PATTERN.findall(q.lower())
+    return list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+
+
+def make_snippet(body: Optional[str], terms: List[str]) -> Optional[str]:
+    """본문에서 첫 일치 단어 주변을 잘라 일치 단어를 SNIPPET_START/END로 감싼 발췌"""
+    words = list(WORD_PATTERN.finditer(body or ''))
+    if not words:
+        return None
+    matches = [i for i, word in enumerate(words) if word.group().lower().startswith(tuple(terms))]
+    first = max(0, (matches[0] if matches else 0) - SNIPPET_WORDS // 4)
+    last = min(len(words), first + SNIPPET_WORDS)
+
+    parts = ['…'] if first > 0 else []
+    cursor = words[first].start()
+    for i in matches:
+        if first <= i < last:
+            word = words[i]
+            parts.append(body[cursor:word.start()] + SNIPPET_START + word.group() + SNIPPET_END)
+            cursor = word.end()
+    parts.append(body[cursor:words[last - 1].end()])
+    if last < len(words):
+        parts.append('…')
+    return ''.join(parts)
+
+
+def search_contents(db: Session, user_id: int, q: str, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+    """
+    사용자의 콘텐츠를 관련도 순으로 검색
+
+    Returns:
+        id, url, title, created_at, word_count, rank, snippet을 담은 dict 목록
+        (검색어가 비어 있으면 빈 목록)
+    """
+    terms = query_terms(q)
+    if not terms:
+        return []
+    if db.get_bind().dialect.name == 'postgresql':
+        rows = _search_postgres(db, user_id, terms, limit, offset)
+    else:
+        rows = _search_sqlite(db, user_id, terms, limit, offset)
+
+    hits = []
+    for row in rows:
+        hit = dict(row)
+        hit['snippet'] = make_snippet(hit.pop('converted_content'), terms)
+        hits.append(hit)
+    return hits
+
+
+def _search_sqlite(db: Session, user_id: int, terms: List[str], limit: int, offset: int) -> List[Any]:
+    match = 'owner:u%d AND {title body hashtags} : (%s)' % (
+        int(user_id), ' AND '.join(f'"{term}"*' for term in terms)
+    )
+    # 일치 횟수는 highlight()가 표시 문자를 넣은 만큼 늘어난 길이로 셈 (NULL 열의 highlight()는 NULL)
+    return db.execute(text(f"""
+        SELECT c.id, c.url, c.title, c.created_at, c.word_count, c.converted_content, page.rank
+        FROM (
+            SELECT id, {SQLITE_RANK} AS rank
+            FROM (
+                SELECT rowid AS id,
+                       coalesce(length(highlight(contents_fts, 0, char(1), '')), 0) - length(coalesce(title, '')) AS t,
+                       coalesce(length(highlight(contents_fts, 1, char(1), '')), 0) - length(coalesce(body, '')) AS b,
+                       coalesce(length(highlight(contents_fts, 2, char(1), '')), 0) - length(coalesce(hashtags, '')) AS h
+                FROM contents_fts
+                WHERE contents_fts MATCH :match
+                ORDER BY rowid DESC
+                LIMIT :candidates
+            )
+            ORDER BY rank DESC, id DESC
+            LIMIT :limit OFFSET :offset
+        ) AS page
+        JOIN contents c ON c.id = page.id
+        ORDER BY page.rank DESC, c.id DESC
+    """), {'match': match, 'candidates': CONTENT_SEARCH_MAX_RESULTS,
+           'limit': limit, 'offset': offset}).mappings().all()
+
+
+def _search_postgres(db: Session, user_id: int, terms: List[str], limit: int, offset: int) -> List[Any]:
+    # 작성자 토큰은 GIN 인덱스 교집합에만 쓰고, 순위는 검색어만으로 계산
+    terms_query = ' & '.join(f"'{term}':*" for term in terms)
+    return db.execute(text("""
+        SELECT c.id, c.url, c.title, c.created_at, c.word_count, c.converted_content, page.rank
+        FROM (
+            SELECT c.id, ts_rank_cd(CAST(:weights AS float4[]), c.search_vector,
+                                    to_tsquery('simple', :terms_query)) AS rank
+            FROM (
+                SELECT id FROM contents
+                WHERE search_vector @@ to_tsquery('simple', :match_query) AND user_id = :user_id
+                ORDER BY id DESC
+                LIMIT :candidates
+            ) AS hits
+            JOIN contents c ON c.id = hits.id
+            ORDER BY rank DESC, c.id DESC
+            LIMIT :limit OFFSET :offset
+        ) AS page
+        JOIN contents c ON c.id = page.id
+        ORDER BY page.rank DESC, c.id DESC
+    """), {'weights': POSTGRES_WEIGHTS, 'terms_query': terms_query,
+           'match_query': f"u{int(user_id)} & {terms_query}", 'user_id': user_id,
+           'candidates': CONTENT_SEARCH_MAX_RESULTS, 'limit': limit, 'offset': offset}).mappings().all()
@@ -0,0 +1,120 @@
+from typing import Dict, Optional
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+import re
+
+from ..core.config import (
+    CONVERSION_CACHE_PATH, CONVERSION_CACHE_MAX_ENTRIES, CONVERSION_CACHE_MAX_AGE_DAYS
+)
+
+# 만료/초과 항목 정리 주기 (저장 횟수 기준)
+EVICT_EVERY = 50
+
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 입력 정규화 (NFC, 공백 정리)
+
+    줄 바꿈은 문단 구분이라 변환 결과에 영향을 주므로 남기고, 가로 공백만 하나로 줄입니다.
+    줄 앞뒤 공백은 지우고, 빈 줄이 여러 개 이어지면 빈 줄 하나로 줄입니다.
+    """
+    text = unicodedata.normalize('NFC', text or '').replace('\r\n', '\n').replace('\r', '\n')
+    text = re.sub(r'[^\S\n]+', ' ', text)
+    text = re.sub(r' ?\n ?', '\n', text)
+    return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+
+def cache_key(kind: str, prompt_version: str, model: str, *parts: str) -> str:
+    """정규화된 입력, 프롬프트 버전, 모델명으로 만든 콘텐츠 주소"""
+    digest = hashlib.sha256()
+    for value in (kind, prompt_version, model) + tuple(normalize_text(p) for p in parts):
+        digest.update(value.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    def __init__(
+        self,
+        path: str = CONVERSION_CACHE_PATH,
+        max_entries: int = CONVERSION_CACHE_MAX_ENTRIES,
+        max_age_days: float = CONVERSION_CACHE_MAX_AGE_DAYS
+    ):
+        """
+        LLM 변환 결과를 저장하는 영구 캐시 (SQLite)
+        
+        Args:
+            path: 캐시 DB 파일 경로
+            max_entries: 최대 항목 수 (초과 시 오래 사용하지 않은 항목부터 제거)
+            max_age_days: 항목 최대 보관 기간 (일)
+        """
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS conversion_cache ("
+            " key TEXT PRIMARY KEY, kind TEXT NOT NULL, output TEXT NOT NULL,"
+            " created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_conversion_cache_last_used ON conversion_cache (last_used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output, created_at FROM conversion_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE conversion_cache SET last_used_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, kind: str, output: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conversion_cache (key, kind, output, created_at, last_used_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, kind, output, now, now)
+            )
+            self._puts += 1
+            if self._puts % EVICT_EVERY == 0:
+                self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """보관 기간이 지난 항목과 max_entries를 넘는 항목 제거"""
+        self._conn.execute("DELETE FROM conversion_cache WHERE created_at < ?", (now - self.max_age,))
+        self._conn.execute(
+            "DELETE FROM conversion_cache WHERE key IN ("
+            " SELECT key FROM conversion_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def evict(self) -> None:
+        with self._lock:
+            self._evict(time.time())
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM conversion_cache").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+import sqlite3
+import threading
+import time
+
+# 매니페스트 파일 이름 (출력 디렉토리 안에 생성)
+MANIFEST_FILENAME = '.manifest.db'
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+# Message Batches 상태
+BATCH_OPEN = 'open'
+BATCH_CLOSED = 'closed'
+
+
+def file_digest(path) -> str:
+    """입력 파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConversionManifest:
+    def __init__(self, path):
+        """
+        CLI 디렉토리 변환 진행 상황을 기록하는 매니페스트 (SQLite)
+
+        입력 파일 해시 → 출력 경로/상태를 저장해 재실행 시 완료된 파일을 건너뛰고
+        중단된 지점부터 이어서 변환할 수 있게 합니다.
+
+        Args:
+            path: 매니페스트 DB 파일 경로
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS manifest ("
+            " input_hash TEXT PRIMARY KEY, input_path TEXT NOT NULL, output_path TEXT,"
+            " status TEXT NOT NULL, error TEXT, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS batches ("
+            " batch_id TEXT PRIMARY KEY, status TEXT NOT NULL, request_count INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS batch_requests ("
+            " batch_id TEXT NOT NULL, custom_id TEXT NOT NULL, input_hash TEXT NOT NULL,"
+            " input_path TEXT NOT NULL, kind TEXT NOT NULL, PRIMARY KEY (batch_id, custom_id))"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def for_output_dir(cls, output_dir) -> 'ConversionManifest':
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return cls(output_dir / MANIFEST_FILENAME)
+
+    def completed_output(self, input_hash: str) -> Optional[str]:
+        """완료된 입력이면 출력 경로 반환 (출력 파일이 사라졌으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output_path FROM manifest WHERE input_hash = ? AND status = ?",
+                (input_hash, STATUS_DONE)
+            ).fetchone()
+        if row is None or not Path(row[0]).exists():
+            return None
+        return row[0]
+
+    def mark_done(self, input_hash: str, input_path, output_path) -> None:
+        self._record(input_hash, input_path, str(output_path), STATUS_DONE, None)
+
+    def mark_failed(self, input_hash: str, input_path, error: str) -> None:
+        self._record(input_hash, input_path, None, STATUS_FAILED, error)
+
+    def _record(self, input_hash, input_path, output_path, status, error) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO manifest (input_hash, input_path, output_path, status, error, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (input_hash, str(input_path), output_path, status, error, time.time())
+            )
+            self._conn.commit()
+
+    def record_batch(self, batch_id: str, requests: Iterable[Tuple[str, str, str, str]]) -> None:
+        """제출한 배치와 요청 목록 (custom_id, input_hash, input_path, kind) 기록"""
+        requests = list(requests)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO batches (batch_id, status, request_count, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (batch_id, BATCH_OPEN, len(requests), now, now)
+            )
+            self._conn.executemany(
+                "INSERT INTO batch_requests (batch_id, custom_id, input_hash, input_path, kind)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(batch_id, custom_id, input_hash, str(input_path), kind)
+                 for custom_id, input_hash, input_path, kind in requests]
+            )
+            self._conn.commit()
+
+    def open_batches(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch_id FROM batches WHERE status = ? ORDER BY created_at", (BATCH_OPEN,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def batch_requests(self, batch_id: str) -> List[Tuple[str, str, str, str]]:
+        """배치의 (custom_id, input_hash, input_path, kind) 목록"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT custom_id, input_hash, input_path, kind FROM batch_requests WHERE batch_id = ?",
+                (batch_id,)
+            ).fetchall()
+
+    def in_open_batches(self) -> Set[str]:
+        """아직 결과를 받지 않은 배치에 포함된 입력 해시"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT r.input_hash FROM batch_requests r"
+                " JOIN batches b ON b.batch_id = r.batch_id WHERE b.status = ?",
+                (BATCH_OPEN,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def close_batch(self, batch_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE batches SET status = ?, updated_at = ? WHERE batch_id = ?",
+                (BATCH_CLOSED, time.time(), batch_id)
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM manifest GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,146 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
+import threading
 import anthropic
 from dotenv import load_dotenv
 import re
 
+from tqdm import tqdm
+
+from ..core.config import (
+    CONVERSION_CACHE_ENABLED, CONVERSION_MODE, CONVERTER_WORKERS, MESSAGE_BATCH_POLL_INTERVAL
+)
+from .conversion_cache import ConversionCache, cache_key
+from .conversion_manifest import MANIFEST_FILENAME, ConversionManifest, file_digest
+from .prompts import get_prompt
+
+load_dotenv()
+
+# API 키별 클라이언트 캐시 크기
+MAX_CACHED_CLIENTS = 256
+
+MODEL = "claude-3-opus-20240229"
+
+# 변환 모드: split = 마크다운/키워드 2회 호출, combined = 1회 호출로 함께 생성
+CONVERSION_MODES = ('split', 'combined')
+
+COMBINED_RESPONSE_PATTERN = re.compile(
+    r'<markdown>\s*(?P<markdown>.*?)\s*</markdown>\s*<hashtags>\s*(?P<hashtags>.*?)\s*</hashtags>',
+    re.DOTALL
+)
+HASHTAG_LINE_PATTERN = re.compile(r'^\s*(#[^\s#]+\s*){2,}$')
+
 class NewsConverter:
-    def __init__(self, api_key=None):
-        load_dotenv()
-        # 사용자별 API 키가 있으면 사용, 없으면 환경변수에서 가져오기
+    def __init__(self, api_key=None, output_dir='converted_articles', cache=None, mode=CONVERSION_MODE):
+        """
+        뉴스 변환기 초기화
+        
+        프로세스 수명 동안 재사용되며 여러 스레드에서 동시에 호출해도 안전합니다.
+        요청별 API 키는 각 메서드의 api_key 인자로 전달합니다.
+        
+        Args:
+            api_key: 기본 API 키 (없으면 환경변수 ANTHROPIC_API_KEY 사용)
+            output_dir: 변환 결과를 저장할 디렉토리 (CLI 전용)
+            cache: 변환 결과 캐시 (None이면 설정에 따라 기본 캐시, False면 캐시 사용 안 함)
+            mode: 기본 변환 모드 ('split' 또는 'combined')
+        """
+        if mode not in CONVERSION_MODES:
+            raise ValueError(f"Unknown conversion mode: {mode}")
+        self.mode = mode
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.output_dir = Path(output_dir)
+        if cache is None and CONVERSION_CACHE_ENABLED:
+            cache = ConversionCache()
+        self.cache = cache
         
-        if not self.api_key:
+        # 모든 API 키가 하나의 커넥션 풀을 공유
+        self._http_client = anthropic.DefaultHttpxClient()
+        self._clients = OrderedDict()
+        self._async_http_client = None
+        self._async_clients = OrderedDict()
+        self._clients_lock = threading.Lock()
+
+    def get_client(self, api_key=None):
+        """API 키에 해당하는 Anthropic 클라이언트를 반환합니다 (LRU 캐시)."""
+        # 사용자별 API 키가 있으면 사용, 없으면 기본 키 사용
+        api_key = api_key or self.api_key
+        if not api_key:
+            raise ValueError("Anthropic API key is required")
+        
+        with self._clients_lock:
+            client = self._clients.get(api_key)
+            if client is not None:
+                self._clients.move_to_end(api_key)
+                return client
+            
+            client = anthropic.Anthropic(api_key=api_key, http_client=self._http_client)
+            self._clients[api_key] = client
+            if len(self._clients) > MAX_CACHED_CLIENTS:
+                self._clients.popitem(last=False)
+            return client
+
+    def get_async_client(self, api_key=None):
+        """API 키에 해당하는 AsyncAnthropic 클라이언트를 반환합니다 (LRU 캐시)."""
+        api_key = api_key or self.api_key
+        if not api_key:
             raise ValueError("Anthropic API key is required")
+        
+        with self._clients_lock:
+            client = self._async_clients.get(api_key)
+            if client is not None:
+                self._async_clients.move_to_end(api_key)
+                return client
             
-        self.client = anthropic.Anthropic(api_key=self.api_key)
-        self.output_dir = Path('converted_articles')
-        self.output_dir.mkdir(exist_ok=True)
+            if self._async_http_client is None:
+                self._async_http_client = anthropic.DefaultAsyncHttpxClient()
+            client = anthropic.AsyncAnthropic(api_key=api_key, http_client=self._async_http_client)
+            self._async_clients[api_key] = client
+            if len(self._async_clients) > MAX_CACHED_CLIENTS:
+                self._async_clients.popitem(last=False)
+            return client
+
+    def close(self):
+        """공유 커넥션 풀을 닫습니다."""
+        with self._clients_lock:
+            self._clients.clear()
+        self._http_client.close()
+        if self.cache:
+            self.cache.close()
+
+    async def aclose(self):
+        """비동기 커넥션 풀까지 포함해 모든 리소스를 닫습니다."""
+        with self._clients_lock:
+            self._async_clients.clear()
+            async_http_client, self._async_http_client = self._async_http_client, None
+        if async_http_client is not None:
+            await async_http_client.aclose()
+        self.close()
+
+    def _cached(self, kind, key, produce):
+        """캐시에 있으면 반환하고, 없으면 produce()를 호출해 저장"""
+        if not self.cache:
+            return produce()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = produce()
+        self.cache.put(key, kind, result)
+        return result
+
+    async def _cached_async(self, kind, key, produce):
+        """_cached의 비동기 버전 (produce는 코루틴을 반환, 캐시 조회/저장은 스레드에서 실행)"""
+        if not self.cache:
+            return await produce()
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return cached
+        result = await produce()
+        await asyncio.to_thread(self.cache.put, key, kind, result)
+        return result
 
     def read_txt_file(self, file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -54,130 +178,39 @@ class NewsConverter:
         
         return text.strip()
 
-    def extract_keywords(self, content):
+    def extract_keywords(self, content, api_key=None):
         """Extract keywords from content using Claude"""
-        prompt = f"""당신은 뉴스 기사에서 핵심 키워드를 추출하는 전문가입니다.
-        다음 기사에서 5-7개의 관련 키워드를 추출하여 해시태그 형식으로 반환해주세요.
-        
-        규칙:
-        1. 해시태그는 한글 스타일로 작성 (#키워드)
-        2. 각 해시태그는 공백으로 구분
-        3. 주식 종목이 언급된 경우 반드시 포함
-        4. 가장 중요한 주제어 위주로 선정
-        5. 다른 텍스트나 설명 없이 해시태그만 반환
-        
-        예시 형식:
-        #키워드1 #키워드2 #키워드3 #키워드4 #키워드5
-        
-        Article: {content}"""
-        
-        message = self.client.messages.create(
-            model="claude-3-opus-20240229",
-            max_tokens=300,
-            temperature=0,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
+        key = cache_key('keywords', get_prompt('keywords').key, MODEL, content)
+        return self._cached('keywords', key, lambda: self._request_keywords(content, api_key))
+
+    def _request_keywords(self, content, api_key=None):
+        prompt = get_prompt('keywords')
+        message = self.get_client(api_key).messages.create(**prompt.request(MODEL, content=content))
+        return self.clean_response(message.content[0])
+
+    async def _request_keywords_async(self, content, api_key=None):
+        prompt = get_prompt('keywords')
+        message = await self.get_async_client(api_key).messages.create(**prompt.request(MODEL, content=content))
         return self.clean_response(message.content[0])
 
-    def generate_markdown_content(self, content):
+    def generate_markdown_content(self, content, api_key=None):
         """Generate markdown content using Claude"""
-        example = """💰 크라켄, 암호화폐 시장 점유율 확대 위해 혁신적인 P2P 결제앱 출시
-
-▶ 표결 현황:
-• "vote-a-rama" 새벽까지 지속, 종료 시점 불투명
-• 일출 전 최종 표결 가능성 있다고 언론 보도
-• 화요일부터 계속된 수정안 표결 과정
-
-▶ 통과 조건:
-• 상원 100명 중 통상 60명 찬성 필요하지만 "reconciliation" 절차로 과반수만 필요
-• 공화당 근소한 상원 장악, 민주당 강력 반대
-
-▶ 법안 내용과 비용:
-1. 2017년 트럼프 세금감면 연장
-2. 신규 세금감면 도입
-3. 국방·국경보안 지출 증가
-
-▶ 내부 갈등:
-• 일론 머스크 "미친 법안"이라 강력 비판, 신정당 창당 위협
-• 테슬라 $TSLA 보조금 철회 위협으로 응수"""
-
-        prompt = f"""당신은 뉴스 기사를 한국어 스타일의 마크다운 문서로 변환하는 전문가입니다.
-        아래의 형식과 스타일을 정확히 따라 변환해주세요.
-
-        필수 형식:
-        1. 제목 형식: 이모지 제목내용
-           예시: "💰 크라켄, 암호화폐 시장 점유율 확대 위해 혁신적인 P2P 결제앱 출시"
-           - 제목 시작에 내용을 잘 표현하는 이모지 하나만 사용
-           - 제목은 반드시 첫 줄에 위치
-           - 제목 다음에는 빈 줄 하나 추가
-           - 제목은 내용을 기반으로 독자의 관심을 끌 수 있게 작성
-           - 단순 사실 나열보다는 핵심 가치나 의미를 담아 작성
-
-        2. 섹션 구조:
-           - 각 주요 섹션은 ▶로 시작
-           - 섹션 제목은 명사형으로 끝남 (예: "현황:", "전망:", "영향:")
-           - 섹션 제목 뒤에는 반드시 콜론(:) 사용
-
-        3. 글머리 기호:
-           - 주요 사실/현황은 • 기호 사용
-           - 순차적 내용이나 상세 설명은 1. 2. 3. 번호 사용
-           - 인용구나 발언은 따옴표(" ") 사용
-
-        4. 문체와 톤:
-           - 객관적이고 명확한 문체 사용
-           - 문장은 간결하게, 되도록 1-2줄 이내로 작성
-           - 전문 용어는 가능한 한글로 풀어서 설명
-           - 숫자나 통계는 단위와 함께 명확히 표기
-
-        5. 구조화:
-           - 중요도와 시간 순서를 고려한 섹션 배치
-           - 관련 내용은 같은 섹션에 모아서 정리
-           - 섹션 간 적절한 줄바꿈으로 가독성 확보
-           - 마지막에는 향후 전망이나 결론 포함
-
-        6. 특별 규칙:
-           - 주식 종목명이 나오면 반드시 종목명 뒤에 $심볼 표기
-           예: 테슬라 $TSLA, 애플 $AAPL
-           - 괄호 사용하지 않고 공백으로 구분
-
-        예시 형식:
-        {example}
-
-        입력 데이터:
-        제목: {content['title']}
-        설명: {content['description']}
-        본문: {content['content']}
-
-        제목은 반드시 첫 줄에 위치하고, 내용을 잘 표현하는 이모지 하나를 시작에 넣어주세요.
-        제목은 단순히 사실을 나열하는 것이 아니라, 내용의 핵심 가치나 의미를 담아 독자의 관심을 끌 수 있게 작성해주세요.
-        
-        이모지 선택 가이드:
-        - 금융/투자 관련: 💰 💵 📈 📊
-        - 기술/혁신 관련: 🚀 💡 🔧 🌟
-        - 정책/규제 관련: ⚖️ 📜 🏛️ 🔨
-        - 갈등/경쟁 관련: 🔥 ⚔️ 🎯 🎲
-        - 협력/계약 관련: 🤝 📝 🎊 🌈
-        - 성장/발전 관련: 🌱 🎉 💪 ⭐
-        """
-        
-        message = self.client.messages.create(
-            model="claude-3-opus-20240229",
-            max_tokens=2000,
-            temperature=0,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-        response = self.clean_response(message.content[0])
-        
+        key = cache_key('markdown', get_prompt('markdown').key, MODEL,
+                        content['title'], content['description'], content['content'])
+        return self._cached('markdown', key, lambda: self._request_markdown(content, api_key))
+
+    def _request_markdown(self, content, api_key=None):
+        prompt = get_prompt('markdown')
+        message = self.get_client(api_key).messages.create(**prompt.request(MODEL, **self._article_fields(content)))
+        return self._format_markdown(self.clean_response(message.content[0]), content)
+
+    async def _request_markdown_async(self, content, api_key=None):
+        prompt = get_prompt('markdown')
+        message = await self.get_async_client(api_key).messages.create(**prompt.request(MODEL, **self._article_fields(content)))
+        return self._format_markdown(self.clean_response(message.content[0]), content)
+
+    def _format_markdown(self, response, content):
+        """Normalize the title line and stock symbol format"""
         # Ensure the title is properly formatted
         if not response.startswith(('💰', '💵', '📈', '📊', '🚀', '💡', '🔧', '🌟', '⚖️', '📜', '🏛️', '🔨', '🔥', '⚔️', '🎯', '🎲', '🤝', '📝', '🎊', '🌈', '🌱', '🎉', '💪', '⭐')):
             # Get the first line as title
@@ -199,59 +232,311 @@ class NewsConverter:
         
         return response
 
-    def convert_to_markdown(self, data):
+    def _split_combined_response(self, response):
+        """Split a combined response into (markdown, hashtags); hashtags is '' if missing"""
+        match = COMBINED_RESPONSE_PATTERN.search(response)
+        if match:
+            return match.group('markdown'), match.group('hashtags')
+        
+        # 태그가 빠진 경우: 마지막 해시태그 줄을 분리
+        text = re.sub(r'</?(markdown|hashtags)>', '', response).strip()
+        lines = text.split('\n')
+        if lines and HASHTAG_LINE_PATTERN.match(lines[-1]):
+            return '\n'.join(lines[:-1]).strip(), lines[-1].strip()
+        return text, ''
+
+    def _request_combined(self, content, api_key=None):
+        prompt = get_prompt('combined')
+        message = self.get_client(api_key).messages.create(**prompt.request(MODEL, **self._article_fields(content)))
+        return self._finish_combined(self.clean_response(message.content[0]), content, api_key)
+
+    def _finish_combined(self, response, content, api_key=None):
+        markdown_content, keywords = self._split_combined_response(response)
+        if not keywords:
+            keywords = self.extract_keywords(self._keywords_input(content), api_key=api_key)
+        return f"{self._format_markdown(markdown_content, content)}\n\n{keywords}"
+
+    async def _request_combined_async(self, content, api_key=None):
+        prompt = get_prompt('combined')
+        message = await self.get_async_client(api_key).messages.create(**prompt.request(MODEL, **self._article_fields(content)))
+        markdown_content, keywords = self._split_combined_response(self.clean_response(message.content[0]))
+        if not keywords:
+            keywords = await self.extract_keywords_async(self._keywords_input(content), api_key=api_key)
+        return f"{self._format_markdown(markdown_content, content)}\n\n{keywords}"
+
+    def _article_fields(self, content):
+        return {
+            'title': content['title'],
+            'description': content['description'],
+            'content': content['content']
+        }
+
+    def _keywords_input(self, data):
+        return f"{data['title']}\n{data['description']}\n{data['content']}"
+
+    def _combined_cache_key(self, data):
+        return cache_key('combined', get_prompt('combined').key, MODEL,
+                         data['title'], data['description'], data['content'])
+
+    def batch_requests(self, data, mode=None):
+        """
+        Message Batches API로 보낼 (kind, cache key, params) 목록을 반환합니다.
+        
+        params는 동기 호출과 같은 프롬프트로 만든 messages.create 인자이며,
+        cache key는 결과를 변환 캐시에 저장할 때 사용합니다.
+        """
+        if (mode or self.mode) == 'combined':
+            return [('combined', self._combined_cache_key(data),
+                     get_prompt('combined').request(MODEL, **self._article_fields(data)))]
+        
+        keywords_input = self._keywords_input(data)
+        return [
+            ('markdown',
+             cache_key('markdown', get_prompt('markdown').key, MODEL,
+                       data['title'], data['description'], data['content']),
+             get_prompt('markdown').request(MODEL, **self._article_fields(data))),
+            ('keywords',
+             cache_key('keywords', get_prompt('keywords').key, MODEL, keywords_input),
+             get_prompt('keywords').request(MODEL, content=keywords_input)),
+        ]
+
+    def batch_output(self, kind, message, data, api_key=None):
+        """배치 결과 메시지를 동기 호출과 같은 형태로 후처리합니다."""
+        response = self.clean_response(message.content[0])
+        if kind == 'markdown':
+            return self._format_markdown(response, data)
+        if kind == 'combined':
+            return self._finish_combined(response, data, api_key)
+        return response
+
+    def convert_to_markdown(self, data, api_key=None, mode=None):
         """Convert parsed data to markdown format"""
+        if (mode or self.mode) == 'combined':
+            return self._cached('combined', self._combined_cache_key(data),
+                                lambda: self._request_combined(data, api_key))
+        
         # Generate markdown content
-        markdown_content = self.generate_markdown_content(data)
+        markdown_content = self.generate_markdown_content(data, api_key=api_key)
         
         # Extract keywords
-        keywords = self.extract_keywords(f"{data['title']}\n{data['description']}\n{data['content']}")
+        keywords = self.extract_keywords(self._keywords_input(data), api_key=api_key)
         
         # Combine content and keywords with proper spacing
         final_content = f"{markdown_content}\n\n{keywords}"
         
         return final_content
 
-    def process_file(self, file_path):
-        """Process a single TXT file"""
-        print(f"Processing {file_path}...")
+    async def generate_markdown_content_async(self, content, api_key=None):
+        """Generate markdown content using the async Claude client"""
+        key = cache_key('markdown', get_prompt('markdown').key, MODEL,
+                        content['title'], content['description'], content['content'])
+        return await self._cached_async('markdown', key, lambda: self._request_markdown_async(content, api_key))
+
+    async def extract_keywords_async(self, content, api_key=None):
+        """Extract keywords using the async Claude client"""
+        key = cache_key('keywords', get_prompt('keywords').key, MODEL, content)
+        return await self._cached_async('keywords', key, lambda: self._request_keywords_async(content, api_key))
+
+    async def convert_to_markdown_async(self, data, api_key=None, mode=None):
+        """Convert parsed data to markdown, running both Claude calls concurrently"""
+        if (mode or self.mode) == 'combined':
+            return await self._cached_async('combined', self._combined_cache_key(data),
+                                            lambda: self._request_combined_async(data, api_key))
+        
+        markdown_task = asyncio.create_task(self.generate_markdown_content_async(data, api_key=api_key))
+        keywords_task = asyncio.create_task(self.extract_keywords_async(self._keywords_input(data), api_key=api_key))
+        
+        try:
+            markdown_content, keywords = await asyncio.gather(markdown_task, keywords_task)
+        except BaseException:
+            # 한쪽이 실패하거나 요청이 취소되면 나머지 호출도 취소
+            for task in (markdown_task, keywords_task):
+                task.cancel()
+            await asyncio.gather(markdown_task, keywords_task, return_exceptions=True)
+            raise
+        
+        return f"{markdown_content}\n\n{keywords}"
+
+    async def convert_stream_async(self, data, api_key=None, mode=None):
+        """
+        Stream the conversion as (event, text) tuples.
+        
+        Yields ('markdown_delta', text) while Claude generates the document,
+        then ('markdown', formatted), ('keywords', hashtags) and finally
+        ('converted', full document). Keyword extraction runs concurrently
+        with the markdown stream. Closing the generator cancels both calls.
+        
+        In combined mode the single call is not streamed; the formatted
+        document arrives as one 'markdown_delta'.
+        """
+        if (mode or self.mode) == 'combined':
+            converted = await self.convert_to_markdown_async(data, api_key=api_key, mode='combined')
+            markdown_content, _, keywords = converted.rpartition('\n\n')
+            yield 'markdown_delta', markdown_content
+            yield 'markdown', markdown_content
+            yield 'keywords', keywords
+            yield 'converted', converted
+            return
+        
+        keywords_task = asyncio.create_task(self.extract_keywords_async(self._keywords_input(data), api_key=api_key))
+        try:
+            prompt = get_prompt('markdown')
+            key = cache_key('markdown', prompt.key, MODEL,
+                            data['title'], data['description'], data['content'])
+            markdown_content = await asyncio.to_thread(self.cache.get, key) if self.cache else None
+            
+            if markdown_content is None:
+                chunks = []
+                async with self.get_async_client(api_key).messages.stream(
+                        **prompt.request(MODEL, **self._article_fields(data))) as stream:
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+                        yield 'markdown_delta', text
+                markdown_content = self._format_markdown(self.clean_response(''.join(chunks)), data)
+                if self.cache:
+                    await asyncio.to_thread(self.cache.put, key, 'markdown', markdown_content)
+            else:
+                yield 'markdown_delta', markdown_content
+            
+            yield 'markdown', markdown_content
+            keywords = await keywords_task
+            yield 'keywords', keywords
+            yield 'converted', f"{markdown_content}\n\n{keywords}"
+        finally:
+            if not keywords_task.done():
+                keywords_task.cancel()
+                await asyncio.gather(keywords_task, return_exceptions=True)
+
+    def process_file(self, file_path, quiet=False):
+        """Process a single TXT file and return the output path"""
+        if not quiet:
+            print(f"Processing {file_path}...")
         data = self.read_txt_file(file_path)
         markdown_content = self.convert_to_markdown(data)
         
         # Create output filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_filename = f"{Path(file_path).stem}_{timestamp}.md"
-        output_path = self.output_dir / output_filename
+        output_path = self.output_path_for(file_path)
+        self.write_output(output_path, markdown_content)
         
-        # Save markdown content
-        with open(output_path, 'w', encoding='utf-8') as f:
+        if not quiet:
+            print(f"Created {output_path}")
+        return output_path
+
+    def output_path_for(self, file_path):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return self.output_dir / f"{Path(file_path).stem}_{timestamp}.md"
+
+    def write_output(self, output_path, markdown_content):
+        """Save markdown content (임시 파일에 쓴 뒤 교체해 중단 시 반쪽 파일이 남지 않도록 함)"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix('.md.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             f.write(markdown_content)
-        
-        print(f"Created {output_path}")
+        os.replace(tmp_path, output_path)
 
-    def process_directory(self, directory_path):
-        """Process all TXT files in a directory"""
+    def process_directory(self, directory_path, workers=CONVERTER_WORKERS, resume=True):
+        """
+        Process all TXT files in a directory using a worker pool.
+        
+        진행 상황은 출력 디렉토리의 매니페스트에 기록되며, resume이 True이면
+        이전 실행에서 완료된 파일(같은 내용 해시)은 건너뜁니다.
+        
+        Returns:
+            {'converted': n, 'skipped': n, 'failed': n}
+        """
         directory = Path(directory_path)
-        for txt_file in directory.glob('*.txt'):
-            self.process_file(txt_file)
+        manifest = ConversionManifest.for_output_dir(self.output_dir)
+        summary = {'converted': 0, 'skipped': 0, 'failed': 0}
+        
+        pending = []
+        for txt_file in sorted(directory.glob('*.txt')):
+            input_hash = file_digest(txt_file)
+            if resume and manifest.completed_output(input_hash):
+                summary['skipped'] += 1
+                continue
+            pending.append((txt_file, input_hash))
+        
+        print(
+            f"{len(pending)} file(s) to convert, {summary['skipped']} already done "
+            f"(workers={workers}, manifest={self.output_dir / MANIFEST_FILENAME})"
+        )
+        
+        def convert(txt_file, input_hash):
+            try:
+                output_path = self.process_file(txt_file, quiet=True)
+            except Exception as e:
+                manifest.mark_failed(input_hash, txt_file, str(e))
+                raise
+            manifest.mark_done(input_hash, txt_file, output_path)
+            return output_path
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        try:
+            futures = {executor.submit(convert, *item): item[0] for item in pending}
+            with tqdm(total=len(pending), unit='file', dynamic_ncols=True) as progress:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        summary['converted'] += 1
+                    except Exception as e:
+                        summary['failed'] += 1
+                        progress.write(f"Failed {futures[future]}: {e}")
+                    progress.set_postfix(failed=summary['failed'], refresh=False)
+                    progress.update(1)
+        finally:
+            # Ctrl+C 등으로 중단되면 대기 중인 작업은 취소 (완료분은 매니페스트에 남음)
+            executor.shutdown(wait=True, cancel_futures=True)
+            manifest.close()
+        
+        print(
+            f"Done: {summary['converted']} converted, {summary['skipped']} skipped, "
+            f"{summary['failed']} failed"
+        )
+        return summary
 
 def main():
+    import argparse
     import sys
     
-    if len(sys.argv) != 2:
-        print("Usage: python converter.py <txt_file_or_directory>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        prog='python -m app.services.converter',
+        description='Convert extracted TXT articles to markdown'
+    )
+    parser.add_argument('path', help='TXT file or directory of TXT files')
+    parser.add_argument('--output-dir', default='converted_articles', help='Directory for .md output')
+    parser.add_argument('--workers', type=int, default=CONVERTER_WORKERS, help='Concurrent conversions for directories')
+    parser.add_argument('--mode', choices=CONVERSION_MODES, default=CONVERSION_MODE, help='Conversion mode')
+    parser.add_argument('--no-resume', action='store_true', help='Reconvert files already recorded as done')
+    parser.add_argument('--batch', action='store_true',
+                        help='Convert a directory via the Message Batches API (submit, poll, write outputs)')
+    parser.add_argument('--poll-interval', type=float, default=MESSAGE_BATCH_POLL_INTERVAL,
+                        help='Initial batch status poll interval in seconds (doubles up to MESSAGE_BATCH_MAX_POLL_INTERVAL)')
+    args = parser.parse_args()
     
-    path = sys.argv[1]
-    converter = NewsConverter()
+    path = args.path
+    converter = NewsConverter(output_dir=args.output_dir, mode=args.mode)
+    converter.get_client()  # API 키 확인
     
-    if os.path.isfile(path):
+    if args.batch:
+        if not os.path.isdir(path):
+            print(f"Error: --batch requires a directory, got {path}")
+            sys.exit(1)
+        from .batch_converter import BatchConverter
+        summary = BatchConverter(converter, poll_interval=args.poll_interval).run(
+            path, resume=not args.no_resume, mode=args.mode
+        )
+        if summary['failed']:
+            sys.exit(1)
+    elif os.path.isfile(path):
         converter.process_file(path)
     elif os.path.isdir(path):
-        converter.process_directory(path)
+        summary = converter.process_directory(path, workers=args.workers, resume=not args.no_resume)
+        if summary['failed']:
+            sys.exit(1)
     else:
         print(f"Error: {path} is not a valid file or directory")
         sys.exit(1)
+    converter.close()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
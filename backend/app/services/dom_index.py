@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# 태그별로 모아 두는 요소 (문서 순서)
+INDEXED_TAGS = ('article', 'h1', 'title', 'meta')
+
+# class 토큰이 정확히 일치하는 첫 요소를 기록할 이름
+CLASS_TOKENS = ('article', 'articlePage')
+
+# 소문자 class 문자열에 부분 문자열이 하나라도 포함된 첫 요소를 기록할 그룹
+CLASS_SUBSTRINGS = {
+    'article': ('article',),
+    'author': ('author',),
+    'date': ('date', 'time'),
+}
+
+
+@dataclass
+class DomIndex:
+    """한 번의 순회로 만든 추출용 인덱스 (모든 값은 문서 순서상 첫 요소 기준)"""
+    tags: Dict[str, List[Any]] = field(default_factory=lambda: {name: [] for name in INDEXED_TAGS})
+    class_tokens: Dict[str, Any] = field(default_factory=dict)
+    class_substrings: Dict[str, Any] = field(default_factory=dict)
+    meta_by_name: Dict[str, Any] = field(default_factory=dict)
+    meta_by_property: Dict[str, Any] = field(default_factory=dict)
+
+    def first(self, tag: str) -> Optional[Any]:
+        elements = self.tags.get(tag)
+        return elements[0] if elements else None
+
+
+def build_index(parser: Any, doc: Any) -> DomIndex:
+    """
+    문서를 한 번만 순회하며 DomIndex 생성
+
+    Args:
+        parser: html_parsers의 파서 백엔드
+        doc: parser.parse()가 만든 문서
+    """
+    index = DomIndex()
+    tags = index.tags
+    class_tokens = index.class_tokens
+    class_substrings = index.class_substrings
+    pending_tokens = set(CLASS_TOKENS)
+    pending_substrings = dict(CLASS_SUBSTRINGS)
+
+    for element, tag, classes in parser.iter_elements(doc):
+        bucket = tags.get(tag)
+        if bucket is not None:
+            bucket.append(element)
+            if tag == 'meta':
+                name = parser.get(element, 'name', None)
+                if name is not None and name not in index.meta_by_name:
+                    index.meta_by_name[name] = element
+                prop = parser.get(element, 'property', None)
+                if prop is not None and prop not in index.meta_by_property:
+                    index.meta_by_property[prop] = element
+
+        if not classes or not (pending_tokens or pending_substrings):
+            continue
+        if pending_tokens:
+            for token in classes.split():
+                if token in pending_tokens:
+                    class_tokens[token] = element
+                    pending_tokens.discard(token)
+        if pending_substrings:
+            lowered = classes.lower()
+            for group, needles in list(pending_substrings.items()):
+                if any(needle in lowered for needle in needles):
+                    class_substrings[group] = element
+                    del pending_substrings[group]
+
+    return index
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import copy
+import threading
+import time
+
+from ..core.config import EXTRACTION_CACHE_TTL, EXTRACTION_CACHE_MAX_ENTRIES
+
+# 캐시 키에서 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'spm', 'smid', 'sr_share', '_ga', '_gl'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    캐시 키용 정규화 URL 생성
+    
+    스킴/호스트 소문자화, 기본 포트·프래그먼트·추적 파라미터·끝 슬래시 제거,
+    남은 쿼리 파라미터 정렬을 수행합니다.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+    
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+    
+    path = parts.path.rstrip('/')
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+@dataclass
+class CacheEntry:
+    data: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """조건부 GET 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ExtractionCache:
+    def __init__(self, ttl: float = EXTRACTION_CACHE_TTL, max_entries: int = EXTRACTION_CACHE_MAX_ENTRIES):
+        """
+        URL 단위 추출 결과 캐시 (TTL + LRU)
+        
+        TTL이 지난 항목도 ETag/Last-Modified가 있으면 재검증용으로 남겨 둡니다.
+        
+        Args:
+            ttl: 재검증 없이 사용할 수 있는 시간 (초)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """캐시 항목 조회. 재검증도 불가능한 만료 항목은 제거합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if not entry.is_fresh(self.ttl) and not (entry.etag or entry.last_modified):
+                del self._entries[key]
+                self.misses += 1
+                return None
+            if entry.is_fresh(self.ttl):
+                self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, data: Dict[str, Any], etag: Optional[str], last_modified: Optional[str]) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(copy.deepcopy(data), etag, last_modified, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key: str) -> None:
+        """304 응답을 받은 항목의 신선도 갱신"""
+        with self._lock:
+            self.revalidations += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
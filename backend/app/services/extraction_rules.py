@@ -0,0 +1,188 @@
+"""
+도메인별 추출 규칙
+
+규칙 파일(JSON)의 각 규칙은 도메인 목록과 기사 본문/제목/저자/날짜 선택자,
+본문에서 제외할 요소 선택자, 본문 문단을 나누는 방식(body)을 가집니다. 선택자는 로드 시 파서 백엔드에 맞게 한 번만
+컴파일되며, 규칙이 없는 도메인이나 선택자가 맞지 않는 항목은 기존 휴리스틱을 사용합니다.
+
+    {
+      "rules": [
+        {
+          "name": "naver-news",
+          "domains": ["n.news.naver.com"],
+          "article": "#dic_area",
+          "title": "h2#title_area",
+          "author": ".media_end_head_journalist_name",
+          "date": {"selector": ".media_end_head_info_datestamp_time", "attr": "data-date-time"},
+          "exclude": [".end_photo_org", ".img_desc"],
+          "body": "br"
+        }
+      ]
+    }
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 텍스트(또는 속성값)를 추출하는 규칙 필드
+TEXT_FIELDS = ('title', 'author', 'date')
+
+# 본문 문단 추출 방식
+# - paragraphs: 본문 안의 p/h2/h3/blockquote 요소 (기본값)
+# - br: 본문 전체 텍스트를 <br>과 블록 요소 경계로 만든 빈 줄에서 나눔 (<p> 없이 <br>로 문단을 나누는 사이트)
+BODY_MODES = ('paragraphs', 'br')
+
+
+class ExtractionRule:
+    def __init__(self, name: str, domains: List[str], selectors: Dict[str, Tuple[Any, Optional[str]]],
+                 article: Optional[Any], exclude: List[Any], body: str = 'paragraphs'):
+        self.name = name
+        self.domains = domains
+        self.article = article
+        self.selectors = selectors
+        self.exclude = exclude
+        self.body = body
+
+    @classmethod
+    def compile(cls, spec: Dict[str, Any], parser: Any) -> 'ExtractionRule':
+        """규칙 정의(dict)를 파서 백엔드용 선택자로 컴파일"""
+        name = spec.get('name') or ','.join(spec.get('domains', []))
+        domains = [domain.lower().strip() for domain in spec.get('domains', []) if domain.strip()]
+        if not domains:
+            raise ValueError(f"Rule {name!r} has no domains")
+
+        selectors = {}
+        for field in TEXT_FIELDS:
+            value = spec.get(field)
+            if not value:
+                continue
+            if isinstance(value, str):
+                value = {'selector': value}
+            selectors[field] = (parser.compile_selector(value['selector']), value.get('attr'))
+
+        article = parser.compile_selector(spec['article']) if spec.get('article') else None
+        exclude = [parser.compile_selector(css) for css in spec.get('exclude', [])]
+        body = spec.get('body', 'paragraphs')
+        if body not in BODY_MODES:
+            raise ValueError(f"Rule {name!r} has unknown body mode {body!r}")
+        return cls(name, domains, selectors, article, exclude, body)
+
+
+class RuleRegistry:
+    def __init__(self, parser: Any, rules: Optional[List[ExtractionRule]] = None):
+        """
+        호스트 이름으로 규칙을 찾는 레지스트리 (규칙별 적중률 집계 포함)
+
+        Args:
+            parser: 선택자를 실행할 파서 백엔드
+            rules: 컴파일된 규칙 목록
+        """
+        self.parser = parser
+        self.rules = rules or []
+        self._by_host: Dict[str, ExtractionRule] = {}
+        for rule in self.rules:
+            for domain in rule.domains:
+                self._by_host.setdefault(domain, rule)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {
+            rule.name: {'pages': 0, 'article': 0, 'title': 0, 'author': 0, 'date': 0}
+            for rule in self.rules
+        }
+        self._unmatched_pages = 0
+
+    @classmethod
+    def load(cls, path: str, parser: Any) -> 'RuleRegistry':
+        """규칙 파일 로드 (파일이 없으면 빈 레지스트리, 잘못된 규칙은 건너뜀)"""
+        if not path or not os.path.exists(path):
+            return cls(parser)
+        with open(path, encoding='utf-8') as f:
+            specs = json.load(f).get('rules', [])
+
+        rules = []
+        for spec in specs:
+            try:
+                rules.append(ExtractionRule.compile(spec, parser))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"추출 규칙 로드 실패 ({spec.get('name', '?')}): {str(e)}")
+        logger.info(f"추출 규칙 {len(rules)}개 로드됨: {path}")
+        return cls(parser, rules)
+
+    def lookup(self, url: str) -> Optional[ExtractionRule]:
+        """
+        URL 호스트에 해당하는 규칙
+
+        정확한 호스트 이름부터 찾고, 없으면 왼쪽 레이블을 하나씩 떼어
+        상위 도메인을 찾습니다 (kr.investing.com → investing.com).
+        """
+        host = (urlsplit(url).hostname or '').lower()
+        while host:
+            rule = self._by_host.get(host)
+            if rule is not None:
+                return rule
+            _, dot, host = host.partition('.')
+            if not dot or '.' not in host:
+                break
+        return None
+
+    def apply(self, rule: Optional[ExtractionRule], doc: Any) -> Dict[str, Any]:
+        """
+        규칙 선택자 실행
+
+        Returns:
+            찾은 항목만 담은 dict ('article'은 요소, 'title'/'author'/'date'는 문자열)
+        """
+        if rule is None:
+            with self._lock:
+                self._unmatched_pages += 1
+            return {}
+
+        parser = self.parser
+        found: Dict[str, Any] = {}
+        if rule.article is not None:
+            matches = parser.select(rule.article, doc)
+            if matches:
+                found['article'] = matches[0]
+
+        for field, (selector, attr) in rule.selectors.items():
+            for element in parser.select(selector, doc):
+                value = parser.get(element, attr, '') if attr else parser.text(element)
+                value = value.strip()
+                if value:
+                    found[field] = value
+                    break
+
+        with self._lock:
+            stats = self._stats[rule.name]
+            stats['pages'] += 1
+            for field in found:
+                stats[field] += 1
+        return found
+
+    def remove_excluded(self, rule: Optional[ExtractionRule], article: Any) -> None:
+        """본문 요소에서 규칙의 제외 선택자에 맞는 요소 제거"""
+        if rule is None:
+            return
+        for selector in rule.exclude:
+            for element in self.parser.select(selector, article):
+                self.parser.remove(element)
+
+    def stats(self) -> Dict[str, Any]:
+        """규칙별 적용 페이지 수와 항목별 적중률"""
+        with self._lock:
+            rules = []
+            for name, counts in self._stats.items():
+                pages = counts['pages']
+                rules.append({
+                    'name': name,
+                    'pages': pages,
+                    'hit_rates': {
+                        field: round(counts[field] / pages, 3) if pages else None
+                        for field in ('article',) + TEXT_FIELDS
+                    }
+                })
+            return {'rules': rules, 'unmatched_pages': self._unmatched_pages}
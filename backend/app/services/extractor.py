@@ -1,35 +1,67 @@
 import requests
-from bs4 import BeautifulSoup, Tag
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
+import asyncio
+import copy
+import httpx
 import logging
+import re
 import time
 import os
 
+from ..core.config import (
+    HTML_PARSER_BACKEND, EXTRACTION_RULES_PATH, ADAPTIVE_FETCH_ENABLED, FETCH_ESCALATION_MIN_TEXT_CHARS
+)
+from .browser_pool import ChromeDriverPool, get_browser_pool
+from .dom_index import DomIndex, build_index
+from .extraction_cache import ExtractionCache, canonicalize_url
+from .extraction_rules import ExtractionRule, RuleRegistry
+from .fetch_tiers import FetchTierMemory
+from .html_parsers import get_parser_backend
+from .http_client import fetch_page
+from .page_download import CHUNK_SIZE, check_response_headers, read_capped, sniff_charset
+
+ARTICLE_NOT_FOUND = "기사 본문을 찾을 수 없습니다"
+
+# 'br' 본문 방식에서 문단을 나누는 빈 줄
+BLANK_LINE_PATTERN = re.compile(r'\n\s*\n')
+
 class WebExtractor:
-    def __init__(self, use_selenium: bool = False, save_to_file: bool = True):
+    def __init__(self, use_selenium: bool = False, save_to_file: bool = True,
+                 cache: Optional[ExtractionCache] = None, parser: Optional[str] = None,
+                 rules_path: Optional[str] = None, adaptive: Optional[bool] = None):
         """
         웹 콘텐츠 추출기 초기화
         
         Args:
             use_selenium: Selenium 사용 여부
             save_to_file: 결과를 파일로 저장할지 여부
+            cache: URL 추출 결과 캐시 (없으면 새로 생성)
+            parser: HTML 파서 백엔드 이름 (없으면 HTML_PARSER_BACKEND 설정 사용)
+            rules_path: 도메인별 추출 규칙 파일 (없으면 EXTRACTION_RULES_PATH 설정 사용)
+            adaptive: HTTP 결과가 부족하면 브라우저로 승격할지 여부
+                      (없으면 ADAPTIVE_FETCH_ENABLED 설정 사용, use_selenium이면 무시)
         """
         self.use_selenium = use_selenium
         self.save_to_file = save_to_file
-        self.driver = None
+        self.cache = cache if cache is not None else ExtractionCache()
+        self.parser = get_parser_backend(parser or HTML_PARSER_BACKEND)
+        self.setup_logging()
+        self.rules_path = rules_path or EXTRACTION_RULES_PATH
+        self.rules = RuleRegistry.load(self.rules_path, self.parser)
+        # lxml 트리에서 본문을 찾지 못한 문서를 다시 추출할 html.parser 추출기 (처음 필요할 때 생성)
+        self._fallback: Optional['WebExtractor'] = None
+        self.browser_pool: Optional[ChromeDriverPool] = None
+        if adaptive is None:
+            adaptive = ADAPTIVE_FETCH_ENABLED
+        self.tiers = FetchTierMemory() if adaptive and not use_selenium else None
         self.session = requests.Session()
         self.ua = UserAgent()
-        self.setup_logging()
         
         if use_selenium:
             self.setup_selenium()
@@ -43,15 +75,9 @@ class WebExtractor:
         self.logger = logging.getLogger(__name__)
     
     def setup_selenium(self) -> None:
-        """Selenium 웹드라이버 설정"""
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument(f'user-agent={self.ua.random}')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        """Selenium 웹드라이버 설정 (프로세스 공유 브라우저 풀 사용)"""
+        self.browser_pool = get_browser_pool(user_agent=lambda: self.ua.random)
+        self.browser_pool.warm(1)
     
     def extract_data(self, url: str) -> Dict[str, Any]:
         """
@@ -68,6 +94,8 @@ class WebExtractor:
             
             if self.use_selenium:
                 data = self._extract_with_selenium(url)
+            elif self.tiers is not None:
+                data = self._extract_adaptive(url)
             else:
                 data = self._extract_with_requests(url)
             
@@ -86,76 +114,318 @@ class WebExtractor:
             self.logger.error(f"데이터 추출 중 오류 발생: {str(e)}")
             return self._error_response(url, str(e))
     
+    async def extract_data_async(self, url: str) -> Dict[str, Any]:
+        """
+        URL에서 데이터 추출 (비동기)
+        
+        공유 비동기 HTTP 클라이언트로 페이지를 받아오므로 이벤트 루프를 막지 않습니다.
+        Selenium 모드와 HTML 파싱은 스레드에서 실행됩니다.
+        
+        Args:
+            url: 추출할 웹 페이지 URL
+            
+        Returns:
+            추출된 데이터 딕셔너리
+        """
+        try:
+            self.logger.info(f"페이지 로딩 중: {url}")
+            
+            if self.use_selenium:
+                data = await asyncio.to_thread(self._extract_with_selenium, url)
+            elif self.tiers is not None:
+                data = await self._extract_adaptive_async(url)
+            else:
+                data = await self._extract_with_httpx(url)
+            
+            if self.save_to_file and data['success']:
+                self._save_to_file(data)
+            
+            return data
+            
+        except (TimeoutException, httpx.TimeoutException):
+            self.logger.error("페이지 로딩 시간 초과")
+            return self._error_response(url, "페이지 로딩 시간 초과")
+        except WebDriverException as e:
+            self.logger.error(f"웹드라이버 오류: {str(e)}")
+            return self._error_response(url, f"웹드라이버 오류: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"데이터 추출 중 오류 발생: {str(e)}")
+            return self._error_response(url, str(e))
+    
+    def _extract_adaptive(self, url: str) -> Dict[str, Any]:
+        """
+        적응형 추출 (HTTP 우선, 필요할 때만 브라우저)
+        
+        브라우저가 필요했던 도메인은 처음부터 브라우저로 가져오고, 그 외에는
+        HTTP 결과가 부족할 때만 브라우저로 승격합니다.
+        """
+        cached = self._fresh_cached(url)
+        if cached is not None:
+            return cached
+        
+        direct = self.tiers.prefer_browser(url)
+        if direct:
+            data = self._try_browser(url)
+            if data is not None:
+                self.tiers.record_browser_direct()
+                return data
+        
+        data = self._extract_with_requests(url)
+        if not self._needs_browser(data):
+            self.tiers.record_http(url)
+            return data
+        if direct:
+            # 이번 요청에서 이미 브라우저가 실패함
+            return data
+        return self._escalated(url, data, self._try_browser(url))
+    
+    async def _extract_adaptive_async(self, url: str) -> Dict[str, Any]:
+        """_extract_adaptive의 비동기 버전 (브라우저 단계는 스레드에서 실행)"""
+        cached = self._fresh_cached(url)
+        if cached is not None:
+            return cached
+        
+        direct = self.tiers.prefer_browser(url)
+        if direct:
+            data = await asyncio.to_thread(self._try_browser, url)
+            if data is not None:
+                self.tiers.record_browser_direct()
+                return data
+        
+        data = await self._extract_with_httpx(url)
+        if not self._needs_browser(data):
+            self.tiers.record_http(url)
+            return data
+        if direct:
+            return data
+        return self._escalated(url, data, await asyncio.to_thread(self._try_browser, url))
+    
+    def _fresh_cached(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        신선한 캐시 결과 (없으면 None)
+        
+        캐시 적중은 어느 단계가 필요한지 알려주지 않으므로 도메인 기록을 바꾸지 않도록
+        단계 선택 전에 확인합니다.
+        """
+        entry = self.cache.get(canonicalize_url(url))
+        if entry and entry.is_fresh(self.cache.ttl):
+            return self._from_cache(entry.data, url)
+        return None
+    
+    def _needs_browser(self, data: Dict[str, Any]) -> bool:
+        """본문을 찾지 못했거나 본문이 너무 짧은 결과인지 확인"""
+        if not data['success']:
+            return data.get('error') == ARTICLE_NOT_FOUND
+        return len(data['content']['text']) < FETCH_ESCALATION_MIN_TEXT_CHARS
+    
+    def _try_browser(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        브라우저 단계 추출
+        
+        브라우저 풀은 처음 필요할 때 띄웁니다. 브라우저를 띄우지 못하면 한동안 모든
+        도메인에서 브라우저 단계를 건너뛰고, 결과가 여전히 부족하면 도메인 점수를
+        낮춥니다. 두 경우 모두 None을 반환합니다 (HTTP 결과 사용).
+        """
+        if not self.tiers.browser_allowed(url):
+            return None
+        if self.browser_pool is None:
+            try:
+                self.setup_selenium()
+            except Exception as e:
+                self.logger.warning(f"브라우저를 시작하지 못했습니다: {str(e)}")
+                self.browser_pool = None
+                self.tiers.record_browser_unavailable()
+                return None
+        
+        try:
+            data = self._extract_with_selenium(url)
+        except Exception as e:
+            self.logger.warning(f"브라우저 단계 실패: {url} ({str(e)})")
+            self.tiers.record_browser_failure(url)
+            return None
+        
+        if self._needs_browser(data):
+            self.tiers.record_browser_failure(url)
+            return None
+        return data
+    
+    def _escalated(self, url: str, data: Dict[str, Any], browser_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """승격 결과 처리 (브라우저가 성공하면 도메인 기록과 캐시에 반영)"""
+        if browser_data is None:
+            return data
+        self.logger.info(f"브라우저 단계로 승격: {url}")
+        self.tiers.record_escalation(url)
+        self.cache.put(canonicalize_url(url), browser_data, None, None)
+        return browser_data
+    
+    async def _extract_with_httpx(self, url: str) -> Dict[str, Any]:
+        """공유 httpx 클라이언트를 사용한 비동기 데이터 추출"""
+        cache_key = canonicalize_url(url)
+        entry = self.cache.get(cache_key)
+        if entry and entry.is_fresh(self.cache.ttl):
+            return self._from_cache(entry.data, url)
+        
+        headers = {'User-Agent': self.ua.random}
+        if entry:
+            headers.update(entry.validators())
+        response, body = await fetch_page(url, headers=headers)
+        if entry and response.status_code == 304:
+            self.cache.revalidated(cache_key)
+            return self._from_cache(entry.data, url)
+        response.raise_for_status()
+        
+        encoding = sniff_charset(response.headers, body)
+        data = await asyncio.to_thread(self._parse_html, body, url, encoding)
+        self._store_in_cache(cache_key, data, response.headers)
+        return data
+    
+    def _parse_html(self, html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """HTML 문자열(또는 encoding으로 인코딩된 바이트)을 파싱하여 콘텐츠 추출"""
+        data = self._parse_content(self.parser.parse(html, encoding), url)
+        if data['success']:
+            return data
+        return self._parse_fallback(html, url, encoding) or data
+    
+    def _parse_fallback(self, html: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        lxml 트리에서 본문을 찾지 못한 문서를 html.parser로 다시 추출
+        
+        libxml2는 깊이 제한(huge_tree에서 2048)보다 깊은 요소를 트리에 넣지 않으므로, 아주 깊게
+        중첩된 페이지는 lxml에서만 본문을 잃습니다. 다른 백엔드이거나 다시 추출해도 본문이
+        없으면 None을 반환합니다.
+        """
+        if self.parser.name != 'lxml':
+            return None
+        if self._fallback is None:
+            self._fallback = WebExtractor(save_to_file=False, cache=self.cache, parser='html.parser',
+                                          rules_path=self.rules_path, adaptive=False)
+        data = self._fallback._parse_html(html, url, encoding)
+        return data if data['success'] else None
+    
     def _extract_with_requests(self, url: str) -> Dict[str, Any]:
         """requests를 사용한 데이터 추출"""
+        cache_key = canonicalize_url(url)
+        entry = self.cache.get(cache_key)
+        if entry and entry.is_fresh(self.cache.ttl):
+            return self._from_cache(entry.data, url)
+        
         headers = {'User-Agent': self.ua.random}
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        if entry:
+            headers.update(entry.validators())
+        # 본문은 스트리밍으로 받아 FETCH_MAX_BYTES를 넘으면 중단
+        with self.session.get(url, headers=headers, timeout=30, stream=True) as response:
+            if entry and response.status_code == 304:
+                self.cache.revalidated(cache_key)
+                return self._from_cache(entry.data, url)
+            response.raise_for_status()
+            check_response_headers(response.headers)
+            body = read_capped(response.iter_content(CHUNK_SIZE))
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        return self._parse_content(soup, url)
+        data = self._parse_html(body, url, sniff_charset(response.headers, body))
+        self._store_in_cache(cache_key, data, response.headers)
+        return data
+    
+    def _store_in_cache(self, cache_key: str, data: Dict[str, Any], headers: Any) -> None:
+        """성공한 추출 결과를 검증자(ETag/Last-Modified)와 함께 캐시에 저장"""
+        if not data['success'] or 'no-store' in headers.get('Cache-Control', '').lower():
+            return
+        self.cache.put(cache_key, data, headers.get('ETag'), headers.get('Last-Modified'))
+    
+    def _from_cache(self, data: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """캐시된 추출 결과를 요청 URL 기준으로 복사"""
+        self.logger.info(f"캐시된 추출 결과 사용: {url}")
+        data = copy.deepcopy(data)
+        data['url'] = url
+        data['timestamp'] = datetime.now().isoformat()
+        return data
     
     def _extract_with_selenium(self, url: str) -> Dict[str, Any]:
         """Selenium을 사용한 데이터 추출"""
-        self.driver.get(url)
-        WebDriverWait(self.driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        with self.browser_pool.driver() as driver:
+            driver.get(url)
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            html = driver.page_source
         
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        return self._parse_content(soup, url)
+        return self._parse_html(html, url)
     
-    def _parse_content(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
-        """HTML 콘텐츠 파싱"""
-        article = self._find_article(soup)
-        if not article:
-            return self._error_response(url, "기사 본문을 찾을 수 없습니다")
+    def _parse_content(self, soup: Any, url: str) -> Dict[str, Any]:
+        """HTML 콘텐츠 파싱 (soup은 self.parser가 만든 문서)"""
+        # 도메인 규칙이 있으면 먼저 적용하고, 찾지 못한 항목만 휴리스틱 사용
+        rule = self.rules.lookup(url)
+        found = self.rules.apply(rule, soup)
+        index = build_index(self.parser, soup)
+        article = found.get('article')
+        if article is None:
+            article = self._find_article(index)
+        if article is None:
+            return self._error_response(url, ARTICLE_NOT_FOUND)
+        
+        title = found.get('title') or self._get_title(index)
+        metadata = self._get_metadata(index)
+        author = found.get('author') or self._get_author(index)
+        publish_date = found.get('date') or self._get_publish_date(index)
+        
+        # 제외 요소는 다른 항목을 모두 읽은 뒤 본문에서 제거
+        self.rules.remove_excluded(rule, article)
         
         return {
             'success': True,
             'url': url,
             'timestamp': datetime.now().isoformat(),
-            'title': self._get_title(soup),
-            'metadata': self._get_metadata(soup),
-            'content': self._get_content(article),
-            'author': self._get_author(soup),
-            'publish_date': self._get_publish_date(soup)
+            'title': title,
+            'metadata': metadata,
+            'content': self._get_content(article, rule),
+            'author': author,
+            'publish_date': publish_date
         }
     
-    def _find_article(self, soup: BeautifulSoup) -> Optional[Tag]:
+    def _find_article(self, index: DomIndex) -> Optional[Any]:
         """기사 본문 요소 찾기"""
-        return (soup.find('article') or 
-                soup.find(class_='article') or 
-                soup.find(class_='articlePage') or
-                soup.find(class_=lambda x: x and 'article' in str(x).lower()))
+        for candidate in (
+            index.first('article'),
+            index.class_tokens.get('article'),
+            index.class_tokens.get('articlePage'),
+            index.class_substrings.get('article')
+        ):
+            # lxml 요소는 자식이 없으면 거짓으로 평가되므로 None과 비교
+            if candidate is not None:
+                return candidate
+        return None
     
-    def _get_title(self, soup: BeautifulSoup) -> str:
+    def _get_title(self, index: DomIndex) -> str:
         """제목 추출"""
-        title = soup.find('h1')
-        if title:
-            return title.get_text().strip()
+        title = index.first('h1')
+        if title is not None:
+            return self.parser.text(title).strip()
         
-        title = soup.find('title')
-        return title.get_text().strip() if title else 'No Title'
+        title = index.first('title')
+        return self.parser.text(title).strip() if title is not None else 'No Title'
     
-    def _get_metadata(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _get_metadata(self, index: DomIndex) -> Dict[str, str]:
         """메타데이터 추출"""
         metadata: Dict[str, str] = {}
         meta_names = ['description', 'author', 'published_time', 'keywords']
         
-        for meta in soup.find_all('meta'):
-            name = meta.get('name', meta.get('property', '')).lower()
-            content = meta.get('content', '')
+        for meta in index.tags['meta']:
+            name = self.parser.get(meta, 'name', self.parser.get(meta, 'property', '')).lower()
+            content = self.parser.get(meta, 'content', '')
             if name in meta_names and content:
                 metadata[name] = content
         
         return metadata
     
-    def _get_content(self, article: Tag) -> Dict[str, Any]:
-        """본문 내용 추출"""
+    def _get_content(self, article: Any, rule: Optional[ExtractionRule] = None) -> Dict[str, Any]:
+        """본문 내용 추출 (규칙의 body가 'br'이면 <br>/블록 경계로 나눈 텍스트를 문단으로 사용)"""
+        if rule is not None and rule.body == 'br':
+            candidates = BLANK_LINE_PATTERN.split(self.parser.break_text(article))
+        else:
+            candidates = [self.parser.text(p) for p in self.parser.iter_tags(article, ['p', 'h2', 'h3', 'blockquote'])]
+        
         paragraphs = []
-        for p in article.find_all(['p', 'h2', 'h3', 'blockquote']):
-            text = p.get_text().strip()
+        for text in candidates:
+            text = text.strip()
             if text and not any(text.startswith(x) for x in ['Recommended', 'Related']):
                 paragraphs.append(text)
         
@@ -164,24 +434,25 @@ class WebExtractor:
             'paragraphs': paragraphs
         }
     
-    def _get_author(self, soup: BeautifulSoup) -> str:
+    def _get_author(self, index: DomIndex) -> str:
         """저자 정보 추출"""
-        author = soup.find('meta', {'name': 'author'})
-        if author:
-            return author.get('content', '')
+        author = index.meta_by_name.get('author')
+        if author is not None:
+            return self.parser.get(author, 'content', '')
         
-        author = soup.find(class_=lambda x: x and 'author' in str(x).lower())
-        return author.get_text().strip() if author else ''
+        author = index.class_substrings.get('author')
+        return self.parser.text(author).strip() if author is not None else ''
     
-    def _get_publish_date(self, soup: BeautifulSoup) -> str:
+    def _get_publish_date(self, index: DomIndex) -> str:
         """발행일 추출"""
-        date = (soup.find('meta', {'name': 'date'}) or 
-                soup.find('meta', {'property': 'article:published_time'}))
-        if date:
-            return date.get('content', '')
+        date = index.meta_by_name.get('date')
+        if date is None:
+            date = index.meta_by_property.get('article:published_time')
+        if date is not None:
+            return self.parser.get(date, 'content', '')
         
-        date = soup.find(class_=lambda x: x and ('date' in str(x).lower() or 'time' in str(x).lower()))
-        return date.get_text().strip() if date else ''
+        date = index.class_substrings.get('date')
+        return self.parser.text(date).strip() if date is not None else ''
     
     def _error_response(self, url: str, error: str) -> Dict[str, Any]:
         """에러 응답 생성"""
@@ -214,7 +485,7 @@ class WebExtractor:
         self.logger.info(f"텍스트 파일 저장됨: {txt_path}")
     
     def close(self) -> None:
-        """리소스 정리"""
-        if self.driver:
-            self.driver.quit()
-        self.session.close() 
\ No newline at end of file
+        """리소스 정리 (공유 브라우저 풀은 close_browser_pool로 종료)"""
+        self.session.close()
+        if self._fallback is not None:
+            self._fallback.close() 
\ No newline at end of file
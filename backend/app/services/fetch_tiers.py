@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+import threading
+import time
+
+from ..core.config import FETCH_TIER_HALF_LIFE, FETCH_TIER_MAX_DOMAINS, BROWSER_START_RETRY_INTERVAL
+
+# 브라우저 우선(점수 ≥ 임계값) 또는 HTTP 전용(점수 ≤ -임계값)으로 판단하는 최소 점수
+# (한 번 기록된 도메인은 반감기 한 번 동안 유지)
+BROWSER_SCORE_THRESHOLD = 0.5
+
+# 점수 절댓값 상한 (반복 기록된 도메인도 최대 log2(상한/임계값) 반감기 뒤에는 기본 동작으로 돌아감)
+BROWSER_SCORE_CAP = 4.0
+
+
+def domain_of(url: str) -> str:
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class FetchTierMemory:
+    def __init__(self, half_life: float = FETCH_TIER_HALF_LIFE, max_domains: int = FETCH_TIER_MAX_DOMAINS,
+                 start_retry_interval: float = BROWSER_START_RETRY_INTERVAL):
+        """
+        도메인별로 브라우저(Selenium) 단계가 필요했는지 기록 (시간에 따라 감쇠)
+
+        HTTP로 본문을 찾지 못해 브라우저로 승격될 때마다 도메인 점수가 1씩 오르고,
+        브라우저로도 본문을 얻지 못하면 1씩 내려갑니다. 점수는 half_life 초마다 절반으로
+        줄어듭니다. 점수가 임계값 이상인 도메인은 처음부터 브라우저로 가져오고, -임계값
+        이하인 도메인(본문이 원래 짧은 사이트 등)은 HTTP 결과가 부족해도 승격하지 않습니다.
+
+        브라우저를 띄우지 못하면 start_retry_interval 초 동안 모든 도메인에서 브라우저
+        단계를 건너뜁니다.
+
+        Args:
+            half_life: 점수 반감기 (초)
+            max_domains: 기억할 최대 도메인 수 (초과 시 오래 사용하지 않은 도메인부터 제거)
+            start_retry_interval: 브라우저 시작 실패 후 다시 시도하기까지의 시간 (초)
+        """
+        self.half_life = half_life
+        self.max_domains = max_domains
+        self.start_retry_interval = start_retry_interval
+        self._scores: 'OrderedDict[str, Tuple[float, float]]' = OrderedDict()
+        self._unavailable_until = 0.0
+        self._lock = threading.Lock()
+        self.counts = {'http': 0, 'escalated': 0, 'browser_direct': 0, 'browser_failed': 0,
+                       'browser_skipped': 0, 'browser_start_failed': 0}
+
+    def _decayed(self, score: float, updated_at: float, now: float) -> float:
+        return score * 0.5 ** ((now - updated_at) / self.half_life)
+
+    def _score(self, domain: str, now: float) -> float:
+        """감쇠한 현재 점수 (임계값 안쪽으로 줄어든 기록은 삭제). _lock을 잡은 상태에서 호출"""
+        entry = self._scores.get(domain)
+        if entry is None:
+            return 0.0
+        score = self._decayed(*entry, now)
+        if abs(score) < BROWSER_SCORE_THRESHOLD:
+            del self._scores[domain]
+            return 0.0
+        self._scores.move_to_end(domain)
+        return score
+
+    def _set_score(self, domain: str, score: float, now: float) -> None:
+        self._scores.pop(domain, None)
+        self._scores[domain] = (max(-BROWSER_SCORE_CAP, min(score, BROWSER_SCORE_CAP)), now)
+        if len(self._scores) > self.max_domains:
+            self._scores.popitem(last=False)
+
+    def prefer_browser(self, url: str) -> bool:
+        with self._lock:
+            return self._score(domain_of(url), time.monotonic()) >= BROWSER_SCORE_THRESHOLD
+
+    def browser_allowed(self, url: str) -> bool:
+        """브라우저 단계를 시도할지 (브라우저 시작 실패 후 대기 중이거나 HTTP 전용 도메인이면 False)"""
+        now = time.monotonic()
+        with self._lock:
+            allowed = now >= self._unavailable_until and self._score(domain_of(url), now) > -BROWSER_SCORE_THRESHOLD
+            if not allowed:
+                self.counts['browser_skipped'] += 1
+            return allowed
+
+    def record_escalation(self, url: str) -> None:
+        """HTTP 결과가 부족해 브라우저로 성공한 경우"""
+        domain = domain_of(url)
+        now = time.monotonic()
+        with self._lock:
+            self._set_score(domain, self._score(domain, now) + 1.0, now)
+            self.counts['escalated'] += 1
+
+    def record_http(self, url: str) -> None:
+        """HTTP만으로 충분했던 경우 (브라우저 우선 기록만 삭제하고 HTTP 전용 기록은 유지)"""
+        domain = domain_of(url)
+        with self._lock:
+            entry = self._scores.get(domain)
+            if entry is not None and entry[0] > 0:
+                del self._scores[domain]
+            self.counts['http'] += 1
+
+    def record_browser_direct(self) -> None:
+        with self._lock:
+            self.counts['browser_direct'] += 1
+
+    def record_browser_failure(self, url: str) -> None:
+        """브라우저로도 본문을 얻지 못한 경우 (점수를 낮춰 반복되면 HTTP 전용으로 기록)"""
+        domain = domain_of(url)
+        now = time.monotonic()
+        with self._lock:
+            self._set_score(domain, self._score(domain, now) - 1.0, now)
+            self.counts['browser_failed'] += 1
+
+    def record_browser_unavailable(self) -> None:
+        """브라우저를 띄우지 못한 경우 (start_retry_interval 동안 모든 도메인에서 건너뜀)"""
+        with self._lock:
+            self._unavailable_until = time.monotonic() + self.start_retry_interval
+            self.counts['browser_start_failed'] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            browser = sum(1 for score, _ in self._scores.values() if score > 0)
+            return dict(self.counts, browser_domains=browser, http_only_domains=len(self._scores) - browser)
@@ -0,0 +1,239 @@
+"""
+HTML 파서 백엔드
+
+WebExtractor의 휴리스틱은 아래 백엔드가 제공하는 작은 노드 API
+(iter_elements / iter_tags / text / break_text / get / compile_selector / select / remove)와
+이를 이용한 DomIndex만 사용하므로,
+트리 구현을 바꿔도 추출 로직은 그대로 유지됩니다.
+
+- html.parser: BeautifulSoup + 표준 라이브러리 파서 (기존 동작)
+- lxml: lxml.html 네이티브 트리 (C 파서, 대용량 페이지에서 훨씬 빠름)
+
+두 백엔드는 정상적인 HTML에서 같은 결과를 냅니다. 차이가 나는 경우는 다음과 같습니다.
+
+- 닫히지 않은 <p> 등 잘못된 마크업은 html.parser가 중첩 요소로 남기는 반면 lxml은
+  HTML 규칙대로 자동으로 닫으므로 문단 분리가 달라질 수 있습니다.
+- libxml2는 중첩 깊이 제한(기본 256, huge_tree에서 2048)보다 깊은 요소를 트리에 넣지
+  않습니다. lxml 백엔드는 huge_tree로 파싱하며, 그보다 깊은 문서에서 본문을 찾지 못하면
+  WebExtractor가 html.parser로 다시 추출합니다.
+"""
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import lxml.html
+import soupsieve
+
+# BeautifulSoup.get_text()가 제외하는 문자열 컨테이너 태그
+NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# break_text에서 앞뒤를 빈 줄로 구분하는 블록 태그
+BLOCK_TAGS = frozenset([
+    'p', 'div', 'section', 'article', 'blockquote', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'table', 'tr', 'figure', 'pre'
+])
+
+
+class SoupBackend:
+    """BeautifulSoup 트리 백엔드"""
+
+    def __init__(self, features: str = 'html.parser'):
+        self.name = features
+        self.features = features
+
+    def parse(self, html: Union[str, bytes], encoding: Optional[str] = None) -> BeautifulSoup:
+        if isinstance(html, bytes):
+            # 인코딩 추측(UnicodeDammit)을 거치지 않도록 직접 디코딩
+            html = html.decode(encoding or 'utf-8', 'replace')
+        return BeautifulSoup(html, self.features)
+
+    def iter_elements(self, doc: Any) -> Iterator[Tuple[Any, str, Optional[str]]]:
+        """문서 순서대로 (요소, 태그 이름, 공백으로 이어 붙인 class 또는 None)"""
+        for element in doc.descendants:
+            if isinstance(element, Tag):
+                classes = element.get('class')
+                if isinstance(classes, list):
+                    classes = ' '.join(classes)
+                yield element, element.name, classes or None
+
+    def iter_tags(self, node: Any, names: Iterable[str]) -> Iterator[Any]:
+        return iter(node.find_all(list(names)))
+
+    def text(self, node: Any) -> str:
+        return node.get_text()
+
+    def break_text(self, node: Any) -> str:
+        """<br>은 줄 바꿈, 블록 요소 경계는 빈 줄로 바꾼 텍스트 (text()와 같은 요소 제외)"""
+        parts = []
+        stack = [(iter(node.contents), None)]
+        while stack:
+            children, owner = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if owner is not None and owner.name in BLOCK_TAGS:
+                    parts.append('\n\n')
+            elif isinstance(child, Tag):
+                if child.name == 'br':
+                    parts.append('\n')
+                elif child.name not in NON_TEXT_TAGS:
+                    if child.name in BLOCK_TAGS:
+                        parts.append('\n\n')
+                    stack.append((iter(child.contents), child))
+            elif type(child) is NavigableString:
+                # 주석, CDATA, script/style 문자열 등 하위 클래스는 get_text()처럼 제외
+                parts.append(child)
+        return ''.join(parts)
+
+    def get(self, node: Any, attr: str, default: str = '') -> str:
+        value = node.get(attr, default)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def compile_selector(self, css: str) -> Any:
+        """CSS 선택자 컴파일 (잘못된 선택자는 ValueError)"""
+        try:
+            return soupsieve.compile(css)
+        except soupsieve.SelectorSyntaxError as e:
+            raise ValueError(f"Invalid selector {css!r}: {e}")
+
+    def select(self, selector: Any, node: Any) -> List[Any]:
+        """문서 순서대로 선택자에 맞는 자손 요소"""
+        return selector.select(node)
+
+    def remove(self, node: Any) -> None:
+        node.decompose()
+
+
+class LxmlBackend:
+    """lxml.html 네이티브 트리 백엔드"""
+
+    name = 'lxml'
+
+    def __init__(self):
+        # 입력은 항상 UTF-8 바이트로 넘겨 XML 인코딩 선언이 있는 문서도 처리
+        # (huge_tree: 중첩 깊이 제한을 256에서 2048로, 텍스트 노드 크기 제한 해제)
+        self._parser = lxml.html.HTMLParser(encoding='utf-8', huge_tree=True)
+
+    def parse(self, html: Union[str, bytes], encoding: Optional[str] = None) -> Optional[Any]:
+        if isinstance(html, str):
+            data = html.encode('utf-8', 'surrogatepass')
+        elif (encoding or 'utf-8') == 'utf-8' and _is_utf8(html):
+            # 올바른 UTF-8 바이트는 그대로 파서에 전달
+            data = html
+        else:
+            data = html.decode(encoding or 'utf-8', 'replace').encode('utf-8')
+        try:
+            return lxml.html.document_fromstring(data, parser=self._parser)
+        except etree.ParserError:
+            # 빈 문서
+            return None
+
+    def iter_elements(self, doc: Any) -> Iterator[Tuple[Any, str, Optional[str]]]:
+        if doc is None:
+            return
+        for element in _descendants(doc, etree.Element):
+            classes = element.get('class')
+            if classes is not None:
+                classes = ' '.join(classes.split())
+            yield element, element.tag, classes or None
+
+    def iter_tags(self, node: Any, names: Iterable[str]) -> Iterator[Any]:
+        if node is None:
+            return iter(())
+        return _descendants(node, *names)
+
+    def text(self, node: Any) -> str:
+        """BeautifulSoup.get_text()와 같은 규칙 (주석, script/style 등의 내용 제외)"""
+        parts = [node.text] if node.text else []
+        # (자식 이터레이터, 자식을 모두 본 뒤 tail을 붙일 요소) 스택 - 깊은 DOM에서도 재귀 없이 순회
+        stack = [(iter(node), None)]
+        while stack:
+            children, owner = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if owner is not None and owner.tail:
+                    parts.append(owner.tail)
+            elif isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+                if child.text:
+                    parts.append(child.text)
+                stack.append((iter(child), child))
+            elif child.tail:
+                parts.append(child.tail)
+        return ''.join(parts)
+
+    def break_text(self, node: Any) -> str:
+        """<br>은 줄 바꿈, 블록 요소 경계는 빈 줄로 바꾼 텍스트 (text()와 같은 요소 제외)"""
+        parts = [node.text] if node.text else []
+        stack = [(iter(node), None)]
+        while stack:
+            children, owner = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if owner is not None:
+                    if owner.tag in BLOCK_TAGS:
+                        parts.append('\n\n')
+                    if owner.tail:
+                        parts.append(owner.tail)
+            elif child.tag == 'br':
+                parts.append('\n')
+                if child.tail:
+                    parts.append(child.tail)
+            elif isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+                if child.tag in BLOCK_TAGS:
+                    parts.append('\n\n')
+                if child.text:
+                    parts.append(child.text)
+                stack.append((iter(child), child))
+            elif child.tail:
+                parts.append(child.tail)
+        return ''.join(parts)
+
+    def get(self, node: Any, attr: str, default: str = '') -> str:
+        return node.get(attr, default)
+
+    def compile_selector(self, css: str) -> Any:
+        try:
+            return CSSSelector(css, translator='html')
+        except Exception as e:
+            raise ValueError(f"Invalid selector {css!r}: {e}")
+
+    def select(self, selector: Any, node: Any) -> List[Any]:
+        if node is None:
+            return []
+        return [element for element in selector(node) if element is not node]
+
+    def remove(self, node: Any) -> None:
+        # 뒤따르는 텍스트(tail)는 부모에 남김
+        node.drop_tree()
+
+
+def _is_utf8(data: bytes) -> bool:
+    try:
+        data.decode('utf-8')
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _descendants(node: Any, *tags: Any) -> Iterator[Any]:
+    """BeautifulSoup과 같이 문서 루트는 자신을 포함, 그 외 요소는 자손만 순회"""
+    if node.getparent() is None:
+        return node.iter(*tags)
+    return node.iterdescendants(*tags)
+
+
+PARSER_BACKENDS = {
+    'html.parser': SoupBackend,
+    'lxml': LxmlBackend,
+}
+
+
+def get_parser_backend(name: str):
+    """이름으로 파서 백엔드 생성"""
+    try:
+        return PARSER_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown HTML parser backend: {name} (choose from {', '.join(PARSER_BACKENDS)})")
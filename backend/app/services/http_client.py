@@ -0,0 +1,101 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..core.config import (
+    HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_POOL_TIMEOUT,
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS_PER_HOST, FETCH_MAX_BYTES
+)
+from .page_download import CHUNK_SIZE, aread_capped, check_response_headers
+
+# 프로세스 전역에서 공유하는 비동기 HTTP 클라이언트 (keep-alive, HTTP/2)
+_client: Optional[httpx.AsyncClient] = None
+
+
+class _HostSlot:
+    """호스트별 세마포어와 이를 기다리거나 잡고 있는 요청 수"""
+
+    __slots__ = ('semaphore', 'users')
+
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+        self.users = 0
+
+
+# 사용 중인 호스트만 보관 (마지막 요청이 끝나면 삭제해 호스트 수만큼 커지지 않음)
+_host_slots: Dict[str, _HostSlot] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 비동기 HTTP 클라이언트를 반환합니다. 최초 호출 시 생성됩니다."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=httpx.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT,
+                read=HTTP_READ_TIMEOUT,
+                write=HTTP_READ_TIMEOUT,
+                pool=HTTP_POOL_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트를 닫습니다. 앱 종료 시 호출됩니다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _host_slots.clear()
+
+
+@asynccontextmanager
+async def host_slot(url: str) -> AsyncIterator[None]:
+    """호스트별 동시 요청 수를 HTTP_MAX_CONNECTIONS_PER_HOST로 제한합니다."""
+    host = urlsplit(url).hostname or ''
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = _HostSlot()
+    slot.users += 1
+    try:
+        async with slot.semaphore:
+            yield
+    finally:
+        slot.users -= 1
+        if slot.users == 0 and _host_slots.get(host) is slot:
+            del _host_slots[host]
+
+
+async def fetch_page(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    max_bytes: int = FETCH_MAX_BYTES
+) -> Tuple[httpx.Response, bytes]:
+    """
+    공유 클라이언트로 GET 요청을 보내고 본문을 스트리밍으로 받습니다.
+    
+    성공(2xx) 응답만 본문을 읽으며, Content-Type이 HTML이 아니거나 본문이
+    max_bytes를 넘으면 나머지를 받지 않고 연결을 닫습니다.
+    
+    Returns:
+        (응답, 본문 바이트) - 2xx가 아니면 본문은 b''
+    """
+    async with host_slot(url):
+        async with get_http_client().stream('GET', url, headers=headers) as response:
+            if not response.is_success:
+                return response, b''
+            check_response_headers(response.headers, max_bytes)
+            body = await aread_capped(response.aiter_bytes(CHUNK_SIZE), max_bytes)
+            return response, body
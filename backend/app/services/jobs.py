@@ -0,0 +1,237 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from ..core.config import JOB_MAX_ATTEMPTS, JOB_LEASE_SECONDS, JOB_RETRY_BACKOFF_SECONDS
+from ..core.database import SessionLocal
+from ..models.models import ExtractionJob, User
+from .converter import NewsConverter
+from .extractor import WebExtractor
+from .pipeline import resolve_api_key, conversion_input, build_content
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 claim 시도에서 살펴볼 후보 작업 수
+CLAIM_BATCH = 5
+
+
+def enqueue_job(db: Session, user_id: int, url: str, mode: Optional[str] = None) -> ExtractionJob:
+    """추출 작업을 큐에 등록합니다."""
+    job = ExtractionJob(
+        user_id=user_id,
+        url=url,
+        mode=mode,
+        status="queued",
+        attempts=0,
+        max_attempts=JOB_MAX_ATTEMPTS,
+        run_after=datetime.utcnow()
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _claimable(now: datetime):
+    """대기 중이거나 임대가 만료된 실행 중 작업"""
+    return and_(
+        ExtractionJob.attempts < ExtractionJob.max_attempts,
+        or_(
+            and_(ExtractionJob.status == "queued", ExtractionJob.run_after <= now),
+            and_(ExtractionJob.status == "running", ExtractionJob.lease_expires_at < now)
+        )
+    )
+
+
+def fail_exhausted_jobs(db: Session, now: Optional[datetime] = None) -> int:
+    """재시도 횟수를 모두 쓴 채 임대가 만료된 작업을 실패 처리합니다."""
+    now = now or datetime.utcnow()
+    count = db.query(ExtractionJob).filter(
+        ExtractionJob.status == "running",
+        ExtractionJob.lease_expires_at < now,
+        ExtractionJob.attempts >= ExtractionJob.max_attempts
+    ).update({
+        ExtractionJob.status: "failed",
+        ExtractionJob.error: "작업 처리 중 워커가 중단되었습니다",
+        ExtractionJob.lease_owner: None,
+        ExtractionJob.finished_at: now
+    }, synchronize_session=False)
+    db.commit()
+    return count
+
+
+def claim_job(db: Session, worker_id: str) -> Optional[ExtractionJob]:
+    """
+    처리할 작업 하나를 임대합니다.
+    
+    조건부 UPDATE로 상태를 바꾸므로 여러 워커 프로세스가 동시에 호출해도
+    한 작업은 한 워커만 가져갑니다.
+    """
+    now = datetime.utcnow()
+    fail_exhausted_jobs(db, now)
+    
+    candidates = db.query(ExtractionJob.id).filter(_claimable(now)).order_by(
+        ExtractionJob.run_after, ExtractionJob.id
+    ).limit(CLAIM_BATCH).all()
+    
+    for (job_id,) in candidates:
+        claimed = db.query(ExtractionJob).filter(
+            ExtractionJob.id == job_id,
+            _claimable(now)
+        ).update({
+            ExtractionJob.status: "running",
+            ExtractionJob.lease_owner: worker_id,
+            ExtractionJob.lease_expires_at: now + timedelta(seconds=JOB_LEASE_SECONDS),
+            ExtractionJob.attempts: ExtractionJob.attempts + 1,
+            ExtractionJob.started_at: now
+        }, synchronize_session=False)
+        db.commit()
+        if claimed:
+            return db.get(ExtractionJob, job_id)
+    return None
+
+
+def _owned(job_id: int, worker_id: str):
+    return and_(
+        ExtractionJob.id == job_id,
+        ExtractionJob.status == "running",
+        ExtractionJob.lease_owner == worker_id
+    )
+
+
+def renew_lease(db: Session, job_id: int, worker_id: str) -> bool:
+    """작업 임대를 연장합니다. 임대를 잃었으면 False."""
+    renewed = db.query(ExtractionJob).filter(_owned(job_id, worker_id)).update({
+        ExtractionJob.lease_expires_at: datetime.utcnow() + timedelta(seconds=JOB_LEASE_SECONDS)
+    }, synchronize_session=False)
+    db.commit()
+    return bool(renewed)
+
+
+def fail_job(db: Session, job_id: int, worker_id: str, error: str, retry: bool = True) -> None:
+    """작업 실패 기록. 재시도 가능하면 백오프 후 다시 대기열에 넣습니다."""
+    job = db.get(ExtractionJob, job_id)
+    if job is None:
+        # 처리 중에 작업(또는 사용자)이 삭제된 경우
+        logger.warning(f"작업 {job_id}이(가) 삭제되어 실패를 기록하지 않았습니다: {error}")
+        return
+    now = datetime.utcnow()
+    if retry and job.attempts < job.max_attempts:
+        values = {
+            ExtractionJob.status: "queued",
+            ExtractionJob.run_after: now + timedelta(seconds=JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1))
+        }
+    else:
+        values = {ExtractionJob.status: "failed", ExtractionJob.finished_at: now}
+    values.update({
+        ExtractionJob.error: error,
+        ExtractionJob.lease_owner: None,
+        ExtractionJob.lease_expires_at: None
+    })
+    db.query(ExtractionJob).filter(_owned(job_id, worker_id)).update(values, synchronize_session=False)
+    db.commit()
+
+
+def queue_stats(db: Session, window: timedelta = timedelta(hours=1), user_id: Optional[int] = None) -> Dict[str, Any]:
+    """큐 깊이와 최근 처리 지연 통계 (user_id를 주면 해당 사용자의 작업만 집계)"""
+    now = datetime.utcnow()
+    jobs = db.query(ExtractionJob)
+    if user_id is not None:
+        jobs = jobs.filter(ExtractionJob.user_id == user_id)
+    counts = dict(jobs.with_entities(ExtractionJob.status, func.count(ExtractionJob.id)).group_by(ExtractionJob.status).all())
+    oldest = jobs.with_entities(func.min(ExtractionJob.created_at)).filter(ExtractionJob.status == "queued").scalar()
+    
+    recent = jobs.with_entities(ExtractionJob.created_at, ExtractionJob.started_at, ExtractionJob.finished_at).filter(
+        ExtractionJob.status == "succeeded",
+        ExtractionJob.finished_at >= now - window
+    ).order_by(ExtractionJob.finished_at.desc()).limit(1000).all()
+    waits = [(started - created).total_seconds() for created, started, _ in recent if started and created]
+    runs = [(finished - started).total_seconds() for _, started, finished in recent if started and finished]
+    
+    return {
+        "queued": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "succeeded": counts.get("succeeded", 0),
+        "failed": counts.get("failed", 0),
+        "oldest_queued_age_seconds": (now - oldest).total_seconds() if oldest else None,
+        "avg_wait_seconds": sum(waits) / len(waits) if waits else None,
+        "avg_run_seconds": sum(runs) / len(runs) if runs else None
+    }
+
+
+async def _keep_lease(job_id: int, worker_id: str) -> None:
+    """처리하는 동안 주기적으로 임대를 연장합니다."""
+    while True:
+        await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+        db = SessionLocal()
+        try:
+            if not renew_lease(db, job_id, worker_id):
+                logger.warning(f"작업 {job_id}의 임대를 잃었습니다")
+                return
+        finally:
+            db.close()
+
+
+async def process_job(job_id: int, worker_id: str, extractor: WebExtractor, converter: NewsConverter) -> None:
+    """임대한 작업 하나를 추출 → 변환 → 저장까지 처리합니다."""
+    heartbeat = asyncio.create_task(_keep_lease(job_id, worker_id))
+    db = SessionLocal()
+    try:
+        job = db.get(ExtractionJob, job_id)
+        if job is None:
+            logger.warning(f"작업 {job_id}이(가) 삭제되어 처리하지 않았습니다")
+            return
+        user = db.get(User, job.user_id)
+        if user is None:
+            fail_job(db, job_id, worker_id, "작업을 요청한 사용자가 삭제되었습니다", retry=False)
+            return
+        try:
+            api_key = resolve_api_key(user)
+        except ValueError as e:
+            fail_job(db, job_id, worker_id, str(e), retry=False)
+            return
+        
+        extracted_data = await extractor.extract_data_async(job.url)
+        if not extracted_data['success']:
+            fail_job(db, job_id, worker_id, extracted_data['error'])
+            return
+        
+        try:
+            converted_content = await converter.convert_to_markdown_async(
+                conversion_input(extracted_data), api_key=api_key, mode=job.mode
+            )
+        except ValueError as e:
+            fail_job(db, job_id, worker_id, f"API 키 오류: {str(e)}", retry=False)
+            return
+        
+        # 콘텐츠 저장과 작업 완료를 한 트랜잭션으로 처리
+        db_content = build_content(job.url, extracted_data, converted_content, job.user_id)
+        db.add(db_content)
+        db.flush()
+        completed = db.query(ExtractionJob).filter(_owned(job_id, worker_id)).update({
+            ExtractionJob.status: "succeeded",
+            ExtractionJob.content_id: db_content.id,
+            ExtractionJob.error: None,
+            ExtractionJob.lease_owner: None,
+            ExtractionJob.lease_expires_at: None,
+            ExtractionJob.finished_at: datetime.utcnow()
+        }, synchronize_session=False)
+        if not completed:
+            # 임대가 만료되어 다른 워커가 가져간 경우 결과를 버림
+            db.rollback()
+            logger.warning(f"작업 {job_id}의 임대를 잃어 결과를 저장하지 않았습니다")
+            return
+        db.commit()
+        logger.info(f"작업 {job_id} 완료 (content_id={db_content.id})")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"작업 {job_id} 처리 중 오류: {str(e)}")
+        fail_job(db, job_id, worker_id, str(e))
+    finally:
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+        db.close()
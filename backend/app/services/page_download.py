@@ -0,0 +1,145 @@
+"""
+페이지 본문 다운로드 보조 함수
+
+본문은 스트리밍으로 받아 FETCH_MAX_BYTES를 넘으면 즉시 중단하고, 문자 인코딩은
+전체 본문을 추측하는 대신 BOM → 헤더 → 앞부분의 <meta> 선언 순으로 바이트에서 읽습니다.
+"""
+from typing import AsyncIterable, Iterable, Mapping, Optional
+import codecs
+import re
+
+from charset_normalizer import from_bytes
+
+from ..core.config import FETCH_MAX_BYTES, FETCH_ALLOWED_CONTENT_TYPES
+
+# 스트리밍 읽기 단위
+CHUNK_SIZE = 64 * 1024
+
+# <meta charset> 선언을 찾을 앞부분 크기 (HTML 표준의 prescan 범위)
+META_PRESCAN_BYTES = 1024 * 4
+
+# 선언이 없을 때 인코딩 추정에 사용할 앞부분 크기
+DETECT_SAMPLE_BYTES = 64 * 1024
+
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_:.\-]+)', re.IGNORECASE)
+
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# 브라우저(WHATWG Encoding)와 같이 상위 호환 코덱으로 대체
+CHARSET_ALIASES = {
+    'euc-kr': 'cp949',
+    'euc_kr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'ks_c_5601': 'cp949',
+    'x-windows-949': 'cp949',
+    'iso-8859-1': 'cp1252',
+    'latin1': 'cp1252',
+    'latin-1': 'cp1252',
+    'us-ascii': 'cp1252',
+    'ascii': 'cp1252',
+    'gb2312': 'gb18030',
+    'gbk': 'gb18030',
+    'shift_jis': 'cp932',
+    'x-sjis': 'cp932',
+}
+
+
+class PageTooLarge(ValueError):
+    """본문이 최대 허용 크기를 넘은 경우"""
+
+
+class UnsupportedContentType(ValueError):
+    """HTML이 아닌 응답"""
+
+
+def normalize_charset(name: Optional[str]) -> Optional[str]:
+    """선언된 charset 이름을 파이썬 코덱 이름으로 변환 (알 수 없으면 None)"""
+    if not name:
+        return None
+    name = name.strip().strip('"\'').lower()
+    name = CHARSET_ALIASES.get(name, name)
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def check_response_headers(headers: Mapping[str, str], max_bytes: int = FETCH_MAX_BYTES) -> None:
+    """본문을 읽기 전에 Content-Type과 Content-Length를 검사"""
+    content_type = headers.get('Content-Type', '')
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    if media_type and media_type not in FETCH_ALLOWED_CONTENT_TYPES:
+        raise UnsupportedContentType(f"지원하지 않는 콘텐츠 형식입니다: {media_type}")
+
+    content_length = headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise PageTooLarge(f"페이지 크기({content_length}바이트)가 최대 허용 크기({max_bytes}바이트)를 초과했습니다")
+
+
+def _too_large(max_bytes: int) -> PageTooLarge:
+    return PageTooLarge(f"페이지 크기가 최대 허용 크기({max_bytes}바이트)를 초과했습니다")
+
+
+def read_capped(chunks: Iterable[bytes], max_bytes: int = FETCH_MAX_BYTES) -> bytes:
+    """청크를 모으다가 max_bytes를 넘으면 PageTooLarge 발생"""
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        if len(body) > max_bytes:
+            raise _too_large(max_bytes)
+    return bytes(body)
+
+
+async def aread_capped(chunks: AsyncIterable[bytes], max_bytes: int = FETCH_MAX_BYTES) -> bytes:
+    """read_capped의 비동기 버전"""
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        if len(body) > max_bytes:
+            raise _too_large(max_bytes)
+    return bytes(body)
+
+
+def header_charset(headers: Mapping[str, str]) -> Optional[str]:
+    content_type = headers.get('Content-Type', '')
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            return normalize_charset(value)
+    return None
+
+
+def sniff_charset(headers: Mapping[str, str], body: bytes) -> str:
+    """
+    본문 인코딩 결정
+
+    BOM → Content-Type 헤더 → 앞부분 <meta charset> → UTF-8 검사 →
+    앞부분 샘플 추정 순으로 시도하며, 전체 본문을 추측하지 않습니다.
+    """
+    for bom, encoding in BOMS:
+        if body.startswith(bom):
+            return encoding
+
+    encoding = header_charset(headers)
+    if encoding:
+        return encoding
+
+    match = META_CHARSET_PATTERN.search(body[:META_PRESCAN_BYTES])
+    if match:
+        encoding = normalize_charset(match.group(1).decode('ascii', 'ignore'))
+        # 바이트로 전송된 문서에 utf-16 선언이 있으면 HTML 표준대로 utf-8로 취급
+        if encoding and not encoding.startswith('utf-16'):
+            return encoding
+
+    try:
+        body.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    best = from_bytes(body[:DETECT_SAMPLE_BYTES]).best()
+    return normalize_charset(best.encoding if best else None) or 'utf-8'
@@ -0,0 +1,39 @@
+"""
+키셋(커서) 페이지네이션 보조 함수
+
+목록은 (created_at, id) 내림차순으로 정렬하고, 커서에는 이전 페이지 마지막 행의
+(created_at, id)를 담습니다. OFFSET과 달리 페이지가 깊어져도 앞의 행을 건너뛰며
+읽지 않고, 그 사이 새 행이 추가되어도 항목이 중복되거나 빠지지 않습니다.
+"""
+from datetime import datetime
+from typing import Any, Tuple
+import base64
+import binascii
+import json
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """정렬 키를 URL에 안전한 불투명 문자열로 인코딩"""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """encode_cursor의 역변환 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def before_cursor(created_at_column: Any, id_column: Any, cursor: str) -> Any:
+    """(created_at, id) 내림차순에서 커서 다음 행들을 고르는 조건"""
+    created_at, row_id = decode_cursor(cursor)
+    return or_(
+        created_at_column < created_at,
+        and_(created_at_column == created_at, id_column < row_id)
+    )
@@ -0,0 +1,75 @@
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+import re
+
+from ..core.security import decrypt_api_key
+from ..models.models import User, Content
+
+
+def resolve_api_key(user: User) -> str:
+    """사용자의 Claude API 키를 복호화해 반환합니다. 사용할 수 없으면 ValueError."""
+    # 사용자의 API 키 확인
+    if not user.anthropic_api_key or not user.api_key_active:
+        raise ValueError("Claude API 키가 설정되지 않았거나 비활성화되어 있습니다. 설정 페이지에서 API 키를 등록해주세요.")
+    
+    # API 키 복호화
+    try:
+        return decrypt_api_key(user.anthropic_api_key)
+    except Exception:
+        raise ValueError("API 키 복호화에 실패했습니다. 설정 페이지에서 API 키를 다시 등록해주세요.")
+
+
+def conversion_input(extracted_data: Dict[str, Any]) -> Dict[str, str]:
+    """WebExtractor 결과로 NewsConverter 입력 생성"""
+    return {
+        'title': extracted_data['title'],
+        'description': extracted_data.get('metadata', {}).get('description', ''),
+        'content': extracted_data['content']['text']
+    }
+
+
+# 해시태그 (마크다운 제목 '# '은 제외)
+HASHTAG_PATTERN = re.compile(r'(?<!\S)#([^\s#]+)')
+
+
+def extract_hashtags(converted_content: Optional[str]) -> Optional[str]:
+    """
+    변환 결과 끝의 해시태그 블록을 공백으로 구분한 문자열로 반환 (없으면 None)
+    
+    NewsConverter는 마크다운 뒤에 빈 줄을 두고 해시태그를 붙이므로 마지막 블록만 봅니다.
+    """
+    last_block = (converted_content or '').rstrip().rsplit('\n\n', 1)[-1]
+    tags = list(dict.fromkeys(HASHTAG_PATTERN.findall(last_block)))
+    return ' '.join(f'#{tag}' for tag in tags) or None
+
+
+def content_metadata(extracted_data: Dict[str, Any], converted_content: Optional[str]) -> Dict[str, Any]:
+    """Content의 title/description/word_count/hashtags 컬럼 값"""
+    text = (extracted_data.get('content') or {}).get('text') or ''
+    return {
+        'title': extracted_data.get('title') or None,
+        'description': (extracted_data.get('metadata') or {}).get('description') or None,
+        'word_count': len(text.split()),
+        'hashtags': extract_hashtags(converted_content)
+    }
+
+
+def build_content(url: str, extracted_data: Dict[str, Any], converted_content: str, user_id: int) -> Content:
+    """추출/변환 결과로 Content 행 생성 (세션에 추가하지 않음)"""
+    content = Content(
+        url=url,
+        converted_content=converted_content,
+        user_id=user_id,
+        **content_metadata(extracted_data, converted_content)
+    )
+    content.set_extracted_data(extracted_data)
+    return content
+
+
+def save_content(db: Session, url: str, extracted_data: Dict[str, Any], converted_content: str, user_id: int) -> Content:
+    """추출/변환 결과 저장"""
+    db_content = build_content(url, extracted_data, converted_content, user_id)
+    db.add(db_content)
+    db.commit()
+    db.refresh(db_content)
+    return db_content
@@ -0,0 +1,216 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional
+import logging
+import textwrap
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트 캐싱이 적용되는 최소 프리픽스 길이 (Opus/Sonnet 기준)
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (ASCII 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return max(1, int(ascii_chars / 4 + (len(text) - ascii_chars)))
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    버전이 지정된 프롬프트 템플릿
+    
+    system은 요청마다 바뀌지 않는 지시문/예시로, 공급자 측 프롬프트 캐시의
+    고정 프리픽스가 됩니다. user는 기사 필드만 채우는 짧은 str.format 템플릿입니다.
+    """
+    name: str
+    version: str
+    system: str
+    user: str
+    max_tokens: int
+    cache_system: bool = True
+    static_tokens: int = field(default=0, compare=False)
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}-{self.version}"
+
+    def system_blocks(self) -> List[Dict[str, Any]]:
+        block: Dict[str, Any] = {"type": "text", "text": self.system}
+        if self.cache_system:
+            block["cache_control"] = {"type": "ephemeral"}
+        return [block]
+
+    def render(self, **fields: str) -> str:
+        return self.user.format(**fields)
+
+    def request(self, model: str, **fields: str) -> Dict[str, Any]:
+        """messages.create / messages.stream 인자 생성"""
+        return {
+            "model": model,
+            "max_tokens": self.max_tokens,
+            "temperature": 0,
+            "system": self.system_blocks(),
+            "messages": [{"role": "user", "content": self.render(**fields)}],
+        }
+
+
+_registry: Dict[str, Dict[str, PromptTemplate]] = {}
+_active: Dict[str, str] = {}
+
+
+def register(template: PromptTemplate, active: bool = True) -> PromptTemplate:
+    """템플릿을 등록하고 고정 부분의 토큰 수를 한 번 계산합니다."""
+    template = replace(template, static_tokens=estimate_tokens(template.system))
+    if template.cache_system and template.static_tokens < PROMPT_CACHE_MIN_TOKENS:
+        logger.info(
+            f"프롬프트 {template.key}의 고정 부분이 약 {template.static_tokens}토큰으로 "
+            f"캐시 최소 길이({PROMPT_CACHE_MIN_TOKENS})보다 짧아 캐시되지 않을 수 있습니다"
+        )
+    _registry.setdefault(template.name, {})[template.version] = template
+    if active:
+        _active[template.name] = template.version
+    return template
+
+
+def get_prompt(name: str, version: Optional[str] = None) -> PromptTemplate:
+    """이름과 버전으로 템플릿 조회 (버전 생략 시 활성 버전)"""
+    versions = _registry.get(name)
+    if not versions:
+        raise KeyError(f"Unknown prompt: {name}")
+    version = version or _active[name]
+    if version not in versions:
+        raise KeyError(f"Unknown prompt version: {name}-{version}")
+    return versions[version]
+
+
+def _dedent(text: str) -> str:
+    return textwrap.dedent(text).strip()
+
+
+MARKDOWN_EXAMPLE = """💰 크라켄, 암호화폐 시장 점유율 확대 위해 혁신적인 P2P 결제앱 출시
+
+▶ 표결 현황:
+• "vote-a-rama" 새벽까지 지속, 종료 시점 불투명
+• 일출 전 최종 표결 가능성 있다고 언론 보도
+• 화요일부터 계속된 수정안 표결 과정
+
+▶ 통과 조건:
+• 상원 100명 중 통상 60명 찬성 필요하지만 "reconciliation" 절차로 과반수만 필요
+• 공화당 근소한 상원 장악, 민주당 강력 반대
+
+▶ 법안 내용과 비용:
+1. 2017년 트럼프 세금감면 연장
+2. 신규 세금감면 도입
+3. 국방·국경보안 지출 증가
+
+▶ 내부 갈등:
+• 일론 머스크 "미친 법안"이라 강력 비판, 신정당 창당 위협
+• 테슬라 $TSLA 보조금 철회 위협으로 응수"""
+
+MARKDOWN_INSTRUCTIONS = _dedent("""
+    당신은 뉴스 기사를 한국어 스타일의 마크다운 문서로 변환하는 전문가입니다.
+    사용자가 보내는 입력 데이터(제목, 설명, 본문)를 아래의 형식과 스타일을 정확히 따라 변환해주세요.
+
+    필수 형식:
+    1. 제목 형식: 이모지 제목내용
+       예시: "💰 크라켄, 암호화폐 시장 점유율 확대 위해 혁신적인 P2P 결제앱 출시"
+       - 제목 시작에 내용을 잘 표현하는 이모지 하나만 사용
+       - 제목은 반드시 첫 줄에 위치
+       - 제목 다음에는 빈 줄 하나 추가
+       - 제목은 내용을 기반으로 독자의 관심을 끌 수 있게 작성
+       - 단순 사실 나열보다는 핵심 가치나 의미를 담아 작성
+
+    2. 섹션 구조:
+       - 각 주요 섹션은 ▶로 시작
+       - 섹션 제목은 명사형으로 끝남 (예: "현황:", "전망:", "영향:")
+       - 섹션 제목 뒤에는 반드시 콜론(:) 사용
+
+    3. 글머리 기호:
+       - 주요 사실/현황은 • 기호 사용
+       - 순차적 내용이나 상세 설명은 1. 2. 3. 번호 사용
+       - 인용구나 발언은 따옴표(" ") 사용
+
+    4. 문체와 톤:
+       - 객관적이고 명확한 문체 사용
+       - 문장은 간결하게, 되도록 1-2줄 이내로 작성
+       - 전문 용어는 가능한 한글로 풀어서 설명
+       - 숫자나 통계는 단위와 함께 명확히 표기
+
+    5. 구조화:
+       - 중요도와 시간 순서를 고려한 섹션 배치
+       - 관련 내용은 같은 섹션에 모아서 정리
+       - 섹션 간 적절한 줄바꿈으로 가독성 확보
+       - 마지막에는 향후 전망이나 결론 포함
+
+    6. 특별 규칙:
+       - 주식 종목명이 나오면 반드시 종목명 뒤에 $심볼 표기
+       예: 테슬라 $TSLA, 애플 $AAPL
+       - 괄호 사용하지 않고 공백으로 구분
+    """) + "\n\n예시 형식:\n" + MARKDOWN_EXAMPLE + "\n\n" + _dedent("""
+    제목은 반드시 첫 줄에 위치하고, 내용을 잘 표현하는 이모지 하나를 시작에 넣어주세요.
+    제목은 단순히 사실을 나열하는 것이 아니라, 내용의 핵심 가치나 의미를 담아 독자의 관심을 끌 수 있게 작성해주세요.
+
+    이모지 선택 가이드:
+    - 금융/투자 관련: 💰 💵 📈 📊
+    - 기술/혁신 관련: 🚀 💡 🔧 🌟
+    - 정책/규제 관련: ⚖️ 📜 🏛️ 🔨
+    - 갈등/경쟁 관련: 🔥 ⚔️ 🎯 🎲
+    - 협력/계약 관련: 🤝 📝 🎊 🌈
+    - 성장/발전 관련: 🌱 🎉 💪 ⭐
+    """)
+
+ARTICLE_INPUT = _dedent("""
+    입력 데이터:
+    제목: {title}
+    설명: {description}
+    본문: {content}
+    """)
+
+KEYWORDS_INSTRUCTIONS = _dedent("""
+    당신은 뉴스 기사에서 핵심 키워드를 추출하는 전문가입니다.
+    사용자가 보내는 기사에서 5-7개의 관련 키워드를 추출하여 해시태그 형식으로 반환해주세요.
+
+    규칙:
+    1. 해시태그는 한글 스타일로 작성 (#키워드)
+    2. 각 해시태그는 공백으로 구분
+    3. 주식 종목이 언급된 경우 반드시 포함
+    4. 가장 중요한 주제어 위주로 선정
+    5. 다른 텍스트나 설명 없이 해시태그만 반환
+
+    예시 형식:
+    #키워드1 #키워드2 #키워드3 #키워드4 #키워드5
+    """)
+
+COMBINED_INSTRUCTIONS = MARKDOWN_INSTRUCTIONS + "\n\n" + _dedent("""
+    추가로 기사에서 5-7개의 핵심 키워드를 해시태그로 추출해주세요.
+    해시태그 규칙:
+    1. 해시태그는 한글 스타일로 작성 (#키워드)
+    2. 각 해시태그는 공백으로 구분
+    3. 주식 종목이 언급된 경우 반드시 포함
+    4. 가장 중요한 주제어 위주로 선정
+
+    응답은 반드시 아래 구조만 사용하고, 태그 밖에는 아무것도 쓰지 마세요:
+    <markdown>
+    (변환된 마크다운 문서)
+    </markdown>
+    <hashtags>
+    #키워드1 #키워드2 #키워드3 #키워드4 #키워드5
+    </hashtags>
+    """)
+
+MARKDOWN_PROMPT = register(PromptTemplate(
+    name="markdown", version="v2",
+    system=MARKDOWN_INSTRUCTIONS, user=ARTICLE_INPUT, max_tokens=2000
+))
+
+KEYWORDS_PROMPT = register(PromptTemplate(
+    name="keywords", version="v2",
+    system=KEYWORDS_INSTRUCTIONS, user="Article: {content}", max_tokens=300,
+    cache_system=False  # 캐시 최소 길이보다 짧음
+))
+
+COMBINED_PROMPT = register(PromptTemplate(
+    name="combined", version="v2",
+    system=COMBINED_INSTRUCTIONS, user=ARTICLE_INPUT, max_tokens=2300
+))
@@ -0,0 +1,108 @@
+"""Background extraction worker.
+
+Claims queued extraction jobs with leases and processes them. Run as
+many processes as needed:
+
+    python -m app.worker [--concurrency 4]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+from .core.config import WORKER_CONCURRENCY, WORKER_POLL_INTERVAL, WORKER_STATS_INTERVAL
+from .core.database import SessionLocal, engine
+from .core.migrations import run_migrations
+from .core.services import init_services, get_extractor, get_converter, shutdown_services
+from .models.models import Base
+from .services.jobs import claim_job, process_job, queue_stats
+
+logger = logging.getLogger("app.worker")
+
+
+async def worker_loop(slot: int, stop: asyncio.Event, poll_interval: float) -> None:
+    """작업을 하나씩 가져와 처리합니다. 대기열이 비면 poll_interval만큼 쉽니다."""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{slot}"
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            job = claim_job(db, worker_id)
+            job_id = job.id if job else None
+        except Exception as e:
+            logger.error(f"작업 가져오기 실패: {str(e)}")
+            job_id = None
+        finally:
+            db.close()
+        
+        if job_id is None:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        
+        logger.info(f"[{worker_id}] 작업 {job_id} 처리 시작")
+        try:
+            await process_job(job_id, worker_id, get_extractor(), get_converter())
+        except Exception as e:
+            # 작업 하나의 예상치 못한 오류로 다른 슬롯까지 멈추지 않도록 기록만 하고 계속
+            logger.exception(f"[{worker_id}] 작업 {job_id} 처리 중 예상치 못한 오류: {str(e)}")
+
+
+async def stats_loop(stop: asyncio.Event, interval: float) -> None:
+    """큐 깊이와 지연 통계를 주기적으로 기록합니다."""
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            stats = queue_stats(db)
+            logger.info(
+                "queue depth=%(queued)s running=%(running)s succeeded=%(succeeded)s failed=%(failed)s "
+                "oldest_queued=%(oldest_queued_age_seconds)ss avg_wait=%(avg_wait_seconds)ss "
+                "avg_run=%(avg_run_seconds)ss", stats
+            )
+        except Exception as e:
+            logger.error(f"통계 조회 실패: {str(e)}")
+        finally:
+            db.close()
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run(concurrency: int, poll_interval: float, stats_interval: float) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    
+    init_services()
+    try:
+        await asyncio.gather(
+            stats_loop(stop, stats_interval),
+            *(worker_loop(slot, stop, poll_interval) for slot in range(concurrency))
+        )
+    finally:
+        await shutdown_services()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NONGBUX extraction worker")
+    parser.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY,
+                        help="동시에 처리할 작업 수")
+    parser.add_argument("--poll-interval", type=float, default=WORKER_POLL_INTERVAL,
+                        help="대기열이 비었을 때 다시 확인할 간격 (초)")
+    parser.add_argument("--stats-interval", type=float, default=WORKER_STATS_INTERVAL,
+                        help="큐 통계 기록 간격 (초)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    asyncio.run(run(args.concurrency, args.poll_interval, args.stats_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Benchmark: database size and read cost of shared article_blobs storage.
+
+Builds ``--articles`` distinct articles from the words of the extraction
+corpus (``benchmarks/corpus``, run through WebExtractor), then saves
+``--saves`` contents spread over ``--users`` users. Article popularity is
+Zipf-distributed, so a few wire stories are saved by many users and most by
+one or two. The same saves are written to two SQLite databases:
+
+    inline  the previous layout, with the full extracted_data (body text
+            plus paragraphs) in every contents.original_content
+    blobs   the current layout, via build_content, where each distinct body
+            is stored once, zstd-compressed, in article_blobs
+
+It reports file size and bytes per table, then times loading random
+contents the way GET /api/content/{id} does (row + shared body, validated
+into the response schema) and counts the bytes read from the database.
+
+Usage (from backend/):
+    python -m benchmarks.bench_article_storage [--articles 2000] [--saves 50000] [--users 500]
+        [--reads 500] [--repeat 3]
+"""
+import argparse
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload, undefer_group
+
+from app.models.models import ArticleBlob, Base, Content, User
+from app.schemas.schemas import Content as ContentSchema
+from app.services.extractor import WebExtractor
+from app.services.page_download import sniff_charset
+from app.services.pipeline import build_content, content_metadata
+from benchmarks.bench_extraction import load_corpus
+
+CHUNK = 1000
+
+
+def corpus_vocabulary() -> Tuple[Dict[str, Any], List[str]]:
+    """A real extraction result to use as a template, and the distinct words of the corpus bodies."""
+    extractor = WebExtractor(save_to_file=False, adaptive=False)
+    template = None
+    words: Dict[str, None] = {}
+    for page in load_corpus([]):
+        data = extractor._parse_html(page["body"], page["url"], sniff_charset({}, page["body"]))
+        if data["success"]:
+            template = template or data
+            words.update(dict.fromkeys(data["content"]["text"].split()))
+    return template, list(words)
+
+
+def make_articles(count: int) -> List[Dict[str, Any]]:
+    # The corpus pages repeat the same sentences, so articles are built from
+    # its words instead; whole repeated sentences would overstate compression
+    template, vocabulary = corpus_vocabulary()
+    rng = random.Random(25)
+    articles = []
+    for n in range(count):
+        paragraphs = [" ".join(rng.choices(vocabulary, k=rng.randint(30, 90))) + "."
+                      for _ in range(rng.randint(8, 30))]
+        articles.append({
+            **template,
+            "url": f"https://wire.example.com/{n}",
+            "title": f"{template['title']} ({n})",
+            "content": {"text": "\n\n".join(paragraphs), "paragraphs": paragraphs},
+        })
+    return articles
+
+
+def make_saves(articles: int, saves: int, users: int) -> List[Tuple[int, int]]:
+    """(article index, user id) pairs with Zipf-distributed article popularity."""
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(articles)]
+    picks = rng.choices(range(articles), weights=weights, k=saves)
+    return [(article, rng.randint(1, users)) for article in picks]
+
+
+def converted(article: Dict[str, Any], user_id: int) -> str:
+    # Conversions differ per user (own API key and mode), so they are not shared
+    lead = "\n\n".join(article["content"]["paragraphs"][:4])
+    return f"# {article['title']}\n\n{lead}\n\n#u{user_id} #뉴스"
+
+
+def create_database(path: str, users: int) -> Engine:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"email": f"storage{i}@example.com", "hashed_password": "x", "email_verified": True}
+            for i in range(users)
+        ])
+    return engine
+
+
+def seed_inline(engine: Engine, articles: List[Dict[str, Any]], saves: List[Tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(saves), CHUNK):
+        rows = []
+        for index, user_id in saves[offset:offset + CHUNK]:
+            article = articles[index]
+            markdown = converted(article, user_id)
+            rows.append({"url": article["url"], "user_id": user_id, "original_content": article,
+                         "converted_content": markdown, **content_metadata(article, markdown)})
+        with engine.begin() as conn:
+            conn.execute(Content.__table__.insert(), rows)
+    return time.perf_counter() - start
+
+
+def seed_blobs(engine: Engine, articles: List[Dict[str, Any]], saves: List[Tuple[int, int]]) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(saves), CHUNK):
+        with Session(engine) as db:
+            db.add_all([
+                build_content(articles[index]["url"], articles[index], converted(articles[index], user_id), user_id)
+                for index, user_id in saves[offset:offset + CHUNK]
+            ])
+            db.commit()
+    return time.perf_counter() - start
+
+
+def table_bytes(engine: Engine) -> Dict[str, int]:
+    """Bytes stored per table and index (SQLite dbstat), or an empty dict if unavailable."""
+    try:
+        with engine.connect() as conn:
+            return dict(conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all())
+    except Exception:
+        return {}
+
+
+def read_contents(engine: Engine, ids: List[int], repeat: int) -> Tuple[float, int]:
+    """Median ms to load and serialize one content, and bytes read from the database per content."""
+    samples = []
+    with Session(engine) as db:
+        for _ in range(repeat):
+            for content_id in ids:
+                db.expunge_all()
+                start = time.perf_counter()
+                content = db.query(Content).options(undefer_group("body"), joinedload(Content.blob)).filter(
+                    Content.id == content_id
+                ).one()
+                ContentSchema.model_validate(content).model_dump_json()
+                samples.append(time.perf_counter() - start)
+        read = db.execute(
+            select(func.sum(func.length(Content.original_content) + func.length(Content.converted_content)
+                            + func.coalesce(func.length(ArticleBlob.text_zstd), 0)
+                            + func.coalesce(func.length(ArticleBlob.paragraph_spans), 0)))
+            .select_from(Content).outerjoin(ArticleBlob, Content.blob_id == ArticleBlob.id)
+            .where(Content.id.in_(ids))
+        ).scalar()
+    return statistics.median(samples) * 1000, read // len(ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--saves", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=500, help="Random contents loaded per pass")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    articles = make_articles(args.articles)
+    saves = make_saves(args.articles, args.saves, args.users)
+    distinct = len({index for index, _ in saves})
+    print(f"{args.saves:,} saves of {distinct:,} distinct articles by {args.users:,} users")
+
+    directory = tempfile.mkdtemp()
+    ids = random.Random(1).sample(range(1, args.saves + 1), min(args.reads, args.saves))
+    for label, seed in (("inline", seed_inline), ("blobs", seed_blobs)):
+        path = os.path.join(directory, f"{label}.db")
+        engine = create_database(path, args.users)
+        elapsed = seed(engine, articles, saves)
+        sizes = table_bytes(engine)
+        engine.dispose()
+        engine = create_engine(f"sqlite:///{path}")
+        read_ms, read_bytes = read_contents(engine, ids, args.repeat)
+
+        print(f"\n[{label}]")
+        print(f"  insert        {elapsed:>8.1f} s")
+        print(f"  file size     {os.path.getsize(path) / 2**20:>8.1f} MiB")
+        for name in ("contents", "article_blobs"):
+            if sizes.get(name):
+                print(f"    {name:<14}{sizes[name] / 2**20:>7.1f} MiB")
+        print(f"  read one      {read_ms:>8.2f} ms   {read_bytes / 1024:>6.1f} KiB from the database")
+
+
+if __name__ == "__main__":
+    main()
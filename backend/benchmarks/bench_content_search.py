@@ -0,0 +1,183 @@
+"""Benchmark: GET /api/content/search on a large contents table.
+
+Seeds a database with ``--rows`` contents (1M by default) spread over
+``--users`` users, with one heavy user owning ``--heavy-rows`` of them.
+Titles, bodies and hashtags are drawn from a synthetic Zipf-distributed
+vocabulary, so the most frequent words appear in most rows and the rarest in
+only a handful. Every tenth row has no title and every third no hashtags, as
+NULL columns are common in real data; a NULL rank in any result aborts the
+run. The rows are inserted before the search index exists, as in
+an upgraded database, and ``run_migrations`` then builds it (timed).
+
+It then times ``search_contents`` for the heavy user and for a sample of
+typical users with a word found in nearly every row, a moderately frequent
+word, a rare word, a two-word query and a short prefix. On SQLite the same
+queries are also ranked with FTS5's built-in ``bm25()``, which counts each
+term's document frequency over the whole index on every query, and the
+single-word cases are compared with the ``LIKE '%word%'`` scan a search
+without an index would need.
+
+Usage (from backend/):
+    python -m benchmarks.bench_content_search [--rows 1000000] [--users 2000] [--heavy-rows 50000]
+        [--database-url postgresql://...] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from itertools import accumulate
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.migrations import run_migrations
+from app.models.models import Base, Content, User
+from app.services.content_search import search_contents
+
+CHUNK = 20_000
+VOCABULARY = 20_000
+BODY_WORDS = 60
+PAGE_SIZE = 20
+
+
+def make_vocabulary(size: int) -> List[str]:
+    # Random letter strings, so a prefix matches a few related words rather than
+    # a numbered range, as with real text
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(letters, k=rng.randint(4, 9))))
+    words = sorted(words)
+    rng.shuffle(words)
+    return words
+
+
+WORDS = make_vocabulary(VOCABULARY)
+
+
+def word(rank: int) -> str:
+    return WORDS[rank - 1]
+
+
+def seed(engine: Engine, rows: int, users: int, heavy_rows: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"email": f"search{i}@example.com", "hashed_password": "x", "email_verified": True}
+            for i in range(users)
+        ])
+
+    rng = random.Random(24)
+    ranks = list(range(1, VOCABULARY + 1))
+    cum_weights = list(accumulate(1 / r for r in ranks))
+    start = time.perf_counter()
+    inserted = 0
+    while inserted < rows:
+        batch = []
+        for n in range(inserted, min(inserted + CHUNK, rows)):
+            words = [word(r) for r in rng.choices(ranks, cum_weights=cum_weights, k=BODY_WORDS + 8)]
+            body = " ".join(words[:BODY_WORDS])
+            batch.append({
+                "user_id": 1 if n < heavy_rows else rng.randint(2, users),
+                "url": f"https://news.example.com/{n}",
+                # Like real rows, some have no title and many no hashtag block (NULL columns)
+                "title": " ".join(words[BODY_WORDS:BODY_WORDS + 5]) if n % 10 else None,
+                "converted_content": body,
+                "hashtags": " ".join(f"#{w}" for w in words[BODY_WORDS + 5:]) if n % 3 else None,
+                "word_count": BODY_WORDS,
+            })
+        with engine.begin() as conn:
+            conn.execute(Content.__table__.insert(), batch)
+        inserted += len(batch)
+    print(f"seeded {rows:,} contents for {users:,} users in {time.perf_counter() - start:.1f}s")
+
+
+def like_search(db: Session, user_id: int, q: str) -> List[int]:
+    pattern = f"%{q}%"
+    return [row.id for row in db.execute(text(
+        "SELECT id FROM contents WHERE user_id = :user_id AND "
+        "(title LIKE :p OR converted_content LIKE :p OR hashtags LIKE :p) "
+        "ORDER BY created_at DESC, id DESC LIMIT :limit"
+    ), {"user_id": user_id, "p": pattern, "limit": PAGE_SIZE})]
+
+
+def bm25_search(db: Session, user_id: int, q: str) -> List[int]:
+    match = f"owner:u{user_id} AND {{title body hashtags}} : (" + " AND ".join(f'"{t}"*' for t in q.split()) + ")"
+    return [row.id for row in db.execute(text(
+        "SELECT rowid AS id FROM contents_fts WHERE contents_fts MATCH :match "
+        "ORDER BY bm25(contents_fts, 10.0, 1.0, 5.0, 0.0) LIMIT :limit"
+    ), {"match": match, "limit": PAGE_SIZE})]
+
+
+def indexed_search(db: Session, user_id: int, q: str) -> List[int]:
+    hits = search_contents(db, user_id, q, PAGE_SIZE)
+    if any(hit["rank"] is None for hit in hits):
+        raise SystemExit(f"NULL rank in search results for {q!r}")
+    return [hit["id"] for hit in hits]
+
+
+def time_calls(engine: Engine, fn: Callable[[Session, int, str], List[int]], user_ids: List[int], q: str,
+               repeat: int) -> Tuple[float, int]:
+    """Median milliseconds per call over `repeat` passes, and the hits of the last call."""
+    samples = []
+    hits = 0
+    with Session(engine) as db:
+        fn(db, user_ids[0], q)  # warm-up
+        for _ in range(repeat):
+            for user_id in user_ids:
+                start = time.perf_counter()
+                hits = len(fn(db, user_id, q))
+                samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--heavy-rows", type=int, default=50_000)
+    parser.add_argument("--sample-users", type=int, default=50, help="Typical users timed per pass")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", help="Database to seed (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'search.db')}"
+    engine = create_engine(database_url)
+    seed(engine, args.rows, args.users, args.heavy_rows)
+
+    start = time.perf_counter()
+    applied = run_migrations(engine)
+    print(f"applied migrations in {time.perf_counter() - start:.1f}s: {', '.join(applied) or 'none'}")
+
+    user_ids = random.Random(0).sample(range(2, args.users + 1), min(args.sample_users, args.users - 1))
+    queries = [
+        ("common", word(1)),
+        ("frequent", word(20)),
+        ("rare", word(VOCABULARY // 2)),
+        ("two words", f"{word(2)} {word(50)}"),
+        ("prefix", word(3)[:3]),
+    ]
+    for label, q in queries:
+        print(f"\n[{label}: {q!r}]")
+        variants = [("search", indexed_search)]
+        if engine.dialect.name == "sqlite":
+            variants.append(("bm25", bm25_search))
+        if " " not in q:
+            variants.append(("like", like_search))
+        for name, fn in variants:
+            heavy_ms, heavy_hits = time_calls(engine, fn, [1], q, args.repeat)
+            typical_ms, _ = time_calls(engine, fn, user_ids, q, args.repeat)
+            print(f"  {name:<7} heavy user {heavy_ms:>9.2f} ms   typical user {typical_ms:>8.2f} ms   "
+                  f"(heavy hits={heavy_hits})")
+
+
+if __name__ == "__main__":
+    main()
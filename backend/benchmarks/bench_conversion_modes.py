@@ -0,0 +1,77 @@
+"""Benchmark: split (two-call) vs combined (single-call) NewsConverter modes.
+
+Runs the async conversion path against an in-process stub Anthropic
+server (see benchmarks/stub_anthropic.py). It reports requests,
+uncached input tokens, prompt-cache reads, output tokens and
+wall-clock latency per article for each mode.
+The conversion cache is disabled so every article hits the stub.
+
+Usage (from backend/):
+    python -m benchmarks.bench_conversion_modes [--articles 20] [--body-chars 4000]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from benchmarks.stub_anthropic import StubConfig, add_config_arguments, config_from_args, start_in_thread
+
+PARAGRAPH = ("연방준비제도는 이번 회의에서 기준금리를 동결하면서도 연내 인하 가능성을 열어 두었다. "
+             "시장은 테슬라 $TSLA 와 엔비디아 $NVDA 등 기술주를 중심으로 강세를 보였고, "
+             "국채 금리는 하락세로 돌아섰다. ")
+
+
+def make_articles(count: int, body_chars: int) -> List[Dict[str, str]]:
+    body = (PARAGRAPH * (body_chars // len(PARAGRAPH) + 1))[:body_chars]
+    return [
+        {"title": f"벤치마크 기사 {i}", "description": "금리 동결과 기술주 강세", "content": f"{i}번 기사. {body}"}
+        for i in range(count)
+    ]
+
+
+async def run_mode(converter, articles: List[Dict[str, str]], mode: str) -> List[float]:
+    latencies = []
+    for article in articles:
+        start = time.perf_counter()
+        await converter.convert_to_markdown_async(article, mode=mode)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def main_async(args: argparse.Namespace, config: StubConfig) -> None:
+    server = start_in_thread(config)
+    os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+
+    from app.services.converter import NewsConverter
+
+    converter = NewsConverter(api_key="stub-key", cache=False)
+    articles = make_articles(args.articles, args.body_chars)
+
+    print(f"{'mode':<9} {'req/art':>8} {'in tok/art':>11} {'cached/art':>11} {'out tok/art':>12} "
+          f"{'mean ms':>9} {'p50 ms':>8} {'max ms':>8}")
+    for mode in ("split", "combined"):
+        server.stats.reset()
+        latencies = await run_mode(converter, articles, mode)
+        stats = server.stats.snapshot()
+        n = len(articles)
+        print(f"{mode:<9} {stats['requests'] / n:>8.1f} {stats['input_tokens'] / n:>11.0f} "
+              f"{stats['cache_read_tokens'] / n:>11.0f} {stats['output_tokens'] / n:>12.0f} {statistics.mean(latencies) * 1e3:>9.1f} "
+              f"{statistics.median(latencies) * 1e3:>8.1f} {max(latencies) * 1e3:>8.1f}")
+
+    await converter.aclose()
+    server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=20)
+    parser.add_argument("--body-chars", type=int, default=4000)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(main_async(args, config_from_args(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""Benchmark: WebExtractor extraction stages over the recorded HTML corpus.
+
+Runs every page in ``benchmarks/corpus`` (small news pages, huge pages and
+pathological DOMs, listed in ``corpus/manifest.json``) through the same
+steps as ``WebExtractor._parse_content`` and times each stage:
+
+    parse         parser.parse() on the raw bytes
+    find_article  domain rule lookup/apply, DomIndex build, _find_article
+    metadata      _get_title, _get_metadata, _get_author, _get_publish_date
+    paragraphs    rule exclusions and _get_content
+    fallback      _parse_fallback, when the lxml tree yields no article
+
+It reports per-page median stage times, pages/sec, and allocations
+(tracemalloc peak per stage in a separate pass, plus process peak RSS;
+tracemalloc only sees Python-level allocations, not lxml's C tree). Each
+backend runs in a fresh process. Extracted fields are fingerprinted and
+checked against ``_parse_content`` so the stage split cannot drift from the
+real code path. No network access is needed.
+
+``--compare`` without a path uses the checked-in baseline
+(``benchmarks/results/extraction_baseline.json``) and exits 1 on stage
+slowdowns beyond --threshold or on changed extraction results; ``--save``
+without a path rewrites that baseline.
+
+The baseline records one known difference between the backends, which the
+report lists as "differs from html.parser":
+
+    malformed     html.parser extracts 7982 text characters and lxml 1216.
+                  html.parser does not close an unclosed <p> at the next
+                  <p>, so each paragraph contains all the later ones and its
+                  text repeats them; lxml closes it as browsers do and gets
+                  each sentence once
+
+deep_nesting is deeper than libxml2's nesting limit, so lxml loses the
+article and the extractor re-extracts it with html.parser; the fallback
+column shows that cost.
+
+Usage (from backend/):
+    python -m benchmarks.bench_extraction [--repeat 5] [--backends html.parser,lxml]
+        [--pages naver_news,deep_nesting] [--save [PATH]] [--compare [PATH]]
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.services.dom_index import build_index
+from app.services.extractor import ARTICLE_NOT_FOUND, WebExtractor
+from app.services.page_download import sniff_charset
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "results", "extraction_baseline.json")
+STAGES = ("parse", "find_article", "metadata", "paragraphs", "fallback")
+
+
+def load_corpus(names: List[str]) -> List[Dict[str, Any]]:
+    """Read the manifest and raw page bytes (``.html.gz`` files are decompressed)."""
+    with open(os.path.join(CORPUS_DIR, "manifest.json"), encoding="utf-8") as f:
+        pages = json.load(f)["pages"]
+    if names:
+        pages = [p for p in pages if p["file"].split(".", 1)[0] in names]
+    for page in pages:
+        path = os.path.join(CORPUS_DIR, page["file"])
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            page["body"] = f.read()
+        page["name"] = page["file"].split(".", 1)[0]
+    return pages
+
+
+def fingerprint(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact, comparable summary of an extraction result."""
+    if not data["success"]:
+        return {"success": False, "error": data["error"]}
+    text = data["content"]["text"]
+    return {
+        "success": True,
+        "title": data["title"],
+        "author": data["author"],
+        "publish_date": data["publish_date"],
+        "metadata_keys": sorted(data["metadata"]),
+        "paragraphs": len(data["content"]["paragraphs"]),
+        "text_chars": len(text),
+        "text_sha1": hashlib.sha1(text.encode("utf-8")).hexdigest()[:12],
+    }
+
+
+def run_stages(extractor: Any, body: bytes, encoding: str, url: str,
+               timer: Callable[[str, Callable[[], Any]], Any]) -> Dict[str, Any]:
+    """Mirror of WebExtractor._parse_html with every stage wrapped in timer(stage, fn)."""
+    parser = extractor.parser
+    rules = extractor.rules
+    doc = timer("parse", lambda: parser.parse(body, encoding))
+
+    def find_article() -> Tuple[Any, Dict[str, Any], Any, Any]:
+        rule = rules.lookup(url)
+        found = rules.apply(rule, doc)
+        index = build_index(parser, doc)
+        article = found.get("article")
+        if article is None:
+            article = extractor._find_article(index)
+        return rule, found, index, article
+
+    rule, found, index, article = timer("find_article", find_article)
+    if article is None:
+        for stage in ("metadata", "paragraphs"):
+            timer(stage, lambda: None)
+        fallback = timer("fallback", lambda: extractor._parse_fallback(body, url, encoding))
+        return fallback or extractor._error_response(url, ARTICLE_NOT_FOUND)
+
+    def metadata() -> Tuple[str, Dict[str, str], str, str]:
+        return (found.get("title") or extractor._get_title(index),
+                extractor._get_metadata(index),
+                found.get("author") or extractor._get_author(index),
+                found.get("date") or extractor._get_publish_date(index))
+
+    title, meta, author, publish_date = timer("metadata", metadata)
+
+    def paragraphs() -> Dict[str, Any]:
+        rules.remove_excluded(rule, article)
+        return extractor._get_content(article, rule)
+
+    content = timer("paragraphs", paragraphs)
+    timer("fallback", lambda: None)
+    return {"success": True, "url": url, "title": title, "metadata": meta,
+            "content": content, "author": author, "publish_date": publish_date}
+
+
+def run_backend(backend: str, pages: List[Dict[str, Any]], repeat: int, queue: Any) -> None:
+    """Child process: time every stage `repeat` times, then one tracemalloc pass."""
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    extractor = WebExtractor(save_to_file=False, parser=backend, adaptive=False)
+    encodings = {page["name"]: sniff_charset({}, page["body"]) for page in pages}
+
+    timings: Dict[str, Dict[str, List[float]]] = {
+        page["name"]: {stage: [] for stage in STAGES} for page in pages
+    }
+    results: Dict[str, Dict[str, Any]] = {}
+    mismatches: List[str] = []
+    wall = 0.0
+    for round_ in range(repeat + 1):  # round 0 is a warm-up
+        for page in pages:
+            name = page["name"]
+            samples = timings[name]
+
+            def timer(stage: str, fn: Callable[[], Any]) -> Any:
+                start = time.perf_counter()
+                value = fn()
+                if round_:
+                    samples[stage].append(time.perf_counter() - start)
+                return value
+
+            start = time.perf_counter()
+            data = run_stages(extractor, page["body"], encodings[name], page["url"], timer)
+            if round_:
+                wall += time.perf_counter() - start
+            else:
+                results[name] = fingerprint(data)
+                reference = extractor._parse_html(page["body"], page["url"], encodings[name])
+                if fingerprint(reference) != results[name]:
+                    mismatches.append(name)
+
+    allocations: Dict[str, Dict[str, float]] = {}
+    tracemalloc.start()
+    for page in pages:
+        peaks: Dict[str, float] = {}
+
+        def traced(stage: str, fn: Callable[[], Any]) -> Any:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            value = fn()
+            peaks[stage] = round((tracemalloc.get_traced_memory()[1] - before) / 1024, 1)
+            return value
+
+        run_stages(extractor, page["body"], encodings[page["name"]], page["url"], traced)
+        allocations[page["name"]] = peaks
+    tracemalloc.stop()
+
+    extractor.close()
+    queue.put({
+        "pages": {
+            page["name"]: {
+                "category": page["category"],
+                "bytes": len(page["body"]),
+                "stages_ms": {stage: round(statistics.median(s) * 1000, 3) for stage, s in timings[page["name"]].items()},
+                "alloc_peak_kb": allocations[page["name"]],
+                "result": results[page["name"]],
+            }
+            for page in pages
+        },
+        "pages_per_sec": round(len(pages) * repeat / wall, 2),
+        "mb_per_sec": round(sum(len(p["body"]) for p in pages) * repeat / wall / 1e6, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "mismatches": mismatches,
+    })
+
+
+def measure(backend: str, pages: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=run_backend, args=(backend, pages, repeat, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def environment() -> Dict[str, str]:
+    import bs4
+    import lxml.etree
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(terse=True),
+        "machine": platform.machine(),
+        "bs4": bs4.__version__,
+        "lxml": ".".join(map(str, lxml.etree.LXML_VERSION)),
+    }
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    for backend, m in results["backends"].items():
+        print(f"\n[{backend}] {m['pages_per_sec']:.2f} pages/s, {m['mb_per_sec']:.2f} MB/s, peak RSS {m['peak_rss_mb']:.1f} MB")
+        header = "".join(f"{stage:>13}" for stage in STAGES)
+        print(f"{'page':<18}{'category':<13}{'KB':>7}{header}{'total ms':>10}{'alloc KB':>10}")
+        for name, p in m["pages"].items():
+            stages = "".join(f"{p['stages_ms'][stage]:>13.3f}" for stage in STAGES)
+            total = sum(p["stages_ms"].values())
+            alloc = max(p["alloc_peak_kb"].values())
+            print(f"{name:<18}{p['category']:<13}{p['bytes'] / 1024:>7.0f}{stages}{total:>10.2f}{alloc:>10.0f}")
+        for name in m["mismatches"]:
+            print(f"  mismatch with _parse_content: {name}")
+
+    reference = results["backends"].get("html.parser")
+    for backend, m in results["backends"].items():
+        if reference is None or m is reference:
+            continue
+        for name, p in m["pages"].items():
+            if p["result"] != reference["pages"][name]["result"]:
+                print(f"  {backend} differs from html.parser: {name} {p['result']}")
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print stage ratios against a baseline; return the number of problems found."""
+    problems = 0
+    print(f"\nComparison with baseline ({baseline['environment'].get('python')}, {baseline['environment'].get('platform')})")
+    for backend, m in results["backends"].items():
+        base = baseline["backends"].get(backend)
+        if base is None:
+            print(f"[{backend}] not in baseline")
+            continue
+        if set(m["pages"]) == set(base["pages"]):
+            print(f"[{backend}] pages/s {base['pages_per_sec']:.2f} -> {m['pages_per_sec']:.2f} "
+                  f"(x{m['pages_per_sec'] / base['pages_per_sec']:.2f})")
+        else:
+            print(f"[{backend}] page subset, pages/s not comparable")
+        for name, p in m["pages"].items():
+            b = base["pages"].get(name)
+            if b is None:
+                continue
+            for stage in STAGES:
+                if stage not in b["stages_ms"]:
+                    continue
+                old, new = b["stages_ms"][stage], p["stages_ms"][stage]
+                # Stages under 1 ms are dominated by timer noise
+                if old >= 1.0 and new / old > threshold:
+                    problems += 1
+                    print(f"  slower: {name} {stage} {old:.3f} -> {new:.3f} ms (x{new / old:.2f})")
+            if p["result"] != b["result"]:
+                problems += 1
+                changed = sorted(k for k in set(p["result"]) | set(b["result"]) if p["result"].get(k) != b["result"].get(k))
+                print(f"  result changed: {name} ({', '.join(changed)})")
+    return problems
+
+
+def main() -> None:
+    from app.services.html_parsers import PARSER_BACKENDS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backends", default=",".join(PARSER_BACKENDS))
+    parser.add_argument("--pages", default="", help="Comma-separated corpus page names (default: all)")
+    parser.add_argument("--save", metavar="PATH", nargs="?", const=BASELINE_PATH,
+                        help="Write results as JSON (default path: the checked-in baseline)")
+    parser.add_argument("--compare", metavar="PATH", nargs="?", const=BASELINE_PATH,
+                        help="Baseline JSON to compare against (default: the checked-in baseline)")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    pages = load_corpus([n for n in args.pages.split(",") if n])
+    total_mb = sum(len(p["body"]) for p in pages) / 1e6
+    print(f"{len(pages)} corpus page(s), {total_mb:.1f} MB, x{args.repeat}")
+
+    results = {
+        "environment": environment(),
+        "repeat": args.repeat,
+        "backends": {backend: measure(backend, pages, args.repeat) for backend in args.backends.split(",")},
+    }
+    print_report(results)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+    problems = sum(len(m["mismatches"]) for m in results["backends"].values())
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            problems += compare(results, json.load(f), args.threshold)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
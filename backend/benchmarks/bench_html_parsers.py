@@ -0,0 +1,145 @@
+"""Benchmark: WebExtractor HTML parser backends (html.parser vs lxml).
+
+Parses synthetic news pages of several sizes (plus any ``--html`` files)
+through ``WebExtractor._parse_html`` with each backend. Each backend runs
+in a fresh process so that peak RSS reflects only that backend. It reports
+pages/sec, MB/sec and peak RSS, and checks that title, metadata, content,
+author and publish_date match the html.parser results for every page.
+No network access is needed.
+
+Usage (from backend/):
+    python -m benchmarks.bench_html_parsers [--sizes 50,1000,3000] [--repeat 3] [--html page.html ...]
+"""
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+FIELDS = ("title", "metadata", "content", "author", "publish_date")
+
+PARAGRAPH = ("연방준비제도는 이번 회의에서 기준금리를 동결하면서도 연내 인하 가능성을 열어 두었다. "
+             "시장은 테슬라 $TSLA 와 엔비디아 $NVDA 등 기술주를 중심으로 강세를 보였고, "
+             "국채 금리는 하락세로 돌아섰다. &amp; <b>굵은 글씨</b> <a href=\"/x\">링크</a>")
+
+HEAD = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>벤치마크 페이지 {n}</title>
+<meta name="description" content="금리 동결과 기술주 강세">
+<meta property="og:title" content="벤치마크 페이지 {n}">
+<meta name="author" content="홍길동 기자">
+<meta property="article:published_time" content="2024-06-12T09:00:00+09:00">
+<meta name="keywords" content="금리,연준,기술주">
+<style>.nav li {{ display: inline }} .ad {{ height: 250px }}</style>
+<script>window.dataLayer = [{{"page": "article", "n": {n}}}];</script>
+</head><body>
+"""
+
+NAV_ITEM = '<li class="nav-item menu"><a class="nav-link" href="/section/{i}">섹션 {i}</a></li>'
+SIDEBAR_ITEM = ('<div class="widget related-item card"><span class="timestamp">2024.06.12</span>'
+                '<a href="/news/{i}">관련 기사 제목 {i}</a><!-- tracking {i} --></div>')
+
+
+def make_page(n: int, target_kb: int) -> str:
+    """Build a news-like page of roughly target_kb kilobytes."""
+    parts = [HEAD.format(n=n), '<header><ul class="nav">']
+    parts.extend(NAV_ITEM.format(i=i) for i in range(60))
+    parts.append('</ul></header><main><div class="article-wrap"><article class="news-article">')
+    parts.append(f'<h1>벤치마크 기사 제목 {n}</h1><div class="byline author-info">홍길동 기자</div>')
+    parts.append('<div class="article-date">2024.06.12 09:00</div>')
+    body_kb = max(target_kb // 3, 1)
+    i = 0
+    while sum(len(p) for p in parts) < body_kb * 1024:
+        tag = "h2" if i % 12 == 0 else ("blockquote" if i % 17 == 0 else "p")
+        parts.append(f"<{tag}>{i}. {PARAGRAPH}</{tag}>")
+        if i % 9 == 0:
+            parts.append('<div class="ad"><script>render_ad();</script><p>Related: 광고</p></div>')
+        i += 1
+    parts.append('</article></div><aside class="sidebar">')
+    i = 0
+    while sum(len(p) for p in parts) < target_kb * 1024:
+        parts.append(SIDEBAR_ITEM.format(i=i))
+        i += 1
+    parts.append("</aside></main><footer><p>© 2024 Benchmark News</p></footer></body></html>")
+    return "".join(parts)
+
+
+def load_pages(sizes: List[int], html_files: List[str]) -> List[Tuple[str, str]]:
+    pages = [(f"synthetic-{kb}KB", make_page(i, kb)) for i, kb in enumerate(sizes)]
+    for path in html_files:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append((path, f.read()))
+    return pages
+
+
+def run_backend(backend: str, pages: List[Tuple[str, str]], repeat: int, queue: Any) -> None:
+    """Child process: parse every page `repeat` times and report timings, results and peak RSS."""
+    import logging
+
+    from app.services.extractor import WebExtractor
+
+    logging.disable(logging.CRITICAL)
+    extractor = WebExtractor(save_to_file=False, parser=backend)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results: Dict[str, Dict[str, Any]] = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for name, html in pages:
+            data = extractor._parse_html(html, name)
+            results[name] = {field: data.get(field) for field in FIELDS}
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    extractor.close()
+    queue.put({"elapsed": elapsed, "peak_rss_mb": peak_kb / 1024,
+               "parse_rss_mb": (peak_kb - rss_before) / 1024, "results": results})
+
+
+def measure(backend: str, pages: List[Tuple[str, str]], repeat: int) -> Dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=run_backend, args=(backend, pages, repeat, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    from app.services.html_parsers import PARSER_BACKENDS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,1000,3000", help="Synthetic page sizes in KB")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--html", nargs="*", default=[], help="Extra recorded HTML files to include")
+    parser.add_argument("--backends", default=",".join(PARSER_BACKENDS))
+    args = parser.parse_args()
+
+    pages = load_pages([int(s) for s in args.sizes.split(",") if s], args.html)
+    total_mb = sum(len(html.encode("utf-8")) for _, html in pages) / 1e6
+    print(f"{len(pages)} page(s), {total_mb:.1f} MB, x{args.repeat}")
+
+    backends = args.backends.split(",")
+    measurements = {backend: measure(backend, pages, args.repeat) for backend in backends}
+    reference = measurements.get("html.parser", measurements[backends[0]])["results"]
+
+    print(f"{'backend':<12} {'pages/s':>8} {'MB/s':>7} {'peak RSS MB':>12} {'parse RSS MB':>13}  equivalent fields")
+    mismatches = []
+    for backend, m in measurements.items():
+        n = len(pages) * args.repeat
+        same = 0
+        for name, fields in m["results"].items():
+            for field in FIELDS:
+                if fields[field] == reference[name][field]:
+                    same += 1
+                else:
+                    mismatches.append((backend, name, field))
+        print(f"{backend:<12} {n / m['elapsed']:>8.2f} {total_mb * args.repeat / m['elapsed']:>7.2f} "
+              f"{m['peak_rss_mb']:>12.1f} {m['parse_rss_mb']:>13.1f}  {same}/{len(pages) * len(FIELDS)}")
+
+    for backend, name, field in mismatches:
+        print(f"  mismatch: {backend} {name} {field}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Micro-benchmark: per-request service construction vs. process-lifetime services.
+
+Measures the setup work the /extract handler used to do on every call
+(``WebExtractor()`` + ``NewsConverter(api_key=...)``) against the current
+hot path, which only looks up the shared instances and the cached
+Anthropic client for the user's key. No network access is needed.
+
+Usage (from backend/):
+    python -m benchmarks.bench_service_setup [--iterations 200]
+"""
+import argparse
+import logging
+import time
+
+from app.core.services import get_converter, get_extractor, init_services
+from app.services.converter import NewsConverter
+from app.services.extractor import WebExtractor
+
+API_KEYS = [f"sk-ant-bench-{i:04d}" for i in range(8)]
+
+
+def per_request_setup(i: int) -> None:
+    extractor = WebExtractor(use_selenium=False, save_to_file=False)
+    converter = NewsConverter(api_key=API_KEYS[i % len(API_KEYS)])
+    converter.get_client()
+    converter.close()
+    extractor.close()
+
+
+def shared_setup(i: int) -> None:
+    get_extractor()
+    get_converter().get_client(API_KEYS[i % len(API_KEYS)])
+
+
+def measure(fn, iterations: int) -> float:
+    fn(0)  # warm-up
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    init_services()
+
+    before = measure(per_request_setup, args.iterations)
+    after = measure(shared_setup, args.iterations)
+
+    print(f"per-request construction : {before * 1e3:9.3f} ms/request")
+    print(f"process-lifetime services: {after * 1e3:9.3f} ms/request")
+    print(f"setup cost removed       : {(before - after) * 1e3:9.3f} ms/request ({before / max(after, 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
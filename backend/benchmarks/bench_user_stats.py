@@ -0,0 +1,187 @@
+"""Benchmark: /api/users/stats counting queries on a large contents table.
+
+Seeds a database with ``--rows`` contents (1M by default) spread over
+``--users`` users, with one heavy user owning ``--heavy-rows`` of them and
+creation times spread over the past year. The ``contents`` table is created
+as it exists in older databases, without the (user_id, created_at) index.
+The benchmark then times:
+
+    legacy     the four separate COUNT queries the endpoint used to run
+    aggregate  one conditional-aggregate query over all of the user's rows
+    windowed   the query the endpoint runs now: a conditional aggregate over
+               the 30-day (user_id, created_at) range plus a scalar
+               subquery for the total, still a single statement
+
+first without the index and then again after ``run_migrations`` adds it.
+It reports the median time per stats call for the heavy user and for a
+sample of typical users, and prints the query plan of the windowed query.
+The results of all variants are checked to be identical.
+
+Usage (from backend/):
+    python -m benchmarks.bench_user_stats [--rows 1000000] [--users 2000] [--heavy-rows 50000]
+        [--database-url postgresql://...] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from sqlalchemy import case, create_engine, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.migrations import run_migrations
+from app.models.models import Base, Content, User
+
+INDEX_NAME = "ix_contents_user_id_created_at"
+CHUNK = 50_000
+# Fixed reference time so both variants count exactly the same windows
+NOW = datetime.utcnow()
+
+
+def seed(engine: Engine, rows: int, users: int, heavy_rows: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        # Recreate the pre-migration schema: no composite index, no migration record
+        conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+        conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+        conn.execute(User.__table__.insert(), [
+            {"email": f"stats{i}@example.com", "hashed_password": "x", "email_verified": True}
+            for i in range(users)
+        ])
+
+    rng = random.Random(22)
+    year = 365 * 24 * 3600
+    start = time.perf_counter()
+    inserted = 0
+    while inserted < rows:
+        batch = []
+        for n in range(inserted, min(inserted + CHUNK, rows)):
+            # The first heavy_rows rows belong to user 1, the rest are spread uniformly
+            user_id = 1 if n < heavy_rows else rng.randint(2, users)
+            batch.append({"user_id": user_id, "url": f"https://news.example.com/{n}", "title": f"기사 {n}",
+                          "word_count": 500, "created_at": NOW - timedelta(seconds=rng.randrange(year))})
+        with engine.begin() as conn:
+            conn.execute(Content.__table__.insert(), batch)
+        inserted += len(batch)
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("ANALYZE contents"))
+        else:
+            conn.execute(text("ANALYZE"))
+    print(f"seeded {rows:,} contents for {users:,} users in {time.perf_counter() - start:.1f}s")
+
+
+def windows() -> Tuple[datetime, datetime, datetime]:
+    return (NOW - timedelta(days=30), NOW - timedelta(days=7),
+            NOW.replace(hour=0, minute=0, second=0, microsecond=0))
+
+
+def legacy_stats(db: Session, user_id: int) -> Tuple[int, int, int, int]:
+    thirty_days_ago, week_ago, today = windows()
+    own = db.query(Content).filter(Content.user_id == user_id)
+    return (own.count(),
+            own.filter(Content.created_at >= thirty_days_ago).count(),
+            own.filter(Content.created_at >= week_ago).count(),
+            own.filter(Content.created_at >= today).count())
+
+
+def aggregate_stats(db: Session, user_id: int) -> Tuple[int, int, int, int]:
+    thirty_days_ago, week_ago, today = windows()
+    return tuple(db.query(
+        func.count(),
+        func.count(case((Content.created_at >= thirty_days_ago, 1))),
+        func.count(case((Content.created_at >= week_ago, 1))),
+        func.count(case((Content.created_at >= today, 1)))
+    ).filter(Content.user_id == user_id).one())
+
+
+def windowed_stats(db: Session, user_id: int) -> Tuple[int, int, int, int]:
+    thirty_days_ago, week_ago, today = windows()
+    total = select(func.count()).where(Content.user_id == user_id).correlate(None).scalar_subquery()
+    return tuple(db.query(
+        total,
+        func.count(),
+        func.count(case((Content.created_at >= week_ago, 1))),
+        func.count(case((Content.created_at >= today, 1)))
+    ).filter(Content.user_id == user_id, Content.created_at >= thirty_days_ago).one())
+
+
+VARIANTS: List[Tuple[str, Callable[[Session, int], Tuple[int, int, int, int]]]] = [
+    ("legacy", legacy_stats),
+    ("aggregate", aggregate_stats),
+    ("windowed", windowed_stats),
+]
+
+
+def time_calls(engine: Engine, fn: Callable[[Session, int], Tuple[int, ...]], user_ids: List[int],
+               repeat: int) -> Tuple[float, List[Tuple[int, ...]]]:
+    """Median milliseconds per call over `repeat` passes across user_ids."""
+    samples = []
+    results = []
+    with Session(engine) as db:
+        fn(db, user_ids[0])  # warm-up
+        for _ in range(repeat):
+            results = []
+            for user_id in user_ids:
+                start = time.perf_counter()
+                results.append(fn(db, user_id))
+                samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, results
+
+
+def print_plan(engine: Engine, label: str) -> None:
+    thirty_days_ago, week_ago, _ = windows()
+    explain = "EXPLAIN" if engine.dialect.name == "postgresql" else "EXPLAIN QUERY PLAN"
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(f"{explain} SELECT (SELECT count(*) FROM contents WHERE user_id = :user_id), count(*), "
+                 f"count(CASE WHEN created_at >= :week THEN 1 END) "
+                 f"FROM contents WHERE user_id = :user_id AND created_at >= :since"),
+            {"since": thirty_days_ago, "week": week_ago, "user_id": 1},
+        ).all()
+    print(f"  plan ({label}): " + " | ".join(str(row[-1]) for row in rows))
+
+
+def run(engine: Engine, label: str, user_ids: List[int], repeat: int) -> None:
+    print(f"\n[{label}]")
+    print_plan(engine, label)
+    reference = None
+    for name, fn in VARIANTS:
+        heavy_ms, heavy = time_calls(engine, fn, [1], repeat)
+        typical_ms, typical = time_calls(engine, fn, user_ids, repeat)
+        print(f"  {name:<10} heavy user {heavy_ms:>9.2f} ms   typical user {typical_ms:>8.2f} ms   (heavy={heavy[0]})")
+        if reference is None:
+            reference = heavy + typical
+        elif heavy + typical != reference:
+            raise SystemExit(f"{name} results differ from {VARIANTS[0][0]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--heavy-rows", type=int, default=50_000)
+    parser.add_argument("--sample-users", type=int, default=50, help="Typical users timed per pass")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", help="Database to seed (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'stats.db')}"
+    engine = create_engine(database_url)
+    seed(engine, args.rows, args.users, args.heavy_rows)
+
+    user_ids = random.Random(0).sample(range(2, args.users + 1), min(args.sample_users, args.users - 1))
+    run(engine, "no index", user_ids, args.repeat)
+    applied = run_migrations(engine)
+    print(f"\napplied migrations: {', '.join(applied) or 'none'}")
+    run(engine, f"{INDEX_NAME}", user_ids, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""Load test: drive the API end to end with a local origin and a stub Anthropic server.
+
+Answers "how many concurrent users does one API worker sustain?" without
+touching the network or a real Claude key. The harness:
+
+1. seeds a fresh SQLite database with verified users (each with an active,
+   encrypted API key) and a history of saved contents,
+2. starts ``benchmarks.origin_server`` (the HTML corpus as news pages),
+   ``benchmarks.stub_anthropic`` (configurable latency and token counts)
+   and the API under uvicorn, each in its own process,
+3. logs every user in, then runs an open-loop asyncio load generator at
+   each target rate in ``--rps``. Requests are sent on a fixed schedule
+   whether or not earlier ones finished, and latency is measured from the
+   scheduled send time, so queueing inside the API shows up in the
+   percentiles instead of silently lowering the offered load.
+
+The request mix covers ``POST /api/auth/token``, ``POST /api/content/extract``,
+``GET /api/content/`` and ``GET /api/users/stats``. For every stage it
+reports per-endpoint p50/p95/p99 latency, throughput and error rate.
+Extraction and conversion caches are disabled in the API process unless
+``--warm-caches`` is given, so every extract pays for the fetch, the parse
+and the LLM round trip. Pass ``--api-url`` to load an API that is already
+running (its database must contain the seeded users).
+
+Usage (from backend/):
+    python -m benchmarks.load_test [--rps 2,5,10,20] [--duration 30] [--api-workers 1]
+        [--mix token=1,extract=2,list=4,stats=3] [--users 50] [--contents-per-user 100]
+        [--base-latency 0.5 --output-latency 0.01 --markdown-tokens 600] [--json results.json]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import create_engine
+
+from benchmarks.stub_anthropic import add_config_arguments
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASSWORD = "load-test-password"
+API_KEY = "sk-ant-load-test"
+ENDPOINTS = ("token", "extract", "list", "stats")
+DEFAULT_PAGES = "naver_news,yahoo_finance,investing_kr,blog_post"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed_database(path: str, users: int, contents_per_user: int) -> List[str]:
+    """Create the schema and insert verified users with saved contents; return their emails."""
+    from app.core.auth import get_password_hash
+    from app.core.security import encrypt_api_key
+    from app.models.models import Base, Content, User
+
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    # One bcrypt hash and one ciphertext for everyone keeps seeding fast
+    hashed_password = get_password_hash(PASSWORD)
+    encrypted_key = encrypt_api_key(API_KEY)
+    now = datetime.utcnow()
+    emails = [f"load{i:05d}@example.com" for i in range(users)]
+
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"email": email, "hashed_password": hashed_password, "is_active": True, "email_verified": True,
+             "anthropic_api_key": encrypted_key, "api_key_active": True, "api_key_verified_at": now,
+             "login_count": 0, "content_extraction_count": contents_per_user,
+             "created_at": now - timedelta(days=90), "updated_at": now}
+            for email in emails
+        ])
+        user_ids = [row[0] for row in conn.execute(User.__table__.select().with_only_columns(User.id))]
+        rng = random.Random(20)
+        for user_id in user_ids:
+            conn.execute(Content.__table__.insert(), [
+                {"user_id": user_id, "url": f"https://news.example.com/{user_id}/{n}",
+                 "original_content": {"success": True, "title": f"기사 {n}", "content": {"text": "본문 " * 200}},
+                 "converted_content": "# 제목\n\n" + "변환된 본문 " * 300,
+                 "title": f"기사 {n}", "description": "요약", "word_count": 600,
+                 "created_at": now - timedelta(seconds=rng.randrange(60 * 24 * 3600))}
+                for n in range(contents_per_user)
+            ])
+    engine.dispose()
+    return emails
+
+
+def start_process(args: List[str], env: Dict[str, str], log_path: str) -> subprocess.Popen:
+    log = open(log_path, "w")
+    return subprocess.Popen([sys.executable] + args, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+def wait_ready(url: str, process: Optional[subprocess.Popen], timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"process for {url} exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not become ready in {timeout:.0f}s")
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ENDPOINTS:
+            raise SystemExit(f"unknown endpoint in --mix: {name} (choose from {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return float("nan")
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+class LoadGenerator:
+    def __init__(self, api_url: str, origin_url: str, emails: List[str], mix: Dict[str, float],
+                 pages: List[str], unique_urls: bool, max_in_flight: int, seed: int = 0):
+        self.api_url = api_url
+        self.origin_url = origin_url
+        self.emails = emails
+        self.endpoints = list(mix)
+        self.weights = list(mix.values())
+        self.pages = pages
+        self.unique_urls = unique_urls
+        self.max_in_flight = max_in_flight
+        self.rng = random.Random(seed)
+        self.tokens: Dict[str, str] = {}
+        self.counter = 0
+
+    async def login_all(self, client: httpx.AsyncClient) -> None:
+        """Obtain a bearer token for every seeded user (not measured)."""
+        semaphore = asyncio.Semaphore(8)
+
+        async def login(email: str) -> None:
+            async with semaphore:
+                response = await self._token(client, email)
+                response.raise_for_status()
+                self.tokens[email] = response.json()["access_token"]
+
+        await asyncio.gather(*(login(email) for email in self.emails))
+
+    async def _token(self, client: httpx.AsyncClient, email: str) -> httpx.Response:
+        return await client.post(f"{self.api_url}/api/auth/token", data={"username": email, "password": PASSWORD})
+
+    async def send(self, client: httpx.AsyncClient, endpoint: str, email: str) -> httpx.Response:
+        if endpoint == "token":
+            return await self._token(client, email)
+        headers = {"Authorization": f"Bearer {self.tokens[email]}"}
+        if endpoint == "extract":
+            self.counter += 1
+            url = f"{self.origin_url}/pages/{self.pages[self.counter % len(self.pages)]}"
+            if self.unique_urls:
+                url += f"?n={self.counter}"
+            return await client.post(f"{self.api_url}/api/content/extract", json={"url": url}, headers=headers)
+        if endpoint == "list":
+            return await client.get(f"{self.api_url}/api/content/", headers=headers)
+        return await client.get(f"{self.api_url}/api/users/stats", headers=headers)
+
+    async def run_stage(self, client: httpx.AsyncClient, rps: float, duration: float) -> Dict[str, Any]:
+        """Send int(rps * duration) requests on a fixed schedule and collect latencies."""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        samples: List[Tuple[str, float, str]] = []
+
+        async def one(endpoint: str, email: str, scheduled: float) -> None:
+            async with semaphore:
+                try:
+                    response = await self.send(client, endpoint, email)
+                    outcome = "ok" if response.status_code < 400 else str(response.status_code)
+                except httpx.TimeoutException:
+                    outcome = "timeout"
+                except httpx.HTTPError as e:
+                    outcome = type(e).__name__
+            samples.append((endpoint, loop.time() - scheduled, outcome))
+
+        tasks = []
+        start = loop.time()
+        for i in range(int(rps * duration)):
+            scheduled = start + i / rps
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            endpoint = self.rng.choices(self.endpoints, self.weights)[0]
+            tasks.append(asyncio.create_task(one(endpoint, self.emails[i % len(self.emails)], scheduled)))
+        await asyncio.gather(*tasks)
+        return summarize(samples, rps, loop.time() - start)
+
+
+def summarize(samples: List[Tuple[str, float, str]], rps: float, elapsed: float) -> Dict[str, Any]:
+    by_endpoint: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+    for endpoint, latency, outcome in samples:
+        by_endpoint[endpoint].append((latency, outcome))
+        by_endpoint["all"].append((latency, outcome))
+
+    endpoints = {}
+    for endpoint, rows in by_endpoint.items():
+        latencies = sorted(latency for latency, outcome in rows if outcome == "ok")
+        errors: Dict[str, int] = defaultdict(int)
+        for _, outcome in rows:
+            if outcome != "ok":
+                errors[outcome] += 1
+        endpoints[endpoint] = {
+            "requests": len(rows),
+            "throughput": round(len(latencies) / elapsed, 2),
+            "error_rate": round(sum(errors.values()) / len(rows), 4),
+            "errors": dict(errors),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+            "max_ms": round(latencies[-1] * 1000, 1) if latencies else float("nan"),
+        }
+    return {"target_rps": rps, "elapsed": round(elapsed, 2), "endpoints": endpoints}
+
+
+def print_stage(stage: Dict[str, Any]) -> None:
+    print(f"\n== {stage['target_rps']:g} req/s offered, {stage['elapsed']:.1f}s")
+    print(f"{'endpoint':<10}{'requests':>9}{'ok/s':>8}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    order = [e for e in ENDPOINTS if e in stage["endpoints"]] + ["all"]
+    for endpoint in order:
+        m = stage["endpoints"][endpoint]
+        print(f"{endpoint:<10}{m['requests']:>9}{m['throughput']:>8.2f}{m['error_rate']:>8.1%}"
+              f"{m['p50_ms']:>9.1f}{m['p95_ms']:>9.1f}{m['p99_ms']:>9.1f}{m['max_ms']:>9.1f}")
+    for endpoint in order:
+        if stage["endpoints"][endpoint]["errors"] and endpoint != "all":
+            print(f"  {endpoint} errors: {stage['endpoints'][endpoint]['errors']}")
+
+
+async def drive(args: argparse.Namespace, api_url: str, origin_url: str, emails: List[str]) -> List[Dict[str, Any]]:
+    generator = LoadGenerator(api_url, origin_url, emails, parse_mix(args.mix), args.pages.split(","),
+                              unique_urls=not args.warm_caches, max_in_flight=args.max_in_flight)
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await generator.login_all(client)
+        print(f"logged in {len(emails)} users in {time.perf_counter() - started:.1f}s")
+        if args.warmup:
+            await generator.run_stage(client, float(args.rps.split(",")[0]), args.warmup)
+        stages = []
+        for rps in args.rps.split(","):
+            stage = await generator.run_stage(client, float(rps), args.duration)
+            print_stage(stage)
+            stages.append(stage)
+    return stages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rps", default="2,5,10", help="Comma-separated offered request rates, one stage each")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per stage")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds at the first rate")
+    parser.add_argument("--mix", default="token=1,extract=2,list=4,stats=3", help="Endpoint weights")
+    parser.add_argument("--pages", default=DEFAULT_PAGES, help="Corpus pages to extract")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--contents-per-user", type=int, default=100)
+    parser.add_argument("--api-workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--api-url", help="Use a running API instead of starting one")
+    parser.add_argument("--origin-latency", type=float, default=0.02)
+    parser.add_argument("--warm-caches", action="store_true", help="Keep extraction/conversion caches enabled")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--workdir", help="Directory for the database, caches and logs (default: temp dir)")
+    parser.add_argument("--json", metavar="PATH", help="Write stage results as JSON")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="nongbux-load-")
+    os.makedirs(workdir, exist_ok=True)
+    db_path = os.path.join(workdir, "load.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    emails = seed_database(db_path, args.users, args.contents_per_user)
+    print(f"seeded {len(emails)} users x {args.contents_per_user} contents in {db_path}")
+
+    processes: List[subprocess.Popen] = []
+    try:
+        origin_port, stub_port = free_port(), free_port()
+        origin_url, stub_url = f"http://127.0.0.1:{origin_port}", f"http://127.0.0.1:{stub_port}"
+        env = dict(os.environ)
+        processes.append(start_process(
+            ["-m", "benchmarks.origin_server", "--port", str(origin_port), "--latency", str(args.origin_latency)],
+            env, os.path.join(workdir, "origin.log")))
+        stub_args = ["-m", "benchmarks.stub_anthropic", "--port", str(stub_port)]
+        for name in ("base_latency", "input_latency", "output_latency", "markdown_tokens"):
+            stub_args += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+        processes.append(start_process(stub_args, env, os.path.join(workdir, "stub.log")))
+        wait_ready(f"{origin_url}/", processes[0])
+        wait_ready(f"{stub_url}/stats", processes[1])
+
+        api_url = args.api_url
+        if not api_url:
+            api_port = free_port()
+            api_url = f"http://127.0.0.1:{api_port}"
+            api_env = dict(env, DATABASE_URL=f"sqlite:///{db_path}", ANTHROPIC_BASE_URL=stub_url,
+                           CONVERSION_CACHE_PATH=os.path.join(workdir, "conversion_cache.db"),
+                           CONVERSION_CACHE_ENABLED="true" if args.warm_caches else "false",
+                           EXTRACTION_CACHE_TTL=os.environ.get("EXTRACTION_CACHE_TTL", "600") if args.warm_caches else "0",
+                           ADAPTIVE_FETCH_ENABLED="false")
+            processes.append(start_process(
+                ["-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(api_port),
+                 "--workers", str(args.api_workers), "--log-level", "warning"],
+                api_env, os.path.join(workdir, "api.log")))
+            wait_ready(f"{api_url}/health", processes[-1])
+
+        stages = asyncio.run(drive(args, api_url, origin_url, emails))
+        llm = httpx.get(f"{stub_url}/stats").json()
+        print(f"\nstub Anthropic: {llm['requests']} requests, {llm['input_tokens']} input / "
+              f"{llm['output_tokens']} output tokens; origin page fetches: {sum(httpx.get(origin_url + '/stats').json().values())}")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump({"args": vars(args), "stages": stages, "llm": llm}, f, indent=2)
+        print(f"logs and database in {workdir}")
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Local origin server that serves the benchmark HTML corpus as news pages.
+
+Serves every page listed in ``benchmarks/corpus/manifest.json`` at
+``GET /pages/{name}`` (``.html.gz`` files are served decompressed) with a
+``text/html; charset=utf-8`` content type, after an optional fixed latency
+to imitate a remote site. Query strings are ignored, so load generators can
+make URLs unique (``/pages/naver_news?n=17``) to defeat URL-keyed caches.
+``GET /`` lists the page names and ``GET /stats`` returns request counts.
+
+Usage (from backend/):
+    python -m benchmarks.origin_server --port 8800 [--latency 0.05]
+"""
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+
+
+def load_pages(corpus_dir: str = CORPUS_DIR) -> Dict[str, bytes]:
+    """Page name -> raw HTML bytes for every manifest entry."""
+    with open(os.path.join(corpus_dir, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)["pages"]
+    pages = {}
+    for entry in manifest:
+        path = os.path.join(corpus_dir, entry["file"])
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            pages[entry["file"].split(".", 1)[0]] = f.read()
+    return pages
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    server: "OriginServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, data: bytes, content_type: str, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/":
+            self._send(json.dumps(sorted(self.server.pages)).encode("utf-8"), "application/json")
+        elif path == "/stats":
+            with self.server.lock:
+                self._send(json.dumps(self.server.hits).encode("utf-8"), "application/json")
+        elif path.startswith("/pages/") and path[len("/pages/"):] in self.server.pages:
+            name = path[len("/pages/"):]
+            if self.server.latency:
+                time.sleep(self.server.latency)
+            with self.server.lock:
+                self.server.hits[name] = self.server.hits.get(name, 0) + 1
+            self._send(self.server.pages[name], "text/html; charset=utf-8")
+        else:
+            self._send(b"not found", "text/plain", 404)
+
+
+class OriginServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], latency: float = 0.0, corpus_dir: str = CORPUS_DIR):
+        super().__init__(address, OriginHandler)
+        self.pages = load_pages(corpus_dir)
+        self.latency = latency
+        self.hits: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_thread(latency: float = 0.0, host: str = "127.0.0.1", port: int = 0) -> OriginServer:
+    """Start an origin server on a background thread and return it."""
+    server = OriginServer((host, port), latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each page response")
+    args = parser.parse_args()
+
+    server = OriginServer((args.host, args.port), args.latency)
+    print(f"origin server listening on {server.base_url} ({len(server.pages)} pages)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""Stub Anthropic Messages API server for offline benchmarks.
+
+Implements ``POST /v1/messages`` with a latency model of
+``base_latency + input_tokens * input_latency + output_tokens * output_latency``
+and canned Korean markdown / hashtag responses shaped like the real
+NewsConverter outputs. Token counts are estimated from the prompt text.
+System blocks marked with ``cache_control`` are reported as
+cache-creation tokens the first time and cache-read tokens afterwards,
+and cached tokens add no input latency. ``"stream": true`` requests get
+the Messages SSE event sequence with text deltas paced by the output
+latency.
+The Message Batches endpoints (``POST /v1/messages/batches``,
+``GET /v1/messages/batches/{id}`` and ``.../results``) accept the same
+request params; a batch ends ``batch_latency`` seconds after creation
+and ``batch_error_rate`` of its requests come back ``errored``.
+Totals are served at ``GET /stats`` and cleared with ``POST /stats/reset``.
+
+Usage (from backend/):
+    python -m benchmarks.stub_anthropic --port 8900
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8900 ...
+
+Batch mode of the converter CLI against the stub:
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8900 ANTHROPIC_API_KEY=stub \
+        python -m app.services.converter extracted_articles --batch --poll-interval 1
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+from app.services.prompts import estimate_tokens
+
+
+@dataclass
+class StubConfig:
+    base_latency: float = 0.05          # seconds before the first token
+    input_latency: float = 0.00002      # seconds per input token
+    output_latency: float = 0.0005      # seconds per output token
+    markdown_tokens: int = 600          # output tokens for a markdown document
+    batch_latency: float = 1.0          # seconds until a message batch ends
+    batch_error_rate: float = 0.0       # fraction of batch requests that fail
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+    cancelled_streams: int = 0
+    batches: int = 0
+    batch_requests: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, usage: Dict[str, int]) -> None:
+        with self.lock:
+            self.requests += 1
+            self.input_tokens += usage["input_tokens"]
+            self.output_tokens += usage["output_tokens"]
+            self.cache_creation_tokens += usage["cache_creation_input_tokens"]
+            self.cache_read_tokens += usage["cache_read_input_tokens"]
+
+    def record_cancelled(self) -> None:
+        with self.lock:
+            self.cancelled_streams += 1
+
+    def record_batch(self, size: int) -> None:
+        with self.lock:
+            self.batches += 1
+            self.batch_requests += size
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return {"requests": self.requests, "input_tokens": self.input_tokens,
+                    "output_tokens": self.output_tokens,
+                    "cache_creation_tokens": self.cache_creation_tokens,
+                    "cache_read_tokens": self.cache_read_tokens,
+                    "cancelled_streams": self.cancelled_streams,
+                    "batches": self.batches, "batch_requests": self.batch_requests}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.requests = self.input_tokens = self.output_tokens = 0
+            self.cache_creation_tokens = self.cache_read_tokens = self.cancelled_streams = 0
+            self.batches = self.batch_requests = 0
+
+
+def text_of(content: Any) -> str:
+    """Flatten a string or a list of content blocks into plain text."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+    return ""
+
+
+def prompt_text(body: Dict[str, Any]) -> str:
+    parts = [text_of(body.get("system", ""))]
+    parts.extend(text_of(message.get("content", "")) for message in body.get("messages", []))
+    return "\n".join(parts)
+
+
+def fake_markdown(tokens: int) -> str:
+    lines = ["📈 스텁 서버가 생성한 기사 제목입니다", "", "▶ 주요 현황:"]
+    bullet = "• 테스트용 문장으로 실제 모델 출력과 비슷한 길이를 맞춥니다"
+    while estimate_tokens("\n".join(lines)) < tokens:
+        lines.append(bullet)
+    return "\n".join(lines)
+
+
+HASHTAGS = "#스텁 #벤치마크 #뉴스 #변환 #테스트"
+
+
+def build_reply(prompt: str, config: StubConfig) -> str:
+    if "<hashtags>" in prompt:
+        return f"<markdown>\n{fake_markdown(config.markdown_tokens)}\n</markdown>\n<hashtags>\n{HASHTAGS}\n</hashtags>"
+    if "해시태그만 반환" in prompt:
+        return HASHTAGS
+    return fake_markdown(config.markdown_tokens)
+
+
+def message_payload(body: Dict[str, Any], text: str, usage: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        "id": f"msg_stub_{uuid.uuid4().hex[:16]}",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model", "stub"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": usage,
+    }
+
+
+def cached_prefix(body: Dict[str, Any]) -> str:
+    """Text of system blocks up to and including the last cache_control marker."""
+    system = body.get("system")
+    if not isinstance(system, list):
+        return ""
+    marked = [i for i, block in enumerate(system) if isinstance(block, dict) and block.get("cache_control")]
+    if not marked:
+        return ""
+    return text_of(system[:marked[-1] + 1])
+
+
+def complete(body: Dict[str, Any], server: "StubAnthropicServer", sleep: bool = True,
+             timed: bool = True) -> Tuple[str, Dict[str, int]]:
+    """Produce (text, usage) for a Messages request body.
+
+    With ``sleep=False`` only the time to first token is slept; the caller
+    paces the output itself. ``timed=False`` skips the latency model
+    entirely (batch requests).
+    """
+    config = server.config
+    prompt = prompt_text(body)
+    text = build_reply(prompt, config)
+    output_tokens = min(estimate_tokens(text), int(body.get("max_tokens", 4096)))
+
+    prefix = cached_prefix(body)
+    prefix_tokens = estimate_tokens(prefix) if prefix else 0
+    cache_read = cache_creation = 0
+    if prefix:
+        with server.prefix_lock:
+            if prefix in server.cached_prefixes:
+                cache_read = prefix_tokens
+            else:
+                server.cached_prefixes.add(prefix)
+                cache_creation = prefix_tokens
+    input_tokens = max(estimate_tokens(prompt) - prefix_tokens, 0)
+
+    if timed:
+        time.sleep(config.base_latency + (input_tokens + cache_creation) * config.input_latency
+                   + (output_tokens * config.output_latency if sleep else 0))
+    usage = {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_creation_input_tokens": cache_creation,
+        "cache_read_input_tokens": cache_read,
+    }
+    server.stats.record(usage)
+    return text, usage
+
+
+BATCHES_PATH = "/v1/messages/batches"
+
+
+def iso_timestamp(value: float) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class StubBatch:
+    """A message batch that ends ``batch_latency`` seconds after creation."""
+
+    def __init__(self, requests: List[Dict[str, Any]], server: "StubAnthropicServer"):
+        self.id = f"msgbatch_stub_{uuid.uuid4().hex[:16]}"
+        self.created_at = time.time()
+        self.ends_at = self.created_at + server.config.batch_latency
+        self.results: List[Dict[str, Any]] = []
+        for request in requests:
+            params = request.get("params", {})
+            if random.random() < server.config.batch_error_rate:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "overloaded_error", "message": "stub batch error"}}}
+            else:
+                text, usage = complete(params, server, timed=False)
+                result = {"type": "succeeded", "message": message_payload(params, text, usage)}
+            self.results.append({"custom_id": request.get("custom_id"), "result": result})
+
+    @property
+    def ended(self) -> bool:
+        return time.time() >= self.ends_at
+
+    def payload(self, base_url: str) -> Dict[str, Any]:
+        counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+        for line in self.results:
+            counts[line["result"]["type"] if self.ended else "processing"] += 1
+        return {
+            "id": self.id,
+            "type": "message_batch",
+            "processing_status": "ended" if self.ended else "in_progress",
+            "request_counts": counts,
+            "created_at": iso_timestamp(self.created_at),
+            "expires_at": iso_timestamp(self.created_at + timedelta(days=1).total_seconds()),
+            "ended_at": iso_timestamp(self.ends_at) if self.ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{base_url}{BATCHES_PATH}/{self.id}/results" if self.ended else None,
+        }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StubAnthropicServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", "0"))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        self._send_bytes(json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json", status)
+
+    def _send_bytes(self, data: bytes, content_type: str, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_not_found(self) -> None:
+        self._send_json({"type": "error", "error": {"type": "not_found_error", "message": self.path}}, 404)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/stats":
+            self._send_json(self.server.stats.snapshot())
+        elif path.startswith(BATCHES_PATH + "/"):
+            batch_id, _, suffix = path[len(BATCHES_PATH) + 1:].partition("/")
+            batch = self.server.batches.get(batch_id)
+            if batch is None or suffix not in ("", "results"):
+                self._send_not_found()
+            elif suffix == "":
+                self._send_json(batch.payload(self.server.base_url))
+            elif not batch.ended:
+                self._send_json({"type": "error", "error": {"type": "invalid_request_error",
+                                                            "message": "batch is still processing"}}, 400)
+            else:
+                data = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in batch.results)
+                self._send_bytes(data.encode("utf-8"), "application/binary")
+        else:
+            self._send_not_found()
+
+    def do_POST(self) -> None:
+        if self.path == "/stats/reset":
+            self._read_json()
+            self.server.stats.reset()
+            self._send_json({"ok": True})
+        elif self.path == BATCHES_PATH:
+            body = self._read_json()
+            batch = self.server.create_batch(body.get("requests", []))
+            self._send_json(batch.payload(self.server.base_url))
+        elif self.path.startswith("/v1/messages"):
+            body = self._read_json()
+            if body.get("stream"):
+                self._stream_message(body)
+            else:
+                text, usage = complete(body, self.server)
+                self._send_json(message_payload(body, text, usage))
+        else:
+            self._send_not_found()
+
+    def _send_event(self, event: str, data: Dict[str, Any]) -> None:
+        chunk = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+        self.wfile.flush()
+
+    def _stream_message(self, body: Dict[str, Any]) -> None:
+        text, usage = complete(body, self.server, sleep=False)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        message = message_payload(body, "", dict(usage, output_tokens=0))
+        message["content"] = []
+        try:
+            self._send_event("message_start", {"type": "message_start", "message": message})
+            self._send_event("content_block_start", {"type": "content_block_start", "index": 0,
+                                                     "content_block": {"type": "text", "text": ""}})
+            lines = text.split("\n")
+            delay = usage["output_tokens"] * self.server.config.output_latency / max(len(lines), 1)
+            for i, line in enumerate(lines):
+                delta = line if i == len(lines) - 1 else line + "\n"
+                time.sleep(delay)
+                self._send_event("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                         "delta": {"type": "text_delta", "text": delta}})
+            self._send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+            self._send_event("message_delta", {"type": "message_delta",
+                                               "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                               "usage": {"output_tokens": usage["output_tokens"]}})
+            self._send_event("message_stop", {"type": "message_stop"})
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.stats.record_cancelled()
+
+
+class StubAnthropicServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: StubConfig):
+        super().__init__(address, StubHandler)
+        self.config = config
+        self.stats = StubStats()
+        self.cached_prefixes = set()
+        self.prefix_lock = threading.Lock()
+        self.batches: Dict[str, StubBatch] = {}
+
+    def create_batch(self, requests: List[Dict[str, Any]]) -> StubBatch:
+        batch = StubBatch(requests, self)
+        self.batches[batch.id] = batch
+        self.stats.record_batch(len(requests))
+        return batch
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_thread(config: StubConfig = None, host: str = "127.0.0.1", port: int = 0) -> StubAnthropicServer:
+    """Start a stub server on a background thread and return it."""
+    server = StubAnthropicServer((host, port), config or StubConfig())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = StubConfig()
+    parser.add_argument("--base-latency", type=float, default=defaults.base_latency)
+    parser.add_argument("--input-latency", type=float, default=defaults.input_latency)
+    parser.add_argument("--output-latency", type=float, default=defaults.output_latency)
+    parser.add_argument("--markdown-tokens", type=int, default=defaults.markdown_tokens)
+    parser.add_argument("--batch-latency", type=float, default=defaults.batch_latency)
+    parser.add_argument("--batch-error-rate", type=float, default=defaults.batch_error_rate)
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        base_latency=args.base_latency,
+        input_latency=args.input_latency,
+        output_latency=args.output_latency,
+        markdown_tokens=args.markdown_tokens,
+        batch_latency=args.batch_latency,
+        batch_error_rate=args.batch_error_rate,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubAnthropicServer((args.host, args.port), config_from_args(args))
+    print(f"stub Anthropic API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -167,8 +167,15 @@ export const extractContent = async (url: string) => {
   return response.data;
 };
 
-export const getContents = async () => {
-  const response = await api.get('/api/content/');
+// Returns { items, next_cursor }; pass next_cursor back to load the next page
+export const getContents = async (cursor?: string, limit: number = 20) => {
+  const response = await api.get('/api/content/', { params: { cursor, limit } });
+  return response.data;
+};
+
+// Returns { items, next_offset }, best match first; items include rank and a <mark>-highlighted snippet
+export const searchContents = async (q: string, offset: number = 0, limit: number = 20) => {
+  const response = await api.get('/api/content/search', { params: { q, offset, limit } });
   return response.data;
 };
 